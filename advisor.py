@@ -0,0 +1,226 @@
+"""
+BlackJack module with advisor, which calculates expected value of each action from cards, which are left in shoe
+"""
+
+from consts import DEALER_HITS_SOFT_17
+from dealer_odds import DealerOdds, remove_card
+from deck import CARD_CODE_VALUES
+from engine import Strategy, HIT, STAND, SURRENDER, DOUBLE, SPLIT, INSURANCE, REWARD, CAN_HIT, CAN_SURRENDER, \
+    CAN_DOUBLE, CAN_SPLIT, CAN_INSURANCE, CAN_REWARD
+from functools import lru_cache
+from strategy import add_card, stand_ev
+
+# entries in each cache of advisor (oldest entries are dropped, so memory doesn't grow with played shoes)
+CACHE_SIZE = 200_000
+
+
+class Advisor:
+    """
+    Calculator of expected value of actions for composition of shoe (counts of cards with values 2..11).
+    Results are remembered in bounded caches, so choices in the same shoe are answered from them.
+    Cards, which player takes, change odds of next cards of player, but Dealer's final points are counted once
+    for composition at moment of choice. Split hands are counted as independent hands, which can't be split again
+    """
+    def __init__(self, h17: bool = DEALER_HITS_SOFT_17, cache_size: int = CACHE_SIZE) -> None:
+        """
+        Init method of Advisor class
+        :param h17: does Dealer take card on soft 17 or no
+        :param cache_size: entries in each cache
+        """
+        self.h17 = h17
+        self.odds = DealerOdds(h17, memo_limit=cache_size)  # Dealer's final points for composition of shoe
+        self._best = lru_cache(cache_size)(self._best_ev)
+
+    def clear(self) -> None:
+        """
+        Clear caches (for example, after shuffle, when old compositions don't come again)
+        :return: Nothing
+        """
+        self.odds.clear()
+        self._best.cache_clear()
+
+    def dealer(self, counts: tuple[int, ...], upcard: int) -> tuple[float, ...]:
+        """
+        Probabilities of Dealer's final points for upcard and shoe without upcard
+        :param counts: counts of cards left in shoe
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :return: tuple of 6 probabilities (17, 18, 19, 20, 21, bust)
+        """
+        return self.odds.finals(counts, *add_card(0, False, upcard))
+
+    def _best_ev(self, counts: tuple[int, ...], points: int, soft: bool, finals: tuple[float, ...]) -> float:
+        """
+        Expected value of hand, which hits or stands by higher expected value
+        :param counts: counts of cards left in shoe
+        :param points: points of hand
+        :param soft: is one of Aces in hand counted as 11 or no
+        :param finals: probabilities of Dealer's final points
+        :return: expected value in bets
+        """
+        if points > 21:
+            return -1.
+        stand = stand_ev(points, finals)
+        if points == 21:
+            return stand
+        return max(stand, self.hit(counts, points, soft, finals))
+
+    def hit(self, counts: tuple[int, ...], points: int, soft: bool, finals: tuple[float, ...]) -> float:
+        """
+        Expected value of taking card and then playing hand by higher expected value
+        :param counts: counts of cards left in shoe
+        :param points: points of hand
+        :param soft: is one of Aces in hand counted as 11 or no
+        :param finals: probabilities of Dealer's final points
+        :return: expected value in bets
+        """
+        ev = 0.
+        total = sum(counts)
+        for i, count in enumerate(counts):
+            if count:
+                ev += count / total * self._best(remove_card(counts, i + 2), *add_card(points, soft, i + 2), finals)
+        return ev
+
+    @staticmethod
+    def double(counts: tuple[int, ...], points: int, soft: bool, finals: tuple[float, ...]) -> float:
+        """
+        Expected value of doubling bet and taking one card
+        :param counts: counts of cards left in shoe
+        :param points: points of hand
+        :param soft: is one of Aces in hand counted as 11 or no
+        :param finals: probabilities of Dealer's final points
+        :return: expected value in bets
+        """
+        ev = 0.
+        total = sum(counts)
+        for i, count in enumerate(counts):
+            if count:
+                new_points = add_card(points, soft, i + 2)[0]
+                ev += count / total * (-1. if new_points > 21 else stand_ev(new_points, finals))
+        return 2 * ev
+
+    def split(self, counts: tuple[int, ...], value: int, finals: tuple[float, ...]) -> float:
+        """
+        Expected value of splitting pair: each hand gets one card and is played by best first choice
+        :param counts: counts of cards left in shoe
+        :param value: value of pair card (Ace is 11)
+        :param finals: probabilities of Dealer's final points
+        :return: expected value in bets of both hands
+        """
+        ev = 0.
+        total = sum(counts)
+        first = add_card(0, False, value)
+        for i, count in enumerate(counts):
+            if count:
+                points, soft = add_card(*first, i + 2)
+                left = remove_card(counts, i + 2)
+                if points == 21:  # hand of split gets BlackJack too
+                    best = max(stand_ev(21, finals) + 1. - finals[4], 1.)
+                else:
+                    best = max(self._best(left, points, soft, finals), self.double(left, points, soft, finals), -.5)
+                ev += count / total * best
+        return 2 * ev
+
+    def evaluate(self, counts: tuple[int, ...], points: int, soft: bool, pair: bool, upcard: int,
+                 options: int) -> dict[int, float]:
+        """
+        Expected value of each legal action. Insurance is side bet of half of bet, so its value is added to
+        value of action, which is chosen after it
+        :param counts: counts of cards left in shoe (without cards of hand and upcard)
+        :param points: points of hand
+        :param soft: is one of Aces in hand counted as 11 or no
+        :param pair: does hand have two cards with same value
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param options: bit mask of legal actions (CAN_HIT, CAN_STAND, ...)
+        :return: expected value in bets for each action
+        """
+        finals = self.dealer(counts, upcard)
+        evs = {STAND: stand_ev(points, finals)}
+        if options & CAN_REWARD:
+            evs[STAND] += 1. - finals[4]  # BlackJack returns 3 bets instead of 2 (and draws with Dealer's 21)
+            evs[REWARD] = 1.
+        elif points < 21:
+            if options & CAN_HIT:
+                evs[HIT] = self.hit(counts, points, soft, finals)
+            if options & CAN_DOUBLE:
+                evs[DOUBLE] = self.double(counts, points, soft, finals)
+        if options & CAN_SURRENDER:
+            evs[SURRENDER] = -.5
+        if options & CAN_SPLIT and pair:
+            evs[SPLIT] = self.split(counts, 11 if soft else points // 2, finals)
+        if options & CAN_INSURANCE:
+            evs[INSURANCE] = .5 * (3 * counts[8] / sum(counts) - 1)  # half of bet returns 3 times on Dealer's 10
+        return evs
+
+    def best(self, counts: tuple[int, ...], points: int, soft: bool, pair: bool, upcard: int,
+             options: int) -> int:
+        """
+        Action with the highest expected value (insurance, if it's worth taking before other action)
+        :param counts: counts of cards left in shoe (without cards of hand and upcard)
+        :param points: points of hand
+        :param soft: is one of Aces in hand counted as 11 or no
+        :param pair: does hand have two cards with same value
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param options: bit mask of legal actions
+        :return: best action
+        """
+        evs = self.evaluate(counts, points, soft, pair, upcard, options)
+        if evs.pop(INSURANCE, 0.) > 0.:
+            return INSURANCE
+        return max(evs, key=evs.get)
+
+
+class AdvisorStrategy(Strategy):
+    """
+    Strategy, which chooses action with the highest expected value for cards left in deck. It can be used as
+    strategy of Engine seat (engine.strategies.append(AdvisorStrategy(engine))) or of Bot (instead of basic
+    strategy table) and gives hints to Player
+    """
+    def __init__(self, engine, advisor: Advisor | None = None) -> None:
+        """
+        Init method of AdvisorStrategy class
+        :param engine: engine.Engine of table: cards left in its deck are counted, and Dealer's closed card is
+                       counted with them, because player doesn't see it
+        :param advisor: calculator of expected values (new Advisor if not given)
+        """
+        self.engine = engine
+        self.deck = engine.deck
+        self.advisor = advisor or Advisor()
+
+    def counts(self) -> tuple[int, ...]:
+        """
+        Counts of cards, which player doesn't see: cards left in deck and Dealer's closed card
+        :return: tuple of 10 counts of cards with values 2..11
+        """
+        counts = self.deck.value_counts()
+        dealer = self.engine.dealer.cards
+        if len(dealer) > 1:  # closed card is taken from deck, but it isn't seen until Dealer's choice
+            i = CARD_CODE_VALUES[dealer[1]] - 2
+            counts = counts[:i] + (counts[i] + 1,) + counts[i + 1:]
+        return counts
+
+    def evaluate(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> dict[int, float]:
+        """
+        Expected value of each legal action for cards, which player doesn't see
+        :param points: points of hand
+        :param soft: is one of Aces in hand counted as 11 or no
+        :param pair: does hand have two cards with same value
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param options: bit mask of legal actions
+        :return: expected value in bets for each action
+        """
+        return self.advisor.evaluate(self.counts(), points, soft, pair, upcard, options)
+
+    def lookup(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> int:
+        """
+        Find best action for hand (the same signature as BasicStrategy.lookup)
+        :param points: points of hand
+        :param soft: is one of Aces in hand counted as 11 or no
+        :param pair: does hand have two cards with same value
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param options: bit mask of legal actions
+        :return: best action
+        """
+        return self.advisor.best(self.counts(), points, soft, pair, upcard, options & ~CAN_INSURANCE)
+
+    def decide(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> int:
+        return self.advisor.best(self.counts(), points, soft, pair, upcard, options)
@@ -0,0 +1,144 @@
+"""
+BlackJack module with NumPy simulation of many shoes at once (for fixed strategies)
+"""
+
+import numpy as np
+from consts import DEALER_HITS_SOFT_17, DECKS, PENETRATION
+from deck import CARD_CODE_VALUES
+from engine import WIN, BLACKJACK, DRAW, LOSS, BUST
+from simulation import Stats
+
+
+class BatchTable:
+    """
+    Thousands of independent tables, which play rounds in lock-step. Each seat takes cards until it has
+    max_value points (like ThresholdStrategy) and Dealer takes cards until he has 17 points
+    """
+    def __init__(self, shoes: int, max_values: list[int], seed: int | None = None, bet: int = 100) -> None:
+        """
+        Init method of BatchTable class
+        :param shoes: number of independent shoes (tables)
+        :param max_values: points, on which each seat stops taking cards
+        :param seed: seed of random generator
+        :param bet: bet of each seat
+        """
+        self.rng = np.random.default_rng(seed)
+        self.max_values = max_values
+        self.bet = bet
+        self.rows = np.arange(shoes)
+        # each row is one shoe with DECKS sets of card values (Ace is 11)
+        self.shoes = np.tile(np.array(CARD_CODE_VALUES * DECKS, dtype=np.uint8), (shoes, 1))
+        self.shoes = self.rng.permuted(self.shoes, axis=1)
+        self.positions = np.zeros(shoes, dtype=np.intp)
+        # shoe is shuffled before round, when cut card is passed or there can be not enough cards for round
+        cards = self.shoes.shape[1]
+        self.limit = min(int(cards * PENETRATION), cards - 11 * (len(max_values) + 1))
+
+    def _shuffle(self) -> None:
+        """
+        Shuffle shoes, which have passed limit, in place
+        :return: Nothing
+        """
+        used = self.positions >= self.limit
+        if used.any():
+            self.shoes[used] = self.rng.permuted(self.shoes[used], axis=1)
+            self.positions[used] = 0
+
+    def _draw(self, hard: np.ndarray, aces: np.ndarray, rows: np.ndarray) -> None:
+        """
+        Take top card from shoes of rows and add it to hands of rows
+        :param hard: points of hands, where each Ace is counted as 1
+        :param aces: amount of Aces in hands
+        :param rows: indexes of shoes, which take card
+        :return: Nothing
+        """
+        values = self.shoes[rows, self.positions[rows]]
+        self.positions[rows] += 1
+        is_ace = values == 11
+        hard[rows] += np.where(is_ace, 1, values)
+        aces[rows] += is_ace
+
+    @staticmethod
+    def _points(hard: np.ndarray, aces: np.ndarray) -> np.ndarray:
+        """
+        Points of hands, where one Ace is counted as 11 if it doesn't bust hand
+        :param hard: points of hands, where each Ace is counted as 1
+        :param aces: amount of Aces in hands
+        :return: points of hands
+        """
+        return hard + 10 * ((aces > 0) & (hard <= 11))
+
+    def play_round(self, stats: Stats) -> None:
+        """
+        Play one round on each shoe and add results to stats
+        :param stats: counters of outcomes
+        :return: Nothing
+        """
+        self._shuffle()
+        shoes = len(self.rows)
+        seats = len(self.max_values)
+        hard = np.zeros((seats + 1, shoes), dtype=np.int16)  # last row is Dealer
+        aces = np.zeros((seats + 1, shoes), dtype=np.int16)
+        for seat in range(seats + 1):
+            self._draw(hard[seat], aces[seat], self.rows)
+            self._draw(hard[seat], aces[seat], self.rows)
+        blackjack = self._points(hard, aces) == 21
+
+        # seats take cards until they have max_value points (seats with BlackJack stand, like ThresholdStrategy)
+        for seat, max_value in enumerate(self.max_values):
+            while 1:
+                rows = np.flatnonzero((self._points(hard[seat], aces[seat]) < max_value) & ~blackjack[seat])
+                if not len(rows):
+                    break
+                self._draw(hard[seat], aces[seat], rows)
+
+        # Dealer takes cards until he has 17 points (or soft 17, if DEALER_HITS_SOFT_17)
+        while 1:
+            points = self._points(hard[-1], aces[-1])
+            hits = points < 17
+            if DEALER_HITS_SOFT_17:
+                hits |= (points == 17) & (hard[-1] == 7) & (aces[-1] > 0)
+            rows = np.flatnonzero(hits)
+            if not len(rows):
+                break
+            self._draw(hard[-1], aces[-1], rows)
+
+        points = self._points(hard, aces)
+        dealer = points[-1]
+        dealer_busted = dealer > 21
+        players = points[:-1]
+        busts = players > 21
+        # BlackJack is paid 3 bets after Dealer's choice and draws with Dealer's 21 (as in Engine.settle)
+        blackjacks = blackjack[:-1] & (dealer != 21)
+        alive = ~busts & ~blackjack[:-1]
+        wins = alive & ((players > dealer) | dealer_busted)
+        draws = players == dealer
+        draws &= ~busts & ~wins
+        losses = alive & ~wins & ~draws
+
+        counts = (int(wins.sum()), int(blackjacks.sum()), int(draws.sum()), int(losses.sum()), int(busts.sum()))
+        for outcome, count in zip((WIN, BLACKJACK, DRAW, LOSS, BUST), counts):
+            stats.outcomes[outcome] += count
+        stats.rounds += shoes
+        stats.hands += shoes * seats
+        stats.bet += self.bet * shoes * seats
+        stats.payout += self.bet * (2 * counts[0] + 3 * counts[1] + counts[2])
+        # net result of each hand in order of playing them (shoe by shoe)
+        nets = self.bet * (wins + 2 * blackjacks.astype(np.int64) - (losses | busts))
+        stats.net.add_array(nets.T.ravel(), self.bet)
+
+
+def simulate_batch(rounds: int, max_values: list[int], shoes: int = 10_000, seed: int | None = None) -> Stats:
+    """
+    Simulate rounds on many shoes at once
+    :param rounds: number of rounds (it's rounded up to multiple of shoes)
+    :param max_values: points, on which each seat stops taking cards
+    :param shoes: number of shoes, which play in lock-step
+    :param seed: seed of random generator
+    :return: counters of outcomes
+    """
+    table = BatchTable(min(shoes, rounds), max_values, seed)
+    stats = Stats()
+    while stats.rounds < rounds:
+        table.play_round(stats)
+    return stats
@@ -0,0 +1,3 @@
+"""
+BlackJack benchmarks (run them from root of project, for example: python -m benchmarks.startup)
+"""
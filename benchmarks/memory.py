@@ -0,0 +1,49 @@
+"""
+BlackJack memory-growth check of long session: one Game plays many rounds with bots, and traced memory
+must stay flat (exit code is 1 if it grows more than limit). benchmarks.suite runs it after benchmarks
+"""
+
+import game
+import sys
+import tracemalloc
+from contextlib import redirect_stdout
+from os import devnull
+
+# allowed growth of traced memory between warm-up and end of session
+GROWTH_LIMIT = 64 * 1024
+
+
+def measure(rounds: int, bots: int = 4) -> int:
+    """
+    Play rounds at one table and measure growth of memory after warm-up rounds
+    :param rounds: number of rounds after warm-up
+    :param bots: amount of bots at table
+    :return: growth of traced memory in bytes
+    """
+    session = game.Game(basic_strategy=True, amount_of_bots=bots, human=False)
+    with open(devnull, 'w') as output, redirect_stdout(output):
+        for _ in range(1000):  # warm-up: players, deck and caches are created
+            session.play()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(rounds):
+            session.play()
+        growth = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+    return growth
+
+
+def main(rounds: int = 100_000) -> None:
+    """
+    Print growth of memory and exit with code 1 if it's bigger than GROWTH_LIMIT
+    :param rounds: number of rounds
+    :return: Nothing
+    """
+    growth = measure(rounds)
+    print(f'{rounds} rounds: memory growth {growth} bytes (limit {GROWTH_LIMIT})')
+    if growth > GROWTH_LIMIT:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
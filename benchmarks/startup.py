@@ -0,0 +1,48 @@
+"""
+BlackJack benchmark of cold import time of game modules (each import is measured in new interpreter)
+"""
+
+import subprocess
+import sys
+from os import path
+from statistics import median
+from time import perf_counter
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+MODULES = ('deck', 'players', 'game')
+# import is measured inside interpreter, and it prints time in seconds
+CODE = 'from time import perf_counter; t = perf_counter(); import {}; print(perf_counter() - t)'
+
+
+def measure(module: str, runs: int = 10) -> tuple[float, float]:
+    """
+    Measure cold import time of module and whole start time of interpreter, which imports it
+    :param module: name of module
+    :param runs: number of new interpreters
+    :return: median import time and median start time in seconds
+    """
+    import_times = []
+    start_times = []
+    for _ in range(runs):
+        start = perf_counter()
+        result = subprocess.run([sys.executable, '-c', CODE.format(module)], cwd=ROOT, stdin=subprocess.DEVNULL,
+                                capture_output=True, text=True, check=True, timeout=60)
+        start_times.append(perf_counter() - start)
+        import_times.append(float(result.stdout))
+    return median(import_times), median(start_times)
+
+
+def main(runs: int = 10) -> None:
+    """
+    Print cold import time of each module
+    :param runs: number of new interpreters for each module
+    :return: Nothing
+    """
+    print(f'{"module":<10}{"import, ms":>12}{"process, ms":>14}')
+    for module in MODULES:
+        import_time, start_time = measure(module, runs)
+        print(f'{module:<10}{import_time * 1000:>12.1f}{start_time * 1000:>14.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
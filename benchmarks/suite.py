@@ -0,0 +1,390 @@
+"""
+BlackJack benchmark suite of hot paths with recorded baselines.
+
+    python -m benchmarks.suite             - run benchmarks and compare them with baseline.json
+    python -m benchmarks.suite --record    - run benchmarks and save results to baseline.json
+    python -m benchmarks.suite --select game deck - run only benchmarks with "game" or "deck" in name
+
+After benchmarks long session is played with benchmarks.memory, and traced memory must stay flat.
+
+Exit code is 1 if some benchmark is slower than baseline by more than threshold or memory grows more than
+benchmarks.memory.GROWTH_LIMIT. Speed of host changes between runs (other processes, CPU frequency), so each
+run is measured together with calibration loop, and benchmarks are compared by operations in time of this loop
+(ops/sec is shown too).
+"""
+
+import argparse
+import deck
+import engine
+import game
+import hand
+import json
+import render
+import snapshot
+import sys
+import tracemalloc
+from benchmarks import memory
+from contextlib import redirect_stdout
+from os import devnull, path
+from random import Random
+from time import perf_counter
+
+BASELINE_FILE = path.join(path.dirname(path.abspath(__file__)), 'baseline.json')
+# benchmark fails, if it's slower than baseline by more than this part
+THRESHOLD = 0.25
+# each benchmark is repeated few times and the fastest run is taken (it's the least affected by noise)
+REPEATS = 5
+# iterations of calibration loop, which is timed before and after each run of benchmark
+CALIBRATION_OPS = 200_000
+BOTS = 4
+# amount of bots of big table, where cost of round must grow linearly with seats
+BIG_TABLE = 1000
+# seed of decks and tables, so each run of benchmark plays the same rounds
+SEED = 2024
+# name and number of rounds of memory-growth check (it's selected by name like benchmarks)
+MEMORY_CHECK = 'memory.growth (session)'
+MEMORY_ROUNDS = 10_000
+
+
+class Timer:
+    """
+    Timer of measured part of benchmark, which also remembers peak of memory, allocated in this part
+    (if tracemalloc is started)
+    """
+    def __init__(self) -> None:
+        """
+        Init method of Timer class
+        """
+        self.elapsed = 0.
+        self.peak = 0
+        self._start = 0.
+        self._memory = 0
+
+    def start(self) -> None:
+        """
+        Start measured part
+        :return: Nothing
+        """
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._memory = tracemalloc.get_traced_memory()[0]
+        self._start = perf_counter()
+
+    def stop(self) -> None:
+        """
+        Stop measured part
+        :return: Nothing
+        """
+        self.elapsed += perf_counter() - self._start
+        if tracemalloc.is_tracing():
+            self.peak = max(self.peak, tracemalloc.get_traced_memory()[1] - self._memory)
+
+
+def bench_create_deck(ops: int, timer: Timer) -> None:
+    """
+    Deck.create_shuffled_deck
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    shoe = deck.Deck(seed=SEED)
+    timer.start()
+    for _ in range(ops):
+        shoe.create_shuffled_deck()
+    timer.stop()
+
+
+def bench_take_card(ops: int, timer: Timer) -> None:
+    """
+    Deck.take_card_from_deck (deck is shuffled again when it ends)
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    shoe = deck.Deck(seed=SEED)
+    take_card = shoe.take_card_from_deck
+    timer.start()
+    for _ in range(ops):
+        take_card()
+    timer.stop()
+
+
+def bench_csm_take_card(ops: int, timer: Timer) -> None:
+    """
+    ShufflerDeck.take_card_from_deck, where cards are returned to machine after each 12 cards (like after round)
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    shoe = deck.ShufflerDeck(seed=SEED)
+    take_card = shoe.take_card_from_deck
+    timer.start()
+    for i in range(ops):
+        if not i % 12:
+            shoe.shuffle_if_needed()
+        take_card()
+    timer.stop()
+
+
+def bench_engine_round(ops: int, timer: Timer, shoe: deck.CompactDeck | None = None) -> None:
+    """
+    Engine.play_round of table with bots
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :param shoe: deck of table (seeded CompactDeck if not given)
+    :return: Nothing
+    """
+    rng = Random(SEED)
+    table = engine.Engine([engine.BotStrategy(rng) for _ in range(BOTS)], shoe or deck.CompactDeck(rng))
+    timer.start()
+    for _ in range(ops):
+        table.play_round()
+    timer.stop()
+
+
+def bench_csm_engine_round(ops: int, timer: Timer) -> None:
+    """
+    Engine.play_round of table with bots, which is dealt by continuous shuffling machine
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    bench_engine_round(ops, timer, deck.ShufflerDeck(seed=SEED))
+
+
+def bench_hand_add(ops: int, timer: Timer) -> None:
+    """
+    Hand.add of Ace, 5 and 9 (soft hand becomes hard), Hand.points and Hand.busted after each card and Hand.clear
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    codes = [deck.encode_card(deck.Card('Club', picture, deck.picture_value(picture))) for picture in ('Ace', '5', '9')]
+    cards = hand.Hand()
+    timer.start()
+    for _ in range(ops):
+        for code in codes:
+            cards.add(code)
+            cards.points
+            cards.busted
+        cards.clear()
+    timer.stop()
+
+
+def _table(bots: int = BOTS, verbosity: int = render.VERBOSE) -> game.Game:
+    """
+    Create table with bots, which already played one round
+    :param bots: amount of bots
+    :param verbosity: level of output of table
+    :return: Game class object
+    """
+    table = game.Game(basic_strategy=True, amount_of_bots=bots, human=False, seed=SEED, verbosity=verbosity)
+    table.play()
+    return table
+
+
+def bench_results(ops: int, timer: Timer) -> None:
+    """
+    Game._results of table with bots (other phases of round aren't measured)
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    table = _table()
+    for _ in range(ops):
+        table._new_round()
+        table._hand_out_cards()
+        table._player_choice()
+        table._left_game_check()
+        timer.start()
+        table._results()
+        timer.stop()
+
+
+def bench_round(ops: int, timer: Timer) -> None:
+    """
+    Full headless Game.play round of table with bots
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    table = _table()
+    timer.start()
+    for _ in range(ops):
+        table.play()
+    timer.stop()
+
+
+def bench_quiet_round(ops: int, timer: Timer) -> None:
+    """
+    Full Game.play round of table with bots, where output is quiet (lines aren't made)
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    table = _table(verbosity=render.QUIET)
+    timer.start()
+    for _ in range(ops):
+        table.play()
+    timer.stop()
+
+
+def bench_big_round(ops: int, timer: Timer) -> None:
+    """
+    Full headless Game.play round of table with BIG_TABLE bots
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    table = _table(BIG_TABLE)
+    timer.start()
+    for _ in range(ops):
+        table.play()
+    timer.stop()
+
+
+def bench_snapshot_dump(ops: int, timer: Timer) -> None:
+    """
+    snapshot.dump of table with bots between rounds
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    table = _table(verbosity=render.QUIET)
+    for _ in range(20):
+        table.play()
+    timer.start()
+    for _ in range(ops):
+        snapshot.dump(table)
+    timer.stop()
+
+
+def bench_snapshot_load(ops: int, timer: Timer) -> None:
+    """
+    snapshot.load of table with bots
+    :param ops: number of operations
+    :param timer: timer of measured part
+    :return: Nothing
+    """
+    table = _table(verbosity=render.QUIET)
+    for _ in range(20):
+        table.play()
+    data = snapshot.dump(table)
+    timer.start()
+    for _ in range(ops):
+        snapshot.load(data)
+    timer.stop()
+
+
+# name of benchmark: (function, number of operations)
+BENCHMARKS = {
+    'deck.create_shuffled_deck': (bench_create_deck, 500),
+    'deck.take_card_from_deck': (bench_take_card, 200_000),
+    'deck.take_card_from_deck (CSM)': (bench_csm_take_card, 200_000),
+    'hand.add+clear': (bench_hand_add, 100_000),
+    'game._results': (bench_results, 3_000),
+    f'game.play ({BOTS} bots)': (bench_round, 3_000),
+    f'game.play ({BOTS} bots, quiet)': (bench_quiet_round, 3_000),
+    f'game.play ({BIG_TABLE} bots)': (bench_big_round, 20),
+    f'engine.play_round ({BOTS} bots)': (bench_engine_round, 20_000),
+    f'engine.play_round ({BOTS} bots, CSM)': (bench_csm_engine_round, 20_000),
+    'snapshot.dump': (bench_snapshot_dump, 5_000),
+    'snapshot.load': (bench_snapshot_load, 5_000),
+}
+
+
+def calibrate() -> float:
+    """
+    Time fixed pure Python loop, which shows current speed of host
+    :return: seconds of loop
+    """
+    start = perf_counter()
+    total = 0
+    for i in range(CALIBRATION_OPS):
+        total += i & 7
+    return perf_counter() - start
+
+
+def run(function, ops: int) -> dict[str, float]:
+    """
+    Run benchmark (after warm-up) and measure speed and memory, which is allocated in measured part
+    :param function: benchmark function
+    :param ops: number of operations
+    :return: ops/sec, operations in time of calibration loop and peak of allocated bytes in measured part
+    """
+    function(max(ops // 10, 1), Timer())  # warm-up
+    ops_per_sec = relative = 0.
+    for _ in range(REPEATS):
+        timer = Timer()
+        before = calibrate()
+        function(ops, timer)
+        speed = ops / timer.elapsed
+        ops_per_sec = max(ops_per_sec, speed)
+        relative = max(relative, speed * (before + calibrate()) / 2)
+
+    memory_timer = Timer()
+    tracemalloc.start()
+    function(max(ops // 100, 1), memory_timer)
+    tracemalloc.stop()
+    return {'ops_per_sec': ops_per_sec, 'relative': relative, 'peak_bytes': memory_timer.peak}
+
+
+def main() -> None:
+    """
+    Run all benchmarks, print them and compare with baseline (or record new baseline)
+    :return: Nothing
+    """
+    parser = argparse.ArgumentParser(description='BlackJack benchmark suite')
+    parser.add_argument('--record', action='store_true', help='save results as new baseline')
+    parser.add_argument('--select', nargs='*', default=[''], help='run only benchmarks, which names contain text')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD, help='allowed slowdown (0.25 is 25%%)')
+    parser.add_argument('--scale', type=float, default=1., help='multiplier of number of operations')
+    args = parser.parse_args()
+
+    baseline = {}
+    if path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE) as file:
+            baseline = json.load(file)
+
+    results = {}
+    failed = []
+    print(f'{"benchmark":<32}{"ops/sec":>14}{"baseline":>14}{"change":>9}{"peak bytes":>12}')
+    for name, (function, ops) in BENCHMARKS.items():
+        if not any(text in name for text in args.select):
+            continue
+        with open(devnull, 'w') as output, redirect_stdout(output):
+            result = run(function, max(int(ops * args.scale), 1))
+        results[name] = result
+
+        line = f'{name:<32}{result["ops_per_sec"]:>14.0f}'
+        if 'relative' in baseline.get(name, {}):  # baseline without calibration isn't compared
+            change = result['relative'] / baseline[name]['relative'] - 1
+            line += f'{baseline[name]["ops_per_sec"]:>14.0f}{change:>+9.0%}'
+            if change < -args.threshold:
+                failed.append(name)
+        else:
+            line += f'{"-":>14}{"-":>9}'
+        print(line + f'{result["peak_bytes"]:>12}')
+
+    if args.record:
+        baseline.update(results)  # benchmarks, which weren't run, keep their baselines
+        baseline = {name: baseline[name] for name in BENCHMARKS if name in baseline}
+        with open(BASELINE_FILE, 'w') as file:
+            json.dump(baseline, file, indent=4)
+        print(f'Baseline is saved to {BASELINE_FILE}')
+    elif failed:
+        print(f'Slower than baseline by more than {args.threshold:.0%}: {", ".join(failed)}')
+
+    if any(text in MEMORY_CHECK for text in args.select):
+        rounds = max(int(MEMORY_ROUNDS * args.scale), 1)
+        growth = memory.measure(rounds)
+        print(f'{MEMORY_CHECK:<32}{growth:>14} bytes in {rounds} rounds (limit {memory.GROWTH_LIMIT})')
+        if growth > memory.GROWTH_LIMIT:
+            print(f'Memory of session grows more than {memory.GROWTH_LIMIT} bytes')
+            sys.exit(1)
+    if failed and not args.record:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,375 @@
+"""
+BlackJack module with distributed simulation: coordinator hands out ranges of rounds to worker processes
+(on this or other hosts) and merges their counters.
+
+Protocol is text lines over TCP socket. Worker connects and sends
+    READY
+coordinator answers with range of rounds or with END, if all ranges are done:
+    RANGE <index> <first round> <end round> <seed> <bots> <basic strategy>
+worker plays rounds on seeded Game and sends counters of range, which also means that it's ready for next one:
+    DONE <index> <counters>                               (see encode_stats)
+Each range is played on own table, which is seeded by seed of job and first round of range, so any worker can
+play it and it has the same results. If worker disconnects (or doesn't answer in time), its range is given to
+other worker. Done ranges are appended to checkpoint file, so stopped job is continued from it.
+"""
+
+import asyncio
+import game
+import logging
+from ledger import CENTS
+from collections import deque
+from os import path
+from random import Random
+from render import QUIET
+from simulation import Stats
+
+# rounds in one range of job
+CHUNK_ROUNDS = 1000
+# first line of checkpoint file
+CHECKPOINT_HEADER = 'BLACKJACK-JOB'
+# local worker processes, which can die one after another without any done range, before job is stopped
+MAX_FAILURES = 5
+
+logger = logging.getLogger(__name__)
+
+
+def encode_stats(stats: Stats) -> str:
+    """
+    Make text of counters for DONE line and checkpoint file (floats are written exactly)
+    :param stats: counters of range
+    :return: numbers separated by spaces
+    """
+    net = stats.net
+    return ' '.join(map(repr, (stats.rounds, stats.hands, *stats.outcomes, stats.bet, stats.payout, net.count,
+                               net.mean, net.m2, net.total, net.wagered, net.peak, net.trough, net.max_drawdown)))
+
+
+def decode_stats(words: list) -> Stats:
+    """
+    Make counters from text of encode_stats
+    :param words: numbers (str or bytes)
+    :return: counters of range
+    """
+    if len(words) != 18:
+        raise ValueError('expected 18 numbers of counters')
+    stats = Stats()
+    stats.rounds, stats.hands = int(words[0]), int(words[1])
+    stats.outcomes = [int(word) for word in words[2:8]]
+    stats.bet, stats.payout = int(words[8]), int(words[9])
+    net = stats.net
+    net.count, net.mean, net.m2 = int(words[10]), float(words[11]), float(words[12])
+    net.total, net.wagered, net.peak, net.trough, net.max_drawdown = map(int, words[13:])
+    return stats
+
+
+def play_range(seed: int, rounds: int, bots: int, basic_strategy: bool = False) -> Stats:
+    """
+    Play rounds on new seeded table with bots (without output)
+    :param seed: seed of table
+    :param rounds: number of rounds
+    :param bots: number of bots
+    :param basic_strategy: do bots play by basic strategy table
+    :return: counters of played rounds
+    """
+    table = game.Game(basic_strategy, bots, human=False, seed=seed, verbosity=QUIET)
+    for _ in range(rounds):
+        table.play()
+    stats = Stats()
+    stats.rounds = rounds
+    stats.outcomes = table.outcomes
+    stats.hands = sum(table.outcomes)
+    stats.bet = table.ledger.wagered // CENTS
+    stats.payout = table.ledger.paid // CENTS
+    stats.net = table.stats
+    return stats
+
+
+class Coordinator:
+    """
+    Server of job, which hands out ranges of rounds to workers, reassigns ranges of lost workers and merges
+    counters of done ranges in order of rounds (so result doesn't depend on workers)
+    """
+    def __init__(self, rounds: int, chunk: int = CHUNK_ROUNDS, seed: int | None = None, bots: int = 4,
+                 basic_strategy: bool = False, checkpoint: str | None = None, host: str = '127.0.0.1',
+                 port: int = 0, timeout: float | None = None) -> None:
+        """
+        Init method of Coordinator class
+        :param rounds: number of rounds of job
+        :param chunk: rounds in one range
+        :param seed: seed of job (from checkpoint or random if not given)
+        :param bots: number of bots on each table
+        :param basic_strategy: do bots play by basic strategy table
+        :param checkpoint: file, where done ranges are saved and loaded from (job isn't saved if not given)
+        :param host: host of coordinator (only local one by default)
+        :param port: port of coordinator (free port is chosen if 0)
+        :param timeout: seconds, after which range of silent worker is reassigned (worker isn't waited if not given)
+        """
+        self.rounds = rounds
+        self.chunk = chunk
+        self.bots = bots
+        self.basic_strategy = basic_strategy
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.server = None
+        self.workers = 0  # number of connected workers
+        self.ranges = -(-rounds // chunk)
+        self.results = {}  # counters of each done range
+        self.checkpoint = None
+        if checkpoint is not None and path.exists(checkpoint):
+            seed = self._load(checkpoint, seed)
+        self.seed = Random().getrandbits(63) if seed is None else seed
+        if checkpoint is not None:
+            self.checkpoint = open(checkpoint, 'a+')
+            if not self.checkpoint.tell():
+                self.checkpoint.write(f'{CHECKPOINT_HEADER} {self._job()}\n')
+            else:
+                self.checkpoint.seek(self.checkpoint.tell() - 1)
+                if self.checkpoint.read(1) != '\n':  # last line wasn't written completely
+                    self.checkpoint.write('\n')
+            self.checkpoint.flush()
+        self.pending = deque(index for index in range(self.ranges) if index not in self.results)
+        self.changed = asyncio.Event()  # set, when range is done or returned
+
+    def _job(self) -> str:
+        """
+        Parameters of job in checkpoint file
+        :return: parameters separated by spaces
+        """
+        return f'{self.rounds} {self.chunk} {self.seed} {self.bots} {self.basic_strategy:d}'
+
+    def _load(self, file_name: str, seed: int | None) -> int:
+        """
+        Load done ranges from checkpoint file (line, which wasn't written completely, is skipped)
+        :param file_name: checkpoint file
+        :param seed: seed of job, which should be the same as in checkpoint (if given)
+        :return: seed of job from checkpoint
+        """
+        with open(file_name) as file:
+            words = file.readline().split()
+            if len(words) != 6 or words[0] != CHECKPOINT_HEADER:
+                raise ValueError(f'{file_name} isn\'t checkpoint of job')
+            self.seed = int(words[3])
+            if seed is not None and seed != self.seed or ' '.join(words[1:]) != self._job():
+                raise ValueError(f'{file_name} is checkpoint of other job')
+            for line in file:
+                words = line.split()
+                try:
+                    if words[0] == 'DONE':
+                        self.results[int(words[1])] = decode_stats(words[2:])
+                except (IndexError, ValueError):
+                    continue
+        return self.seed
+
+    def range_of(self, index: int) -> tuple[int, int, int]:
+        """
+        Rounds and seed of range
+        :param index: number of range
+        :return: first round, end round (not included) and seed of table
+        """
+        start = index * self.chunk
+        return start, min(start + self.chunk, self.rounds), Random(f'{self.seed}:{start}').getrandbits(63)
+
+    async def start(self) -> None:
+        """
+        Start listening (port is set to real port of coordinator)
+        :return: Nothing
+        """
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """
+        Stop listening and close checkpoint file
+        :return: Nothing
+        """
+        self.server.close()
+        await self.server.wait_closed()
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+
+    @property
+    def done(self) -> bool:
+        """
+        Are all ranges done or no
+        :return: True or False
+        """
+        return len(self.results) == self.ranges
+
+    async def wait(self) -> Stats:
+        """
+        Wait until all ranges are done
+        :return: merged counters of all ranges
+        """
+        while not self.done:
+            self.changed.clear()
+            await self.changed.wait()
+        return self.merged()
+
+    def merged(self) -> Stats:
+        """
+        Merge counters of done ranges in order of rounds
+        :return: merged counters
+        """
+        stats = Stats()
+        for index in sorted(self.results):
+            stats.merge(self.results[index])
+        return stats
+
+    def _finish(self, index: int, stats: Stats) -> None:
+        """
+        Save counters of done range
+        :param index: number of range
+        :param stats: counters of range
+        :return: Nothing
+        """
+        if index in self.results:  # range was reassigned, and both workers have done it
+            return
+        self.results[index] = stats
+        if self.checkpoint is not None:
+            self.checkpoint.write(f'DONE {index} {encode_stats(stats)}\n')
+            self.checkpoint.flush()
+        self.changed.set()
+
+    async def _next_range(self) -> int | None:
+        """
+        Wait for range, which isn't given to any worker
+        :return: number of range or None if job is done
+        """
+        while not self.pending:
+            if self.done:
+                return None
+            self.changed.clear()
+            await self.changed.wait()
+        return self.pending.popleft()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one worker
+        :param reader: reader of connection
+        :param writer: writer of connection
+        :return: Nothing
+        """
+        self.workers += 1
+        index = None
+        try:
+            while 1:
+                line = await asyncio.wait_for(reader.readline(), None if index is None else self.timeout)
+                words = line.split()
+                if not words:
+                    raise ConnectionError('worker left')
+                if index is not None and words[0] == b'DONE' and words[1:2] == [str(index).encode()]:
+                    self._finish(index, decode_stats(words[2:]))
+                elif words[0] != b'READY' or index is not None:
+                    raise ConnectionError(f'unexpected line {line!r}')
+
+                index = await self._next_range()
+                if index is None:
+                    writer.write(b'END\n')
+                    await writer.drain()
+                    return
+                start, end, seed = self.range_of(index)
+                writer.write(f'RANGE {index} {start} {end} {seed} {self.bots} {self.basic_strategy:d}\n'.encode())
+                await writer.drain()
+        except (ConnectionError, ValueError, asyncio.TimeoutError):
+            pass
+        finally:
+            if index is not None and index not in self.results:
+                self.pending.appendleft(index)  # range of lost worker is given to next free worker
+                self.changed.set()
+            self.workers -= 1
+            writer.close()
+
+
+async def work(host: str = '127.0.0.1', port: int = 8766) -> int:
+    """
+    Connect to coordinator and play ranges, until job is done
+    :param host: host of coordinator
+    :param port: port of coordinator
+    :return: number of played ranges
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'READY\n')
+    played = 0
+    try:
+        while 1:
+            words = (await reader.readline()).split()
+            if not words or words[0] != b'RANGE':
+                return played
+            index, start, end, seed, bots, basic_strategy = map(int, words[1:])
+            stats = play_range(seed, end - start, bots, basic_strategy == 1)
+            writer.write(f'DONE {index} {encode_stats(stats)}\n'.encode())
+            await writer.drain()
+            played += 1
+    except ConnectionError:
+        return played
+    finally:
+        writer.close()
+
+
+def work_process(host: str, port: int) -> None:
+    """
+    Entry point of local worker process
+    :param host: host of coordinator
+    :param port: port of coordinator
+    :return: Nothing
+    """
+    asyncio.run(work(host, port))
+
+
+async def run_local(rounds: int, workers: int = 2, chunk: int = CHUNK_ROUNDS, seed: int | None = None,
+                    bots: int = 4, basic_strategy: bool = False, checkpoint: str | None = None,
+                    max_failures: int = MAX_FAILURES) -> Stats:
+    """
+    Run job with coordinator and worker processes on this host. Worker process, which has died before job is
+    done, is started again (its exit code is logged), but if max_failures processes die one after another
+    without any done range, job is stopped with RuntimeError (done ranges are kept in checkpoint)
+    :param rounds: number of rounds of job
+    :param workers: number of worker processes
+    :param chunk: rounds in one range
+    :param seed: seed of job (random if not given)
+    :param bots: number of bots on each table
+    :param basic_strategy: do bots play by basic strategy table
+    :param checkpoint: checkpoint file of job (job isn't saved if not given)
+    :param max_failures: worker processes, which can die in a row before job is stopped
+    :return: merged counters of all ranges
+    """
+    from multiprocessing import get_context  # coordinator on other host doesn't need it, so it's imported only here
+
+    coordinator = Coordinator(rounds, chunk, seed, bots, basic_strategy, checkpoint)
+    await coordinator.start()
+    context = get_context('spawn')
+    processes = []
+    failures = 0  # processes, which died after last done range
+    done = len(coordinator.results)
+    try:
+        while not coordinator.done:
+            if len(coordinator.results) > done:
+                done = len(coordinator.results)
+                failures = 0
+            alive = []
+            for process in processes:
+                if process.exitcode is None:
+                    alive.append(process)
+                    continue
+                failures += 1
+                logger.warning('worker process %d exited with code %d', process.pid, process.exitcode)
+                if failures >= max_failures:
+                    raise RuntimeError(f'{failures} worker processes died without done range '
+                                       f'(last exit code {process.exitcode})')
+            processes = alive
+            while len(processes) < workers:
+                process = context.Process(target=work_process, args=(coordinator.host, coordinator.port), daemon=True)
+                process.start()
+                processes.append(process)
+            try:
+                await asyncio.wait_for(coordinator.wait(), 1)
+            except asyncio.TimeoutError:
+                pass
+        return coordinator.merged()
+    finally:
+        await coordinator.stop()
+        for process in processes:
+            process.join(1)
+            if process.is_alive():
+                process.terminate()
@@ -0,0 +1,3 @@
+"""
+Configuration of pytest: this directory is added to sys.path, so tests import modules of game by `pytest tests`
+"""
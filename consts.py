@@ -1,8 +1,30 @@
-"""
-BlackJack module with consts
-"""
-
-CARD_SUITS = ('Club', 'Diamond', 'Heart', 'Spades')
-CARD_VALUES = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace')
-BOT_NAMES = ['John', 'Dan', 'Jorge', 'Brian', 'Roberto', 'Connor', 'Peter', 'Alberto', 'Paul', 'Tommy',
-             'Philipp', 'Jack', 'Andrew', 'Daniel', 'Ali', 'Henry', 'Antonio', 'Steve', 'Ryan', 'Sam']
+"""
+BlackJack module with consts
+"""
+
+from os import path
+
+CARD_SUITS = ('Club', 'Diamond', 'Heart', 'Spades')
+CARD_VALUES = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace')
+BOT_NAMES = ['John', 'Dan', 'Jorge', 'Brian', 'Roberto', 'Connor', 'Peter', 'Alberto', 'Paul', 'Tommy',
+             'Philipp', 'Jack', 'Andrew', 'Daniel', 'Ali', 'Henry', 'Antonio', 'Steve', 'Ryan', 'Sam']
+
+# number of sets of cards in deck and part of deck, which is dealt before it's shuffled again (cut card)
+DECKS = 4
+PENETRATION = 0.75
+
+# tags of pictures (in order of CARD_VALUES) in card counting systems
+HI_LO = (1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, -1)
+HI_OPT_1 = (0, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1, 0)
+OMEGA_2 = (1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2, 0)
+ZEN = (1, 1, 2, 2, 2, 1, 0, 0, -2, -2, -2, -2, -1)
+
+# does Dealer take card on soft 17 (H17) or stands on it (S17)
+DEALER_HITS_SOFT_17 = False
+# bet of each Bot in each round
+BOT_BET = 100
+# how many times player can split hands in one round (re-split), so player has up to MAX_SPLITS + 1 hands
+MAX_SPLITS = 3
+
+# directory, where generated tables (basic strategy and others) are saved
+CACHE_DIR = path.join(path.expanduser('~'), '.cache', 'blackjack')
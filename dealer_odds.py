@@ -0,0 +1,169 @@
+"""
+BlackJack module with exact probabilities of Dealer's final points
+"""
+
+from consts import CACHE_DIR, DEALER_HITS_SOFT_17
+from os import makedirs, path
+from pickle import dump, load
+from strategy import CARD_PROBABILITIES, add_card
+
+# index of each final in distribution: 17, 18, 19, 20, 21 and bust
+BUST = 5
+# internal memo is cleared, when it has more entries than this
+MEMO_LIMIT = 1_000_000
+
+
+def shoe_counts(decks: int) -> tuple[int, ...]:
+    """
+    Counts of cards with values 2..11 (Ace) in full shoe
+    :param decks: number of decks in shoe
+    :return: tuple of 10 counts
+    """
+    return tuple(16 * decks if value == 10 else 4 * decks for value in range(2, 12))
+
+
+def remove_card(counts: tuple[int, ...], value: int) -> tuple[int, ...]:
+    """
+    Remove one card from counts
+    :param counts: counts of cards with values 2..11
+    :param value: value of card (Ace is 11)
+    :return: new counts
+    """
+    i = value - 2
+    return counts[:i] + (counts[i] - 1,) + counts[i + 1:]
+
+
+class DealerOdds:
+    """
+    Calculator of Dealer's final points, which remembers results for each composition of shoe and saves them
+    to cache file (cache file is read on first use of results). New results are only in memory, until owner of
+    calculator calls save() or uses it in with statement, which saves them at exit:
+        with DealerOdds() as odds:
+            rates = [odds.bust_rate(upcard) for upcard in range(2, 12)]
+    """
+    def __init__(self, h17: bool = DEALER_HITS_SOFT_17, file_name: str | None = None,
+                 memo_limit: int = MEMO_LIMIT) -> None:
+        """
+        Init method of DealerOdds class
+        :param h17: does Dealer take card on soft 17 or no
+        :param file_name: cache file (file in CACHE_DIR if not given)
+        :param memo_limit: entries of internal memo, after which it's cleared
+        """
+        self.h17 = h17
+        self.file_name = file_name or path.join(CACHE_DIR, f'dealer_odds_{"h17" if h17 else "s17"}.pickle')
+        self.memo_limit = memo_limit
+        self._results = None
+        self._memo = {}
+        self._changed = False
+
+    def __enter__(self) -> 'DealerOdds':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.save()
+
+    @property
+    def results(self) -> dict:
+        """
+        Results of distribution for each upcard and composition of shoe (they are loaded from cache file once)
+        :return: dictionary of results
+        """
+        if self._results is None:
+            self._results = {}
+            if path.exists(self.file_name):
+                with open(self.file_name, 'rb') as file:
+                    self._results = load(file)
+        return self._results
+
+    def clear(self) -> None:
+        """
+        Clear internal memo (for example, after shuffle, when old compositions don't come again)
+        :return: Nothing
+        """
+        self._memo.clear()
+
+    def finals(self, counts: tuple[int, ...] | None, points: int, soft: bool) -> tuple[float, ...]:
+        """
+        Probabilities of final points of Dealer, who has points and takes cards from shoe with counts
+        :param counts: counts of cards with values 2..11 left in shoe, or None for infinite deck, where
+                       odds of cards don't change (CARD_PROBABILITIES)
+        :param points: points of Dealer's hand
+        :param soft: is one of Aces in Dealer's hand counted as 11 or no
+        :return: tuple of 6 probabilities (17, 18, 19, 20, 21, bust)
+        """
+        if points > 21:
+            return 0., 0., 0., 0., 0., 1.
+        if points > 17 or points == 17 and not (soft and self.h17):
+            finals = [0.] * 6
+            finals[points - 17] = 1.
+            return tuple(finals)
+
+        key = (counts, points, soft)
+        finals = self._memo.get(key)
+        if finals is not None:
+            return finals
+
+        finals = [0.] * 6
+        if counts is None:
+            for value, probability in CARD_PROBABILITIES.items():
+                for j, final in enumerate(self.finals(None, *add_card(points, soft, value))):
+                    finals[j] += probability * final
+        else:
+            total = sum(counts)
+            for i, count in enumerate(counts):
+                if count:
+                    probability = count / total
+                    value = i + 2
+                    for j, final in enumerate(self.finals(remove_card(counts, value), *add_card(points, soft, value))):
+                        finals[j] += probability * final
+
+        finals = tuple(finals)
+        if len(self._memo) >= self.memo_limit:
+            self._memo.clear()
+        self._memo[key] = finals
+        return finals
+
+    def distribution(self, upcard: int, counts: tuple[int, ...]) -> tuple[float, ...]:
+        """
+        Probabilities of Dealer's final points for upcard and shoe without upcard (new result is saved to cache
+        file by save)
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param counts: counts of cards with values 2..11 left in shoe (upcard is already taken from them)
+        :return: tuple of 6 probabilities (17, 18, 19, 20, 21, bust)
+        """
+        key = (counts, upcard)
+        finals = self.results.get(key)
+        if finals is None:
+            finals = self.results[key] = self.finals(counts, *add_card(0, False, upcard))
+            self._changed = True
+        return finals
+
+    def for_decks(self, upcard: int, decks: int = 4) -> tuple[float, ...]:
+        """
+        Probabilities of Dealer's final points for upcard and full shoe
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param decks: number of decks in shoe
+        :return: tuple of 6 probabilities (17, 18, 19, 20, 21, bust)
+        """
+        return self.distribution(upcard, remove_card(shoe_counts(decks), upcard))
+
+    def bust_rate(self, upcard: int, decks: int = 4) -> float:
+        """
+        Probability that Dealer busts with upcard and full shoe
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param decks: number of decks in shoe
+        :return: probability of bust
+        """
+        return self.for_decks(upcard, decks)[BUST]
+
+    def save(self) -> None:
+        """
+        Save calculated results to cache file (if there are new ones)
+        :return: Nothing
+        """
+        if not self._changed:
+            return
+        makedirs(path.dirname(self.file_name), exist_ok=True)
+        with open(self.file_name, 'wb') as file:
+            dump(self.results, file)
+        self._changed = False
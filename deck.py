@@ -1,78 +1,434 @@
-"""
-BlackJack module with classes of cards and deck
-"""
-
-from consts import CARD_SUITS, CARD_VALUES
-from itertools import product
-from random import shuffle
-
-
-class Card:
-    """
-    Card class in BlackJack
-    """
-    def __init__(self, suit: str, picture: str, value: int) -> None:
-        """
-        Init method of Card class
-        :param suit: suit of card
-        :param picture: picture (name) of card
-        :param value: value of card
-        """
-        self.suit = suit
-        self.picture = picture
-        self.value = value
-
-    def __repr__(self) -> str:
-        """
-        Repr method of Card class
-        :return: card suit and picture in one string
-        """
-        return f'{self.suit} {self.picture}'
-
-
-class Deck:
-    """
-    Deck class in BlackJack
-    """
-    def __init__(self) -> None:
-        """
-        Init method of Deck class
-        """
-        self.deck_cards = []
-        self.create_shuffled_deck()
-
-    def create_shuffled_deck(self) -> list[Card]:
-        """
-        Creating deck with 4 sets of cards and shuffling it
-        :return: list of Card class objects
-        """
-        for suit, picture in product(CARD_SUITS, CARD_VALUES):
-            if picture == 'Ace':
-                card = Card(suit, picture, 11)
-            elif picture in ('Jack', 'Queen', 'King'):
-                card = Card(suit, picture, 10)
-            elif picture in ('2', '3', '4', '5', '6', '7', '8', '9', '10'):
-                card = Card(suit, picture, int(picture))
-            else:
-                continue
-
-            # this part is for creating 4 sets of cards (not only 1 set, but 4)
-            # usually in BlackJack players use 4 sets of cards
-            for _ in range(4):
-                self.deck_cards.append(card)
-
-        # shuffling deck
-        shuffle(self.deck_cards)
-
-        return self.deck_cards
-
-    def take_card_from_deck(self) -> Card:
-        """
-        Take top (last) card from deck (list of Card class objects)
-        :return: top (last) card
-        """
-        return self.deck_cards.pop()
-
-
-# creating deck
-current_deck = Deck()
+"""
+BlackJack module with classes of cards and deck
+"""
+
+from array import array
+from consts import CARD_SUITS, CARD_VALUES, DECKS, PENETRATION, HI_LO
+from itertools import product
+from random import Random, shuffle
+
+
+class Card:
+    """
+    Card class in BlackJack
+    """
+    def __init__(self, suit: str, picture: str, value: int) -> None:
+        """
+        Init method of Card class
+        :param suit: suit of card
+        :param picture: picture (name) of card
+        :param value: value of card
+        """
+        self.suit = suit
+        self.picture = picture
+        self.value = value
+
+    def __repr__(self) -> str:
+        """
+        Repr method of Card class
+        :return: card suit and picture in one string
+        """
+        return f'{self.suit} {self.picture}'
+
+
+class Deck:
+    """
+    Deck (shoe) class in BlackJack. Cards are taken from top by moving cursor, and when cursor passes
+    cut card, deck is shuffled again in the same list before next round.
+    If seed is given, each shoe is shuffled from the same order with own seed (made of seed and number of shoe),
+    so any shoe can be made again without shuffling previous ones
+    """
+    def __init__(self, rng: Random | None = None, decks: int = DECKS, penetration: float = PENETRATION,
+                 counting: tuple[int, ...] = HI_LO, seed: int | None = None) -> None:
+        """
+        Init method of Deck class
+        :param rng: random generator for shuffling (global one if not given)
+        :param decks: number of sets of cards in deck
+        :param penetration: part of deck, which is dealt before shuffling (place of cut card)
+        :param counting: tag of each picture in CARD_VALUES for running count (Hi-Lo by default)
+        :param seed: seed of shoes (shuffling isn't reproducible if not given)
+        """
+        self.rng = Random() if rng is None and seed is not None else rng
+        self.seed = seed
+        self.shoes = 0  # number of shuffles (shoe, which is dealt now, is shoes - 1)
+        self.ordered = None  # cards before first shuffle (each seeded shoe is shuffled from them)
+        self.decks = decks
+        self.penetration = penetration
+        self.counting = counting
+        self.position = 0
+        self.deck_cards = []
+        # cards of each picture (index in CARD_VALUES), which are left in deck, and running count of taken cards
+        self.counts = [len(CARD_SUITS) * decks] * len(CARD_VALUES)
+        self.running_count = 0
+        self.create_shuffled_deck()
+        self.cut_card = int(len(self.deck_cards) * penetration)
+
+    def create_shuffled_deck(self) -> list[Card]:
+        """
+        Creating deck with few sets of cards and shuffling it
+        :return: list of Card class objects
+        """
+        self.deck_cards = []
+        for suit, picture in product(CARD_SUITS, CARD_VALUES):
+            # this part is for creating few sets of cards (not only 1 set, but 4 by default)
+            # usually in BlackJack players use 4 sets of cards
+            # each copy is own Card object, so changing value of one Ace doesn't change other Aces
+            for _ in range(self.decks):
+                self.deck_cards.append(Card(suit, picture, picture_value(picture)))
+
+        self.ordered = self.deck_cards[:]
+        self.shuffle()
+        return self.deck_cards
+
+    def shuffle(self) -> None:
+        """
+        Shuffle all cards of deck (in the same list) and move cursor to top
+        :return: Nothing
+        """
+        if self.rng is None:
+            shuffle(self.deck_cards)
+        else:
+            if self.seed is not None:
+                self.deck_cards[:] = self.ordered
+                self.rng.seed(f'{self.seed}:{self.shoes}')
+            self.rng.shuffle(self.deck_cards)
+        self.shoes += 1
+        self.position = 0
+        self.counts = [len(CARD_SUITS) * self.decks] * len(CARD_VALUES)
+        self.running_count = 0
+
+    def seek(self, shoe: int, position: int) -> None:
+        """
+        Make seeded shoe again and take cards from it up to position
+        :param shoe: number of shoe
+        :param position: number of cards, which are taken from shoe
+        :return: Nothing
+        """
+        if self.seed is None:
+            raise ValueError('only seeded deck can be made again')
+        self.shoes = shoe
+        self.shuffle()
+        for _ in range(position):
+            self.take_card_from_deck()
+
+    @property
+    def counts(self) -> list[int]:
+        """
+        Cards of each picture (index in CARD_VALUES), which are left in deck. Taken cards are counted here, when
+        counts are read, so taking card doesn't pay for counting, which isn't used
+        :return: list of counts
+        """
+        self._count_taken()
+        return self._counts
+
+    @counts.setter
+    def counts(self, counts: list[int]) -> None:
+        if hasattr(self, '_running_count'):
+            self._count_taken()  # cards, which were taken before, are still added to running count
+        self._counts = counts
+        self._counted = self.position
+
+    @property
+    def running_count(self) -> int:
+        """
+        Sum of counting tags of cards, which were taken since shuffle (taken cards are counted when it's read)
+        :return: running count
+        """
+        self._count_taken()
+        return self._running_count
+
+    @running_count.setter
+    def running_count(self, running_count: int) -> None:
+        if hasattr(self, '_counts'):
+            self._count_taken()  # cards, which were taken before, are still subtracted from counts
+        self._running_count = running_count
+        self._counted = self.position
+
+    def _ranks(self, cards) -> list[int]:
+        """
+        Indexes of pictures in CARD_VALUES of cards
+        :param cards: cards of deck
+        :return: list of indexes
+        """
+        return [PICTURE_INDEXES[card.picture] for card in cards]
+
+    def _count_taken(self) -> None:
+        """
+        Subtract cards, which were taken since last count, from counts and add their tags to running count
+        :return: Nothing
+        """
+        counted = self._counted
+        self._counted = position = self.position
+        if counted >= position:
+            return
+        counts = self._counts
+        counting = self.counting
+        running_count = 0
+        for rank in self._ranks(self.deck_cards[counted:position]):
+            counts[rank] -= 1
+            running_count += counting[rank]
+        self._running_count += running_count
+
+    @property
+    def true_count(self) -> float:
+        """
+        Running count divided by number of decks, which are left in deck
+        :return: true count
+        """
+        return self.running_count * len(CARD_SUITS) * len(CARD_VALUES) / max(len(self), 1)
+
+    def value_counts(self) -> tuple[int, ...]:
+        """
+        Cards of each value 2..11 (Ace), which are left in deck (Jack, Queen, King and 10 are one value)
+        :return: tuple of 10 counts
+        """
+        counts = self.counts
+        return tuple(counts[:8]) + (counts[8] + counts[9] + counts[10] + counts[11], counts[12])
+
+    @property
+    def needs_shuffle(self) -> bool:
+        """
+        Has cursor passed cut card or no
+        :return: True or False
+        """
+        return self.position >= self.cut_card
+
+    def shuffle_if_needed(self) -> bool:
+        """
+        Shuffle deck if cut card was reached (it should be called between rounds)
+        :return: True if deck was shuffled
+        """
+        if self.position >= self.cut_card:
+            self.shuffle()
+            return True
+        return False
+
+    def __len__(self) -> int:
+        """
+        Len method of Deck class
+        :return: number of cards left in deck
+        """
+        return len(self.deck_cards) - self.position
+
+    def take_card_from_deck(self) -> Card:
+        """
+        Take top card from deck by moving cursor (deck is shuffled if it has no cards left)
+        :return: top card
+        """
+        if self.position == len(self.deck_cards):
+            self.shuffle()
+        card = self.deck_cards[self.position]
+        self.position += 1
+        return card
+
+
+class CompactDeck(Deck):
+    """
+    Deck class in BlackJack, which keeps cards as codes (one byte per card) instead of Card objects.
+    Code of card is index of its picture in CARD_VALUES * 4 + index of its suit in CARD_SUITS, so
+    take_card_from_deck returns code (use CARD_CODE_VALUES and decode_card to get its value and Card)
+    """
+    def create_shuffled_deck(self) -> array:
+        """
+        Creating deck with few sets of card codes and shuffling it
+        :return: array of card codes
+        """
+        self.deck_cards = array('B', range(len(CARD_CODES))) * self.decks
+        self.ordered = self.deck_cards[:]
+        self.shuffle()
+        return self.deck_cards
+
+    def take_card_from_deck(self) -> int:
+        """
+        Take top card code from deck by moving cursor (deck is shuffled if it has no cards left)
+        :return: code of top card
+        """
+        if self.position == len(self.deck_cards):
+            self.shuffle()
+        code = self.deck_cards[self.position]
+        self.position += 1
+        return code
+
+    def _ranks(self, cards: array) -> list[int]:
+        return [code >> 2 for code in cards]  # index of picture in CARD_VALUES is code // 4
+
+
+class ShufflerDeck(Deck):
+    """
+    Deck of continuous shuffling machine (CSM) in BlackJack. Machine doesn't keep list of cards: it keeps count
+    of each card code, so each card is drawn from counts without shuffling, and cards, which were dealt in
+    round, are returned to machine before next round. take_card_from_deck returns code of card (like CompactDeck)
+    """
+    def __init__(self, rng: Random | None = None, decks: int = DECKS, counting: tuple[int, ...] = HI_LO,
+                 seed: int | None = None) -> None:
+        """
+        Init method of ShufflerDeck class
+        :param rng: random generator for draws (own generator with seed if not given)
+        :param decks: number of sets of cards in machine
+        :param counting: tag of each picture in CARD_VALUES for running count (Hi-Lo by default)
+        :param seed: seed of own random generator (draws aren't reproducible if both rng and seed aren't given)
+        """
+        self.rng = Random(seed) if rng is None else rng
+        self.random = self.rng.random
+        self.seed = seed
+        self.shoes = 1  # machine is never shuffled, so all rounds are dealt from one shoe
+        self.ordered = None
+        self.decks = decks
+        self.penetration = 1.
+        self.counting = counting
+        self.position = 0  # cards, which were dealt and aren't returned to machine yet
+        self.counts = [len(CARD_SUITS) * decks] * len(CARD_VALUES)
+        self.code_counts = [decks] * len(CARD_CODES)  # cards of each code, which are in machine
+        self.running_count = 0
+        self.deck_cards = ()
+        self.cut_card = len(CARD_CODES) * decks  # all cards of machine
+        self.dealt = []  # codes of cards, which are dealt since cards were returned
+
+    def create_shuffled_deck(self) -> tuple:
+        """
+        Machine has no list of cards
+        :return: empty tuple
+        """
+        return self.deck_cards
+
+    def shuffle(self) -> None:
+        """
+        Return all dealt cards to machine
+        :return: Nothing
+        """
+        counts = self._counts
+        code_counts = self.code_counts
+        for code in self.dealt:
+            code_counts[code] += 1
+            counts[code >> 2] += 1
+        self.dealt.clear()
+        self.position = 0
+        self.running_count = 0
+
+    def _count_taken(self) -> None:
+        """
+        Machine draws cards by counts, so they are counted when card is drawn
+        :return: Nothing
+        """
+        self._counted = self.position
+
+    def seek(self, shoe: int, position: int) -> None:
+        """
+        Draws of machine depend on all previous rounds, so round can't be found by shoe and position
+        :param shoe: number of shoe
+        :param position: number of cards, which are taken from shoe
+        :return: Nothing
+        """
+        raise ValueError('deck of shuffling machine can\'t be made again')
+
+    @property
+    def needs_shuffle(self) -> bool:
+        """
+        Machine is never shuffled
+        :return: False
+        """
+        return False
+
+    def shuffle_if_needed(self) -> bool:
+        """
+        Return cards of previous round to machine (it should be called between rounds)
+        :return: False (machine is never shuffled, so shoe doesn't change)
+        """
+        if self.position:
+            self.shuffle()
+        return False
+
+    def __len__(self) -> int:
+        """
+        Len method of ShufflerDeck class
+        :return: number of cards in machine
+        """
+        return self.cut_card - self.position
+
+    def take_card_from_deck(self) -> int:
+        """
+        Draw random card from counts of machine (dealt cards are returned, if machine has no cards left).
+        While machine is at least half full, random place of full machine is taken until there is card on it
+        (less than 2 tries on average, usually 1), else card is found by counts of pictures and codes
+        :return: code of card
+        """
+        if self.position == self.cut_card:
+            self.shuffle()
+        code_counts = self.code_counts
+        if 2 * self.position <= self.cut_card:
+            decks = self.decks
+            while 1:
+                place = int(self.random() * self.cut_card)
+                code = place // decks
+                if place - code * decks < code_counts[code]:
+                    break
+            rank = code >> 2  # index of picture in CARD_VALUES
+        else:
+            left = int(self.random() * (self.cut_card - self.position))
+            counts = self._counts
+            rank = 0
+            while left >= counts[rank]:
+                left -= counts[rank]
+                rank += 1
+            code = rank << 2
+            while left >= code_counts[code]:
+                left -= code_counts[code]
+                code += 1
+        code_counts[code] -= 1
+        self.dealt.append(code)
+        self.position += 1
+        self._counts[rank] -= 1
+        self._running_count += self.counting[rank]
+        return code
+
+
+def picture_value(picture: str) -> int:
+    """
+    Get value of card by its picture
+    :param picture: picture (name) of card
+    :return: value of card (Ace is 11)
+    """
+    if picture == 'Ace':
+        return 11
+    if picture in ('Jack', 'Queen', 'King'):
+        return 10
+    return int(picture)
+
+
+def encode_card(card: Card) -> int:
+    """
+    Get code of card for CompactDeck
+    :param card: Card class object
+    :return: code of card
+    """
+    return CARD_VALUES.index(card.picture) * len(CARD_SUITS) + CARD_SUITS.index(card.suit)
+
+
+def decode_card(code: int) -> Card:
+    """
+    Make Card class object from code of card (for showing it)
+    :param code: code of card
+    :return: new Card class object
+    """
+    suit, picture = CARD_CODES[code]
+    return Card(suit, picture, CARD_CODE_VALUES[code])
+
+
+# index of each picture in CARD_VALUES
+PICTURE_INDEXES = {picture: i for i, picture in enumerate(CARD_VALUES)}
+# suit and picture of each card code and value of each card code
+CARD_CODES = tuple((suit, picture) for picture in CARD_VALUES for suit in CARD_SUITS)
+CARD_CODE_VALUES = tuple(picture_value(picture) for _, picture in CARD_CODES)
+
+
+def __getattr__(name: str) -> Deck:
+    """
+    Create deck of game on first use (so importing module doesn't build and shuffle it)
+    :param name: name of module attribute
+    :return: current_deck
+    """
+    if name == 'current_deck':
+        global current_deck
+        current_deck = Deck()
+        return current_deck
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
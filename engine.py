@@ -0,0 +1,422 @@
+"""
+BlackJack module with headless round engine (no input() and no print)
+"""
+
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from consts import DEALER_HITS_SOFT_17, MAX_SPLITS
+from deck import CompactDeck, CARD_CODE_VALUES
+from hand import Hand, SeatHand
+from random import Random, randint
+
+
+# actions, which strategy can return from Strategy.decide
+HIT, STAND, SURRENDER, DOUBLE, SPLIT, INSURANCE, REWARD = range(7)
+ACTION_NAMES = ('hit', 'stand', 'surrender', 'double', 'split', 'insurance', 'reward')
+
+# bit masks of legal actions, which engine passes to Strategy.decide
+CAN_HIT = 1 << HIT
+CAN_STAND = 1 << STAND
+CAN_SURRENDER = 1 << SURRENDER
+CAN_DOUBLE = 1 << DOUBLE
+CAN_SPLIT = 1 << SPLIT
+CAN_INSURANCE = 1 << INSURANCE
+CAN_REWARD = 1 << REWARD
+HIT_OR_STAND = CAN_HIT | CAN_STAND
+
+# kinds of requests, which Engine.round_steps yields
+BET, DECIDE = range(2)
+
+# outcomes of one seat in round
+WIN, BLACKJACK, DRAW, LOSS, BUST, SURRENDERED = range(6)
+OUTCOME_NAMES = ('win', 'blackjack', 'draw', 'loss', 'bust', 'surrender')
+
+
+def compare(points: int, dealer_points: int, dealer_busted: bool) -> int:
+    """
+    Compare points of player with points of Dealer
+    :param points: points of player
+    :param dealer_points: points of Dealer
+    :param dealer_busted: is Dealer busted or no
+    :return: WIN, DRAW or LOSS
+    """
+    if points > dealer_points or dealer_busted:
+        return WIN
+    if points == dealer_points:
+        return DRAW
+    return LOSS
+
+
+class Strategy(ABC):
+    """
+    Abstract class of callbacks, which make decisions for one seat instead of input()
+    """
+    def make_bet(self) -> int:
+        """
+        Bet of seat in new round
+        :return: bet
+        """
+        return 100
+
+    @abstractmethod
+    def decide(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> int:
+        """
+        Choose action of seat
+        :param points: points of hand
+        :param soft: True if hand has Ace, which is counted as 11
+        :param pair: True if hand has two cards with same value
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param options: bit mask of legal actions (CAN_HIT, CAN_STAND, ...)
+        :return: one of legal actions
+        """
+        pass
+
+
+class ThresholdStrategy(Strategy):
+    """
+    Strategy, which takes cards until it has max_value points (like Bot.card_take_cycle)
+    """
+    def __init__(self, max_value: int = 17, surrender_value: range = range(0)) -> None:
+        """
+        Init method of ThresholdStrategy class
+        :param max_value: points, on which strategy stops taking cards
+        :param surrender_value: points, with which strategy surrenders
+        """
+        self.max_value = max_value
+        self.surrender_value = surrender_value
+
+    def decide(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> int:
+        if options & CAN_REWARD:
+            return STAND  # Bot takes no card on 21, so its BlackJack is paid after Dealer's choice
+        if options & CAN_SURRENDER and points in self.surrender_value:
+            return SURRENDER
+        return HIT if points < self.max_value else STAND
+
+
+class PolicyStrategy(ThresholdStrategy):
+    """
+    Strategy with fixed rules for each choice of Bot: stand threshold, surrender points, pairs to split and insurance
+    """
+    def __init__(self, max_value: int = 17, surrender_value: range = range(0), split_values: frozenset = frozenset(),
+                 insurance: bool = False) -> None:
+        """
+        Init method of PolicyStrategy class
+        :param max_value: points, on which strategy stops taking cards
+        :param surrender_value: points, with which strategy surrenders
+        :param split_values: values of pair cards, which are split (Ace is 11)
+        :param insurance: does strategy take insurance
+        """
+        super().__init__(max_value, surrender_value)
+        self.split_values = split_values
+        self.insurance = insurance
+
+    def __repr__(self) -> str:
+        """
+        Repr method of PolicyStrategy class
+        :return: rules of strategy in one string
+        """
+        surrender = f'{self.surrender_value.start}-{self.surrender_value.stop - 1}' if self.surrender_value else '-'
+        split = ','.join(map(str, sorted(self.split_values))) or '-'
+        insurance = 'yes' if self.insurance else 'no'
+        return f'stand {self.max_value}, surrender {surrender}, split {split}, insurance {insurance}'
+
+    def decide(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> int:
+        if options & CAN_REWARD:
+            return STAND
+        if options & CAN_INSURANCE and self.insurance:
+            return INSURANCE
+        if options & CAN_SPLIT and (11 if soft else points // 2) in self.split_values:
+            return SPLIT
+        return super().decide(points, soft, pair, upcard, options)
+
+
+class BotStrategy(ThresholdStrategy):
+    """
+    Strategy with the same random choices as Bot.make_choice
+    """
+    def __init__(self, rng: Random | None = None) -> None:
+        """
+        Init method of BotStrategy class
+        :param rng: random generator for choices (global one if not given)
+        """
+        self.randint = randint if rng is None else rng.randint
+        super().__init__(self.randint(18, 20), range(14, 18))
+
+    def decide(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> int:
+        if options == HIT_OR_STAND:
+            return HIT if points < self.max_value else STAND
+
+        # only legal choices: Bot, who chose to take cards with max_value points, doesn't take them (so it stands)
+        choices = [HIT if points < self.max_value and options & CAN_HIT else STAND]
+        if points >= self.max_value:
+            choices.append(STAND)
+        if options & CAN_SURRENDER and points in self.surrender_value:
+            choices.append(SURRENDER)
+        if options & CAN_SPLIT:
+            choices.append(SPLIT)
+        if options & CAN_INSURANCE:
+            choices.append(INSURANCE)
+        return choices[self.randint(0, len(choices) - 1)]
+
+
+# result of one hand in round (collections.namedtuple is used, because typing is slow to import)
+SeatResult = namedtuple('SeatResult', ('seat', 'outcome', 'points', 'bet', 'payout'))
+# result of one round, seats is list of SeatResult
+RoundResult = namedtuple('RoundResult', ('dealer_points', 'dealer_busted', 'seats'))
+
+
+# legal actions of each first choice of hand (hit or reward, split and insurance are added by hand)
+FIRST_CHOICE = CAN_STAND | CAN_SURRENDER | CAN_DOUBLE
+
+
+class Engine:
+    """
+    Headless BlackJack table with all rules of round. Round is played by phases (deal, choice_steps, dealer_play,
+    settle), so Game plays them with input() and output between phases, and play_round plays them with strategies
+    """
+    def __init__(self, strategies: list[Strategy], deck: CompactDeck | None = None,
+                 max_splits: int = MAX_SPLITS) -> None:
+        """
+        Init method of Engine class
+        :param strategies: strategy of each seat (for play_round and play)
+        :param deck: deck of table (new one is created if not given)
+        :param max_splits: how many times each seat can split hands in one round
+        """
+        self.strategies = strategies
+        self.deck = deck if deck is not None else CompactDeck()
+        self.max_splits = max_splits
+        self.hands = []  # hands of round in order of playing them (hands of split follow hand of the same seat)
+        # hands of all seats, which are used again each round: seat has max_splits + 1 hands from
+        # seat * (max_splits + 1), and used[seat] of them are in round
+        self.pool = []
+        self.used = []
+        self.hand = None  # hand, which is played now
+        self.dealer = Hand()
+        self.upcard = 0  # value of Dealer's open card (Ace is 11)
+
+    def deal(self, bets: list[int]) -> None:
+        """
+        Hand out two cards to each seat and then to Dealer (deck should be shuffled before it, if it's needed)
+        :param bets: bet of each seat
+        :return: Nothing
+        """
+        take = self.deck.take_card_from_deck
+        size = self.max_splits + 1
+        if len(self.pool) != len(bets) * size:
+            self.pool = [SeatHand(index // size) for index in range(len(bets) * size)]
+            self.used = [1] * len(bets)
+        pool = self.pool
+        used = self.used
+        hands = self.hands
+        hands.clear()
+        for seat, bet in enumerate(bets):
+            hand = pool[seat * size]
+            hand.reset(seat, bet)
+            hand.add(take())
+            hand.add(take())
+            hand.blackjack = hand.points == 21
+            used[seat] = 1
+            hands.append(hand)
+        dealer = self.dealer
+        dealer.clear()
+        dealer.add(take())
+        dealer.add(take())
+        self.upcard = CARD_CODE_VALUES[dealer.cards[0]]
+
+    def choice_steps(self):
+        """
+        Make choices for each hand of each seat. It's generator, which yields DECIDE requests
+        (kind, seat, points, soft, pair, upcard, options) for hand in self.hand and gets action by send().
+        Split hand gives its second card to next free hand of seat in pool (after the last hand of seat), and new
+        hand takes its second card in its turn. Insurance is offered only in first choice of seat, and seat can
+        have up to max_splits + 1 hands. Action, which isn't in options of request, raises ValueError (it isn't
+        dealt). After splits hands is made again from pool in order of playing
+        :return: Nothing
+        """
+        pool = self.pool
+        used = self.used
+        take = self.deck.take_card_from_deck
+        upcard = self.upcard
+        insurance = CAN_INSURANCE if upcard == 11 else 0
+        size = self.max_splits + 1
+        split = False
+        index = end = 0  # index of hand, which is played now, and end of hands of its seat in pool
+        seat = -1
+        while 1:
+            if index == end:  # next seat
+                seat += 1
+                if seat == len(used):
+                    break
+                index = seat * size
+                end = index + used[seat]
+                continue
+            self.hand = hand = pool[index]
+            if len(hand.cards) == 1:  # hand of split takes second card in its turn
+                hand.add(take())
+                hand.blackjack = hand.points == 21
+
+            options = FIRST_CHOICE | (CAN_REWARD if hand.blackjack else CAN_HIT)
+            if hand.pair and used[seat] < size:
+                options |= CAN_SPLIT
+            if insurance and used[seat] == 1 and not hand.actions:
+                options |= CAN_INSURANCE
+            action = yield DECIDE, hand.seat, hand.points, hand.soft, hand.pair, upcard, options
+            if not options >> action & 1:
+                raise ValueError(f'action {action} isn\'t legal')
+            hand.actions |= 1 << action
+            if action == INSURANCE:
+                hand.ins_bet = hand.bet // 2
+                options &= ~CAN_INSURANCE
+                action = yield DECIDE, hand.seat, hand.points, hand.soft, hand.pair, upcard, options
+                if not options >> action & 1:
+                    raise ValueError(f'action {action} isn\'t legal')
+                hand.actions |= 1 << action
+
+            if action == HIT:
+                while 1:
+                    hand.add(take())
+                    if hand.points > 21:
+                        hand.outcome = BUST
+                        break
+                    if hand.points == 21:
+                        break
+                    action = yield DECIDE, hand.seat, hand.points, hand.soft, False, upcard, HIT_OR_STAND
+                    if action != HIT:
+                        if action != STAND:
+                            raise ValueError(f'action {action} isn\'t legal')
+                        hand.actions |= CAN_STAND
+                        break
+            elif action == SURRENDER:
+                hand.outcome = SURRENDERED
+                hand.payout = hand.bet // 2
+            elif action == DOUBLE:
+                hand.bet *= 2
+                hand.add(take())
+                if hand.points > 21:
+                    hand.outcome = BUST
+            elif action == SPLIT:
+                second = pool[end]
+                second.reset(seat, hand.bet)
+                second.actions = CAN_SPLIT
+                second.add(hand.pop())
+                hand.number = hand.number or 1
+                end += 1
+                used[seat] += 1
+                second.number = used[seat]
+                split = True
+                hand.add(take())
+                hand.blackjack = hand.points == 21
+                continue  # the same hand chooses again with new card
+            elif action == REWARD:
+                hand.outcome = BLACKJACK
+                hand.payout = 2 * hand.bet
+            index += 1
+        self.hand = None
+        if split:
+            hands = self.hands
+            hands.clear()
+            for seat, count in enumerate(used):
+                hands.extend(pool[seat * size:seat * size + count])
+
+    def load_hands(self, hands: list[SeatHand], seats: int) -> None:
+        """
+        Put hands of round into pool (for example, hands of restored table), so next round uses them again
+        :param hands: hands in order of playing them
+        :param seats: number of seats of table
+        :return: Nothing
+        """
+        size = self.max_splits + 1
+        self.pool = [SeatHand(index // size) for index in range(seats * size)]
+        self.used = [0] * seats
+        for hand in hands:
+            self.pool[hand.seat * size + self.used[hand.seat]] = hand
+            self.used[hand.seat] += 1
+        self.hands = hands
+
+    def dealer_play(self) -> None:
+        """
+        Dealer takes cards while he has less than 17 points (or soft 17 points, if DEALER_HITS_SOFT_17)
+        :return: Nothing
+        """
+        dealer = self.dealer
+        take = self.deck.take_card_from_deck
+        while dealer.points < 17 or DEALER_HITS_SOFT_17 and dealer.points == 17 and dealer.soft:
+            dealer.add(take())
+
+    def settle(self) -> RoundResult:
+        """
+        Count outcome and payout of each hand, which didn't leave game, and pay insurance bets
+        :return: result of each hand and of Dealer
+        """
+        dealer = self.dealer
+        dealer_points = dealer.points
+        dealer_busted = dealer_points > 21
+        dealer_blackjack = len(dealer.cards) == 2 and dealer_points == 21
+        seats = []
+        for hand in self.hands:
+            if hand.outcome < 0:
+                outcome = compare(hand.points, dealer_points, dealer_busted)
+                if outcome == WIN:
+                    if hand.blackjack:
+                        hand.outcome = BLACKJACK
+                        hand.payout = 3 * hand.bet
+                    else:
+                        hand.outcome = WIN
+                        hand.payout = 2 * hand.bet
+                elif outcome == DRAW:
+                    hand.outcome = DRAW
+                    hand.payout = hand.bet
+                else:
+                    hand.outcome = LOSS
+            if hand.ins_bet:
+                if dealer_blackjack:
+                    hand.payout += 3 * hand.ins_bet
+                seats.append(SeatResult(hand.seat, hand.outcome, hand.points, hand.bet + hand.ins_bet, hand.payout))
+            else:
+                seats.append(SeatResult(hand.seat, hand.outcome, hand.points, hand.bet, hand.payout))
+        return RoundResult(dealer_points, dealer_busted, seats)
+
+    def round_steps(self, seats: int):
+        """
+        Play one round: shuffle deck if it's needed, ask bets, hand out cards, make choices, play Dealer and count
+        results. It's generator, which yields requests (kind, seat, points, soft, pair, upcard, options) and gets
+        answers to them by send(): bet for BET request and action for DECIDE request. So round can be
+        played by remote players (server module)
+        :param seats: number of seats
+        :return: result of each hand and of Dealer (in StopIteration)
+        """
+        self.deck.shuffle_if_needed()
+        bets = []
+        for seat in range(seats):
+            bets.append((yield BET, seat, 0, False, False, 0, 0))
+        self.deal(bets)
+        yield from self.choice_steps()
+        self.dealer_play()
+        return self.settle()
+
+    def play_round(self) -> RoundResult:
+        """
+        Play one round with strategies of seats
+        :return: result of each hand and of Dealer
+        """
+        strategies = self.strategies
+        self.deck.shuffle_if_needed()
+        self.deal([strategy.make_bet() for strategy in strategies])
+        steps = self.choice_steps()
+        try:
+            kind, seat, points, soft, pair, upcard, options = next(steps)
+            while 1:
+                kind, seat, points, soft, pair, upcard, options = \
+                    steps.send(strategies[seat].decide(points, soft, pair, upcard, options))
+        except StopIteration:
+            pass
+        self.dealer_play()
+        return self.settle()
+
+    def play(self, rounds: int) -> list[RoundResult]:
+        """
+        Play a few rounds
+        :param rounds: number of rounds
+        :return: list of results of each round
+        """
+        return [self.play_round() for _ in range(rounds)]
@@ -1,157 +1,374 @@
-"""
-BlackJack module with all game algorythm
-"""
-
-import players
-from random import randint
-from colorama import Fore
-
-
-class Game:
-    """
-    Game class in BlackJack
-    """
-
-    def __init__(self) -> None:
-        """
-        Init method of Game class
-        """
-        self.list_of_players = []
-
-    def _create_players(self) -> None:
-        """
-        Create list of Player class objects
-        :return: Nothing
-        """
-        while 1:
-            try:
-                amount_of_bots = int(input(Fore.YELLOW + '\nEnter amount of bots (up to 4): ' + Fore.WHITE))
-                if 4 >= amount_of_bots >= 0:
-                    break
-                else:
-                    print(Fore.RED + 'Incorrect value. Try again.')
-            except ValueError:
-                print(Fore.RED + 'Try again.')
-
-        for _ in range(amount_of_bots):
-            self.list_of_players.append(players.Bot())
-
-        self.list_of_players.insert(randint(0, amount_of_bots), players.Player())
-        self.list_of_players.append(players.Dealer())
-
-    def _hand_out_cards(self) -> None:
-        """
-        Hand out cards to each player and check for BlackJack
-        :return: Nothing
-        """
-        print(Fore.MAGENTA + '\nDealer hands out cards' + Fore.WHITE)
-        for player in self.list_of_players:
-            player.take_card()
-            player.take_card()
-            print(player.show_first_cards())
-            player.blackjack = True if player.check_points() == 21 else False
-
-        if self.list_of_players[-1].my_cards[0].picture == 'Ace':
-            players.AbstractPlayer.enable_insurance = True
-        if self.list_of_players[-1].blackjack:
-            players.AbstractPlayer.ins_work = True
-
-    def _player_choice(self) -> None:
-        """
-        Making choice for each player and checking for split
-        :return: Nothing
-        """
-        do_if_split = False
-        card_of_second_hand = None
-
-        for player in self.list_of_players:
-            if not isinstance(player, players.Dealer):
-
-                if not do_if_split:
-                    player.make_choice()
-                    if player.split:
-                        if isinstance(player, players.Player):
-                            self.list_of_players.insert(self.list_of_players.index(player) + 1,
-                                                        players.Player(f'{player.name}\'s right hand'))
-                        else:
-                            self.list_of_players.insert(self.list_of_players.index(player) + 1,
-                                                        players.Bot(f'{player.name}\'s right hand'))
-                        player.name = f'{player.name}\'s left hand'
-                        card_of_second_hand = player.my_cards.pop()
-                        player.take_card()
-                        do_if_split = True
-                        player.enough_split = True
-                        player.blackjack = True if player.check_points() == 21 else False
-                        player.make_choice()
-                else:
-                    player.my_cards.append(card_of_second_hand)
-                    player.take_card()
-                    do_if_split = False
-                    player.enough_split = True
-                    player.blackjack = True if player.check_points() == 21 else False
-                    player.make_choice()
-            else:
-                player.make_choice()
-
-    def _left_game_check(self) -> None:
-        """
-        Few-time check of players, which left game
-        :return: Nothing
-        """
-        stop = 1
-
-        while stop != 0:
-            stop = 0
-            for player in self.list_of_players[:-1]:
-                if player.left_game:
-                    self.list_of_players.remove(player)
-                    stop += 1
-
-    def _show_cards(self) -> None:
-        """
-        Print all players cards and show if player's insurance bet was paid
-        :return: Nothing
-        """
-        print(self.list_of_players[-1].show_cards())  # show cards of Dealer
-
-        for player in self.list_of_players[:-1]:
-            if isinstance(player, players.Player):
-                if player.got_ins:
-                    print(Fore.LIGHTMAGENTA_EX + f'+{3 * player.ins_bet}$ (insurance) - {player.name}'
-                          + Fore.WHITE)
-            print(player.show_cards())
-
-    def _results(self) -> None:
-        """
-        Show who lose, won or drew
-        :return: Nothing
-        """
-        for player in self.list_of_players:
-            if not isinstance(player, players.Dealer):
-                if player.check_points() > self.list_of_players[-1].check_points() or self.list_of_players[-1].busted:
-                    print(f'Player {player.name} won.')
-                    if isinstance(player, players.Player):
-                        if player.blackjack:
-                            player.bet *= 1.5
-                        print(player.win())
-
-                elif player.check_points() == self.list_of_players[-1].check_points():
-                    print(f'Player {player.name} drew with the {self.list_of_players[-1].name}.')
-                    if isinstance(player, players.Player):
-                        print(player.draw())
-                else:
-                    print(f'Player {player.name} loses.')
-            else:
-                players.Dealer.my_cards.clear()  # Dealer drops cards
-
-    def play(self) -> None:
-        """
-        Game algorythm
-        :return: Nothing
-        """
-        self._create_players()
-        self._hand_out_cards()
-        self._player_choice()
-        self._left_game_check()
-        self._show_cards()
-        self._results()
+"""
+BlackJack module with all game algorythm
+"""
+
+import deck
+import players
+from engine import Engine, WIN, BLACKJACK, DRAW, LOSS, BUST, SPLIT, INSURANCE, SURRENDER
+from consts import MAX_SPLITS
+from history import HistoryWriter, DEALER_SEAT, NO_OUTCOME
+from ledger import Ledger, RunningStats
+from array import array
+from bisect import bisect_right
+from contextlib import redirect_stdout
+from metrics import Metrics
+from os import devnull
+from random import Random
+from render import Render, QUIET, VERBOSE
+from strategy import BasicStrategy
+from time import perf_counter
+from colorama import Fore
+
+
+# counters of metrics for actions of players
+ACTION_COUNTERS = {SPLIT: 'splits', INSURANCE: 'insurances', SURRENDER: 'surrenders'}
+
+
+class Game:
+    """
+    Game class in BlackJack. Rules of round are played by engine.Engine, and Game asks players for bets and
+    choices, shows what happens and settles results between phases of engine
+    """
+
+    def __init__(self, basic_strategy: bool = False, amount_of_bots: int | None = None, human: bool = True,
+                 metrics: Metrics | None = None, history: HistoryWriter | None = None, seed: int | None = None,
+                 max_splits: int = MAX_SPLITS, verbosity: int = VERBOSE, advisor_bots: bool = False) -> None:
+        """
+        Init method of Game class
+        :param basic_strategy: should bots play by basic strategy table instead of random choices
+        :param amount_of_bots: amount of bots (any amount, or up to 4 asked on first round if not given)
+        :param human: is there Player at table or only bots
+        :param metrics: metrics, where time of phases and events are counted (disabled if not given)
+        :param history: writer of binary hand history, where each round is recorded (disabled if not given)
+        :param seed: seed of table, so each round can be played again (session isn't reproducible if not given)
+        :param max_splits: how many times each player can split hands in one round
+        :param verbosity: level of output (QUIET, SUMMARY or VERBOSE from render), messages of Player are always shown
+        :param advisor_bots: should bots choose actions with the highest expected value for cards left in deck
+        """
+        self.list_of_players = []
+        self.seats = []  # players of table (with Dealer), index of player is seat of its hands in engine
+        self.max_splits = max_splits
+        self.bets = []  # bets of players in round, which is played now
+        self.round_hands = []  # hands of round in order of playing them (without hands, which left game)
+        self.left_hands = []  # hands of round, which left game (they are kept for history)
+        self.bot_strategy = BasicStrategy() if basic_strategy else None
+        self.amount_of_bots = amount_of_bots
+        self.human = human
+        self.metrics = metrics
+        self.history = history
+        self.render = Render(verbosity)  # output of each phase is written by one call
+        self.ledger = Ledger()  # bankroll of each seat in cents
+        self.stats = RunningStats()  # statistics of net results of all hands of table (in $)
+        self.outcomes = [0] * 6  # counters of outcomes of hands, indexed by engine outcomes (WIN, BLACKJACK, ...)
+        # own deck and random generators of table (not global ones, so snapshot keeps their state). If table is
+        # seeded, each shoe and choices of bots from its first round are seeded by seed of table and number of shoe
+        # or round
+        self.seed = seed
+        self.rng = Random()
+        self.deck = deck.CompactDeck(None if seed is not None else Random(), seed=seed)
+        self.engine = Engine([], self.deck, max_splits)  # rules of round (choices are made by players)
+        self.round = 0  # number of round, which is played now
+        self.shoe = -1  # number of shoe of deck in start of round, which is played now
+        # (shoe, round, position) for first round of each shoe of seeded table, so round can be found by them
+        self.shoe_starts = array('I')
+        # bets and choices of Player in each round, so replayed rounds are played without asking again
+        self.answers = []
+        self.replaying = False
+        self._recorded = None  # answers of round, which is replayed
+        # expected values of actions for cards left in deck: hints of Player and choices of bots (if advisor_bots).
+        # Advisor is imported and made only for tables, which use it
+        self.advisor = None
+        if human or advisor_bots:
+            from advisor import AdvisorStrategy
+            self.advisor = AdvisorStrategy(self.engine)
+        if advisor_bots:
+            self.bot_strategy = self.advisor
+
+    def _create_players(self) -> None:
+        """
+        Create list of Player class objects
+        :return: Nothing
+        """
+        if self.seed is not None:
+            self.rng.seed(f'{self.seed}:players')
+        amount_of_bots = self.amount_of_bots
+        while amount_of_bots is None:
+            try:
+                amount_of_bots = int(self.render.ask(Fore.YELLOW + '\nEnter amount of bots (up to 4): ' + Fore.WHITE))
+                if not 4 >= amount_of_bots >= 0:
+                    amount_of_bots = None
+                    self.render.line(Fore.RED + 'Incorrect value. Try again.')
+            except ValueError:
+                self.render.line(Fore.RED + 'Try again.')
+
+        for name in players.bot_names(amount_of_bots, self.rng):
+            self.list_of_players.append(players.Bot(Fore.GREEN + name + Fore.WHITE, self.bot_strategy, self.rng,
+                                                    self.render))
+
+        if self.human:
+            self.list_of_players.insert(self.rng.randint(0, amount_of_bots), players.Player(render=self.render,
+                                                                                           advisor=self.advisor))
+        self.list_of_players.append(players.Dealer(self.render))
+        self.seats = self.list_of_players.copy()
+        for seat, player in enumerate(self.seats):
+            player.seat = seat
+
+    def _new_round(self) -> None:
+        """
+        Shuffle deck of table if it's needed and take bets of players. For seeded table first round of each shoe
+        is remembered, and random generator is seeded by its number
+        :return: Nothing
+        """
+        self.deck.shuffle_if_needed()
+        if self.seed is not None and self.shoe != self.deck.shoes - 1:
+            self.shoe = self.deck.shoes - 1
+            if not self.shoe_starts or self.shoe_starts[-3] < self.shoe:
+                self.shoe_starts.extend((self.shoe, self.round, self.deck.position))
+            self.rng.seed(f'{self.seed}:{self.round}')
+        if not self.human:
+            self.round += 1
+            self.bets = [player.make_bet() for player in self.list_of_players[:-1]]
+            return
+
+        if self.replaying:
+            self._recorded = iter(self.answers[self.round])
+        else:
+            del self.answers[self.round:]  # round is played again after replay, so its old answers are replaced
+            self.answers.append(array('H'))
+        self.round += 1
+        self.bets = [self._answer(player.make_bet) if isinstance(player, players.Player) else player.make_bet()
+                     for player in self.list_of_players[:-1]]
+
+    def _answer(self, ask, *args) -> int:
+        """
+        Ask Player for bet or choice and remember answer. While table is replayed, remembered answer is given
+        instead of asking again
+        :param ask: method of Player (make_bet or make_choice)
+        :param args: arguments of method
+        :return: answer of Player
+        """
+        if self.replaying:
+            return next(self._recorded)
+        answer = ask(*args)
+        self.answers[-1].append(answer)
+        return answer
+
+    def _use_render(self, render: Render) -> None:
+        """
+        Change output of table and its players
+        :param render: new output
+        :return: Nothing
+        """
+        self.render = render
+        for player in self.seats:
+            player.render = render
+
+    def replay(self, round_number: int, shoe_starts: array | None = None) -> None:
+        """
+        Move seeded table to start of round, which was played before, so next play() plays the same round.
+        Deck and random generator are seeded again as in first round of shoe, and only rounds from start of
+        this shoe are played (without output, and Player's bets and choices are taken from answers)
+        :param round_number: number of round (from 0)
+        :param shoe_starts: shoe_starts of table, where round was played (this table's ones if not given)
+        :return: Nothing
+        """
+        if self.seed is None:
+            raise ValueError('only seeded table can be replayed')
+        if shoe_starts is not None:
+            self.shoe_starts = array('I', shoe_starts)
+        starts = self.shoe_starts
+        index = bisect_right(starts[1::3], round_number) - 1
+        if index < 0:
+            raise ValueError(f'round {round_number} wasn\'t played')
+        if self.human and round_number > len(self.answers):
+            raise ValueError(f'answers of Player before round {round_number} weren\'t recorded')
+
+        self.shoe, self.round, position = starts[3 * index:3 * index + 3]
+        self.deck.seek(self.shoe, position)
+        history, self.history = self.history, None
+        metrics, self.metrics = self.metrics, None
+        render = self.render
+        self._use_render(Render(QUIET))
+        ledger, self.ledger = self.ledger, Ledger()  # rounds, which are played again, aren't settled twice
+        stats, self.stats = self.stats, RunningStats()
+        outcomes, self.outcomes = self.outcomes, [0] * 6
+        self.replaying = True
+        try:
+            with open(devnull, 'w') as output, redirect_stdout(output):
+                if not self.seats:
+                    self._create_players()
+                self.rng.seed(f'{self.seed}:{self.round}')
+                while self.round < round_number:
+                    self.play()
+                self.render.flush()
+        finally:
+            self.history = history
+            self.metrics = metrics
+            self._use_render(render)
+            self.replaying = False
+            self._recorded = None
+            self.ledger = ledger
+            self.stats = stats
+            self.outcomes = outcomes
+
+    def _hand_out_cards(self) -> None:
+        """
+        Hand out cards to each player and Dealer
+        :return: Nothing
+        """
+        engine = self.engine
+        engine.deal(self.bets)
+        self.round_hands.clear()  # hands of previous round
+        self.left_hands.clear()
+        render = self.render
+        if render.verbose:
+            render.line(Fore.MAGENTA + '\nDealer hands out cards' + Fore.WHITE)
+            for player, hand in zip(self.list_of_players, engine.hands):
+                render.line(player.show_first_cards(hand))
+            render.line(self.list_of_players[-1].show_first_cards(engine.dealer))
+
+    def _player_choice(self) -> None:
+        """
+        Making choice for each hand of each player (engine asks for them and plays them), and then choice of Dealer
+        :return: Nothing
+        """
+        engine = self.engine
+        seats = self.list_of_players
+        metrics = self.metrics
+        human = self.human
+        steps = engine.choice_steps()
+        request = next(steps, None)
+        while request is not None:
+            hand = engine.hand
+            player = seats[hand.seat]
+            cards = len(hand)
+            if human and isinstance(player, players.Player):
+                action = self._answer(player.make_choice, hand, engine.upcard, request[6])
+            else:
+                action = player.make_choice(hand, engine.upcard, request[6])
+            try:
+                request = steps.send(action)
+            except StopIteration:
+                request = None
+            player.show_action(hand, action, cards)
+            if metrics is not None and action in ACTION_COUNTERS:
+                metrics.count(ACTION_COUNTERS[action])
+
+        engine.dealer_play()
+        seats[-1].show_draws(engine.dealer)
+        if metrics is not None:
+            metrics.count('cards_drawn', sum(len(hand) for hand in engine.hands) + len(engine.dealer))
+            metrics.count('busts', sum(hand.outcome == BUST for hand in engine.hands) + engine.dealer.busted)
+
+    def _left_game_check(self) -> None:
+        """
+        Split hands of round into hands, which are in game, and left_hands (in one pass)
+        :return: Nothing
+        """
+        round_hands = self.round_hands
+        left_hands = self.left_hands
+        round_hands.clear()
+        left_hands.clear()
+        for hand in self.engine.hands:
+            if hand.left_game:
+                left_hands.append(hand)
+            else:
+                round_hands.append(hand)
+
+    def _show_cards(self) -> None:
+        """
+        Print all players cards and show if player's insurance bet was paid
+        :return: Nothing
+        """
+        render = self.render
+        if not render.verbose:
+            return
+        dealer = self.engine.dealer
+        render.line(self.list_of_players[-1].show_cards(dealer))  # show cards of Dealer
+        dealer_blackjack = len(dealer) == 2 and dealer.points == 21
+
+        for hand in self.round_hands:
+            player = self.list_of_players[hand.seat]
+            if hand.ins_bet and dealer_blackjack:
+                render.line(Fore.LIGHTMAGENTA_EX + f'+{3 * hand.ins_bet}$ (insurance) - {player.name}' + Fore.WHITE)
+            render.line(player.show_cards(hand))
+
+    def _results(self) -> None:
+        """
+        Show who lose, won or drew and settle bets of all hands (with hands, which left game) in ledger, statistics
+        and history
+        :return: Nothing
+        """
+        engine = self.engine
+        result = engine.settle()
+        seats = self.list_of_players
+        summary = self.render.summary
+        line = self.render.line
+        if summary or self.human:
+            dealer = seats[-1]
+            for hand in self.round_hands:
+                player = seats[hand.seat]
+                is_player = isinstance(player, players.Player)
+                if hand.outcome == WIN or hand.outcome == BLACKJACK:
+                    if summary:
+                        line(f'Player {player.hand_name(hand)} won.')
+                    if is_player:
+                        line(player.win(hand))
+                elif hand.outcome == DRAW:
+                    if summary:
+                        line(f'Player {player.hand_name(hand)} drew with the {dealer.name}.')
+                    if is_player:
+                        line(player.draw(hand))
+                elif summary and hand.outcome == LOSS:
+                    line(f'Player {player.hand_name(hand)} loses.')
+
+        hands = engine.hands
+        self.ledger.settle_hands(hands)
+        self.stats.add_hands(hands)
+        outcomes = self.outcomes
+        for hand in hands:
+            outcomes[hand.outcome] += 1
+
+        history = self.history
+        if history is not None:
+            for hand, seat in zip(hands, result.seats):
+                history.write(seat.seat, hand.actions, seat.outcome, seat.points, bytes(hand.cards), seat.bet,
+                              seat.payout)
+            history.write(DEALER_SEAT, 0, NO_OUTCOME, result.dealer_points, bytes(engine.dealer.cards), 0, 0)
+            history.next_round()
+
+    def play(self) -> None:
+        """
+        Game algorythm
+        :return: Nothing
+        """
+        if self.metrics is not None:
+            self._play_with_metrics()
+            return
+
+        if not self.seats:
+            self._create_players()
+        for phase in (self._new_round, self._hand_out_cards, self._player_choice, self._left_game_check,
+                      self._show_cards, self._results):
+            phase()
+            self.render.flush()
+
+    def _play_with_metrics(self) -> None:
+        """
+        Game algorythm, where time of each phase is measured
+        :return: Nothing
+        """
+        metrics = self.metrics
+        if not self.seats:
+            start = perf_counter()
+            self._create_players()
+            self.render.flush()
+            metrics.observe('_create_players', perf_counter() - start)
+
+        for phase in (self._new_round, self._hand_out_cards, self._player_choice, self._left_game_check,
+                      self._show_cards, self._results):
+            start = perf_counter()
+            phase()
+            self.render.flush()
+            metrics.observe(phase.__name__, perf_counter() - start)
+        metrics.count('rounds')
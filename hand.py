@@ -0,0 +1,164 @@
+"""
+BlackJack module with class of player's hand
+"""
+
+from deck import CARD_CODE_VALUES
+
+
+class Hand:
+    """
+    Card codes of hand (see deck.CompactDeck), which counts points when cards are added or removed, so points
+    of hand are known without summing all cards and without changing values of Aces. Hand isn't list: cards are
+    changed only by add, pop and clear, so points can't be passed by (hand can be read like list)
+    """
+    __slots__ = ('cards', 'hard', 'aces', 'points', 'soft')
+
+    def __init__(self, cards: tuple = ()) -> None:
+        """
+        Init method of Hand class
+        :param cards: card codes, which are in hand from start
+        """
+        self.cards = []
+        self.hard = 0  # points of hand, where each Ace is counted as 1
+        self.aces = 0  # amount of Aces in hand
+        self.points = 0  # points of hand, where one Ace is counted as 11 if it doesn't bust hand
+        self.soft = False  # is one of Aces in hand counted as 11 or no
+        for card in cards:
+            self.add(card)
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __getitem__(self, index: int) -> int:
+        return self.cards[index]
+
+    @staticmethod
+    def card_value(card: int) -> int:
+        """
+        Get value of card in hand
+        :param card: code of card
+        :return: value of card (Ace is 11)
+        """
+        return CARD_CODE_VALUES[card]
+
+    @property
+    def busted(self) -> bool:
+        """
+        Has hand more than 21 points or no
+        :return: True or False
+        """
+        return self.hard > 21
+
+    @property
+    def pair(self) -> bool:
+        """
+        Has hand two cards with the same value or no
+        :return: True or False
+        """
+        cards = self.cards
+        return len(cards) == 2 and CARD_CODE_VALUES[cards[0]] == CARD_CODE_VALUES[cards[1]]
+
+    def _count(self, card: int, sign: int) -> None:
+        """
+        Add or subtract value of card from points of hand
+        :param card: code of card, which was added or removed
+        :param sign: 1 if card was added, -1 if removed
+        :return: Nothing
+        """
+        value = CARD_CODE_VALUES[card]
+        if value == 11:
+            self.aces += sign
+            self.hard += sign
+        else:
+            self.hard += sign * value
+        self.soft = self.aces > 0 and self.hard <= 11
+        self.points = self.hard + 10 if self.soft else self.hard
+
+    def add(self, card: int) -> None:
+        """
+        Add card to hand
+        :param card: code of card
+        :return: Nothing
+        """
+        self.cards.append(card)
+        value = CARD_CODE_VALUES[card]  # the same as _count(card, 1), it's the most frequent call of round
+        if value == 11:
+            self.aces += 1
+            value = 1
+        self.hard = hard = self.hard + value
+        if self.aces and hard <= 11:
+            self.soft = True
+            self.points = hard + 10
+        else:
+            self.soft = False
+            self.points = hard
+
+    def pop(self, index: int = -1) -> int:
+        """
+        Remove card from hand (last one by default)
+        :param index: index of card
+        :return: code of removed card
+        """
+        card = self.cards.pop(index)
+        self._count(card, -1)
+        return card
+
+    def clear(self) -> None:
+        """
+        Remove all cards from hand
+        :return: Nothing
+        """
+        self.cards.clear()
+        self.hard = self.aces = self.points = 0
+        self.soft = False
+
+
+class SeatHand(Hand):
+    """
+    Hand of seat in round with own bet, actions and result, so one seat can play few hands after splits
+    """
+    __slots__ = ('seat', 'number', 'bet', 'ins_bet', 'blackjack', 'actions', 'outcome', 'payout')
+
+    def __init__(self, seat: int = 0, bet: int = 0) -> None:
+        """
+        Init method of SeatHand class
+        :param seat: index of seat, which plays this hand
+        :param bet: bet of hand
+        """
+        super().__init__()
+        self.seat = seat
+        self.number = 0  # number of hand of seat after splits (from 1), 0 if seat didn't split
+        self.bet = bet
+        self.ins_bet = 0  # insurance bet (it's made once for all hands of seat)
+        self.blackjack = False
+        self.actions = 0  # bit mask of actions, which were made with this hand (CAN_HIT, CAN_DOUBLE...)
+        self.outcome = -1  # outcome of hand (WIN, BUST... from engine), -1 until hand left game or round is settled
+        self.payout = 0
+
+    def reset(self, seat: int, bet: int) -> None:
+        """
+        Clear hand for new round, so the same object is used again instead of new one
+        :param seat: index of seat, which plays this hand
+        :param bet: bet of hand
+        :return: Nothing
+        """
+        self.clear()
+        self.seat = seat
+        self.number = 0
+        self.bet = bet
+        self.ins_bet = 0
+        self.blackjack = False
+        self.actions = 0
+        self.outcome = -1
+        self.payout = 0
+
+    @property
+    def left_game(self) -> bool:
+        """
+        Did hand leave game before Dealer's choice (bust, surrender or instant reward) or no
+        :return: True or False
+        """
+        return self.outcome >= 0
@@ -0,0 +1,216 @@
+"""
+BlackJack module with streaming binary history of hands and memory-mapped reader of it.
+
+History file starts with MAGIC header (of record size) and then has one fixed-width record for each hand:
+    round      uint32    number of round
+    seat       uint16    number of seat at table (DEALER_SEAT for Dealer)
+    actions    uint8     bit mask of engine actions, which were made (CAN_HIT, CAN_DOUBLE...)
+    outcome    uint8     engine outcome (WIN, BLACKJACK...) or NO_OUTCOME for Dealer
+    points     uint8     points of hand
+    cards      uint8     number of cards in hand
+    codes      12 bytes  card codes of CompactDeck (unused bytes are EMPTY_CARD)
+    bet        int32     bet of hand (with insurance bet)
+    payout     int32     amount, which is returned to seat (bet is already taken)
+Records of write_result have no card codes, because RoundResult of Engine keeps only points of hands (Game writes
+codes of its hands).
+"""
+
+import mmap
+import struct
+from collections import namedtuple
+from engine import RoundResult
+from simulation import Stats
+
+RECORD = struct.Struct('<IHBBBB12sii2x')
+MAGIC = b'BJHIST1'.ljust(RECORD.size, b'\0')
+MAX_CARDS = 12
+EMPTY_CARD = 255
+EMPTY_CODES = bytes([EMPTY_CARD])
+DEALER_SEAT = 0xFFFF
+NO_OUTCOME = 255
+# number of records, which are buffered before they are written to file
+BATCH = 4096
+# number of records, which are aggregated at once by HistoryReader
+CHUNK = 1 << 20
+
+HandRecord = namedtuple('HandRecord', 'round seat actions outcome points cards codes bet payout')
+
+
+class HistoryWriter:
+    """
+    Streaming writer of hand history, which packs records into buffer and writes them to file by batches
+    """
+    def __init__(self, file_name: str, batch: int = BATCH) -> None:
+        """
+        Init method of HistoryWriter class (new history is appended to existing file, and its rounds are numbered
+        after the last round of file)
+        :param file_name: name of history file
+        :param batch: number of records in buffer
+        """
+        self.file = open(file_name, 'a+b')
+        self.round = 0
+        size = self.file.tell()
+        if size == 0:
+            self.file.write(MAGIC)
+        else:
+            self.file.seek(0)
+            if self.file.read(RECORD.size) != MAGIC:
+                self.file.close()
+                raise ValueError(f'{file_name} is not a hand history file')
+            if size >= 2 * RECORD.size:
+                self.file.seek((size // RECORD.size - 1) * RECORD.size)
+                self.round = RECORD.unpack(self.file.read(RECORD.size))[0] + 1
+        self.buffer = bytearray(batch * RECORD.size)
+        self.offset = 0
+
+    def __enter__(self) -> 'HistoryWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, seat: int, actions: int, outcome: int, points: int, codes: bytes, bet: int,
+              payout: int) -> None:
+        """
+        Add record of one hand of current round
+        :param seat: number of seat (DEALER_SEAT for Dealer)
+        :param actions: bit mask of made actions
+        :param outcome: engine outcome (NO_OUTCOME for Dealer)
+        :param points: points of hand
+        :param codes: card codes of hand (only first MAX_CARDS of them are kept)
+        :param bet: bet of hand
+        :param payout: amount, which is returned to seat
+        :return: Nothing
+        """
+        RECORD.pack_into(self.buffer, self.offset, self.round, seat, actions, outcome, points, len(codes),
+                         codes[:MAX_CARDS].ljust(MAX_CARDS, EMPTY_CODES), bet, payout)
+        self.offset += RECORD.size
+        if self.offset == len(self.buffer):
+            self.flush()
+
+    def next_round(self) -> None:
+        """
+        Start next round (records are written with its number)
+        :return: Nothing
+        """
+        self.round += 1
+
+    def write_result(self, result: RoundResult) -> None:
+        """
+        Add records of round, which was played by Engine, and start next round
+        :param result: result of round from Engine.play_round
+        :return: Nothing
+        """
+        for hand in result.seats:
+            self.write(hand.seat, 0, hand.outcome, hand.points, b'', hand.bet, hand.payout)
+        self.write(DEALER_SEAT, 0, NO_OUTCOME, result.dealer_points, b'', 0, 0)
+        self.next_round()
+
+    def flush(self) -> None:
+        """
+        Write buffered records to file
+        :return: Nothing
+        """
+        self.file.write(memoryview(self.buffer)[:self.offset])
+        self.file.flush()
+        self.offset = 0
+
+    def close(self) -> None:
+        """
+        Write buffered records and close file
+        :return: Nothing
+        """
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+class HistoryReader:
+    """
+    Reader of hand history, which maps file to memory, so records are read by OS pages only when they are used
+    """
+    def __init__(self, file_name: str) -> None:
+        """
+        Init method of HistoryReader class
+        :param file_name: name of history file
+        """
+        with open(file_name, 'rb') as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:RECORD.size] != MAGIC:
+            self.map.close()
+            raise ValueError(f'{file_name} is not a hand history file')
+
+    def __enter__(self) -> 'HistoryReader':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Len method of HistoryReader class
+        :return: number of records
+        """
+        return len(self.map) // RECORD.size - 1
+
+    def __getitem__(self, index: int) -> HandRecord:
+        """
+        Getitem method of HistoryReader class
+        :param index: number of record
+        :return: record of hand
+        """
+        if not -len(self) <= index < len(self):
+            raise IndexError('record index out of range')
+        return self._record(RECORD.unpack_from(self.map, (index % len(self) + 1) * RECORD.size))
+
+    def __iter__(self):
+        """
+        Iter method of HistoryReader class
+        :return: iterator of records of hands
+        """
+        with memoryview(self.map) as view:
+            for fields in RECORD.iter_unpack(view[RECORD.size:(len(self) + 1) * RECORD.size]):
+                yield self._record(fields)
+
+    @staticmethod
+    def _record(fields: tuple) -> HandRecord:
+        """
+        Make record of hand from unpacked fields (unused bytes of card codes are dropped)
+        :param fields: unpacked fields of record
+        :return: record of hand
+        """
+        record = HandRecord(*fields)
+        return record._replace(codes=record.codes[:record.cards])
+
+    def aggregate(self) -> Stats:
+        """
+        Count rounds, outcomes, bets, payouts and net results of all hands. Records are read as numpy array over
+        mapped file by chunks, so history isn't loaded into memory at once
+        :return: Stats class object
+        """
+        import numpy as np
+        records = np.frombuffer(self.map, np.dtype({'names': ['seat', 'outcome', 'bet', 'payout'],
+                                                    'formats': ['<u2', 'u1', '<i4', '<i4'],
+                                                    'offsets': [4, 7, 22, 26],
+                                                    'itemsize': RECORD.size}), len(self), RECORD.size)
+        stats = Stats()
+        outcomes = np.zeros(NO_OUTCOME + 1, np.int64)
+        for start in range(0, len(records), CHUNK):
+            chunk = records[start:start + CHUNK]
+            stats.rounds += int(np.count_nonzero(chunk['seat'] == DEALER_SEAT))  # one Dealer record in round
+            outcomes += np.bincount(chunk['outcome'], minlength=NO_OUTCOME + 1)
+            stats.bet += int(chunk['bet'].sum(dtype=np.int64))
+            stats.payout += int(chunk['payout'].sum(dtype=np.int64))
+            hands = chunk[chunk['seat'] != DEALER_SEAT]
+            stats.net.add_array(hands['payout'].astype(np.int64) - hands['bet'], hands['bet'])
+
+        stats.outcomes = outcomes[:len(stats.outcomes)].tolist()
+        stats.hands = sum(stats.outcomes)
+        return stats
+
+    def close(self) -> None:
+        """
+        Unmap file
+        :return: Nothing
+        """
+        self.map.close()
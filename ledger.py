@@ -0,0 +1,247 @@
+"""
+BlackJack module with bankroll of seats in integer cents and streaming statistics of results of hands
+"""
+
+from engine import SURRENDERED
+from math import exp, sqrt
+
+CENTS = 100  # cents in one dollar
+# z-score of 95% confidence interval
+Z_95 = 1.96
+
+
+def to_cents(dollars: int) -> int:
+    """
+    Convert whole dollars to cents
+    :param dollars: amount in dollars
+    :return: amount in cents
+    """
+    return dollars * CENTS
+
+
+class Ledger:
+    """
+    Bankroll of each seat in integer cents, so payouts are exact and don't change bets of hands
+    """
+    def __init__(self, seats: int = 0) -> None:
+        """
+        Init method of Ledger class
+        :param seats: number of seats (ledger grows, if bigger seat is settled)
+        """
+        self.balances = [0] * seats  # bankroll delta of each seat in cents
+        self.wagered = 0  # all bets in cents
+        self.paid = 0  # all payouts in cents
+
+    def settle(self, seat: int, bet: int, payout: int) -> None:
+        """
+        Take bet of hand from bankroll of seat and give payout to it
+        :param seat: number of seat
+        :param bet: bet of hand in cents
+        :param payout: amount, which is returned to seat, in cents
+        :return: Nothing
+        """
+        if seat >= len(self.balances):
+            self.balances.extend([0] * (seat + 1 - len(self.balances)))
+        self.balances[seat] += payout - bet
+        self.wagered += bet
+        self.paid += payout
+
+    def settle_hands(self, hands: list) -> None:
+        """
+        Settle all hands of round at once (bets and payouts of hand.SeatHand after engine.Engine.settle are
+        in dollars). Half of bet, which is returned after surrender, is counted in cents, so odd bet doesn't lose 50c
+        :param hands: hands of round
+        :return: Nothing
+        """
+        balances = self.balances
+        wagered = paid = 0
+        for hand in hands:
+            bet = (hand.bet + hand.ins_bet) * CENTS
+            payout = hand.payout * CENTS
+            if hand.outcome == SURRENDERED:
+                payout += hand.bet * CENTS // 2 - hand.bet // 2 * CENTS
+            seat = hand.seat
+            if seat >= len(balances):
+                balances.extend([0] * (seat + 1 - len(balances)))
+            balances[seat] += payout - bet
+            wagered += bet
+            paid += payout
+        self.wagered += wagered
+        self.paid += paid
+
+    def balance(self, seat: int) -> int:
+        """
+        Bankroll delta of seat
+        :param seat: number of seat
+        :return: bankroll delta in cents
+        """
+        return self.balances[seat] if seat < len(self.balances) else 0
+
+
+class RunningStats:
+    """
+    Statistics of net results of hands, which are updated by each hand with constant memory: mean and variance
+    (Welford's algorithm), house edge with confidence interval, drawdown of bankroll and risk of ruin
+    """
+    def __init__(self) -> None:
+        """
+        Init method of RunningStats class
+        """
+        self.count = 0
+        self.mean = 0.
+        self.m2 = 0.  # sum of squared differences from mean
+        self.total = 0  # bankroll delta (sum of net results)
+        self.wagered = 0  # sum of bets
+        self.peak = 0  # highest bankroll delta
+        self.trough = 0  # lowest bankroll delta
+        self.max_drawdown = 0  # biggest fall of bankroll delta from its peak
+
+    def __repr__(self) -> str:
+        """
+        Repr method of RunningStats class
+        :return: main statistics in one string
+        """
+        return f'RunningStats(count={self.count}, mean={self.mean:.4f}, std={self.std:.4f}, ' \
+               f'house_edge={self.house_edge:.4%}, max_drawdown={self.max_drawdown})'
+
+    def add(self, net: int, bet: int) -> None:
+        """
+        Add result of one hand
+        :param net: payout minus bet of hand
+        :param bet: bet of hand
+        :return: Nothing
+        """
+        self.count += 1
+        delta = net - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (net - self.mean)
+        self.wagered += bet
+
+        self.total += net
+        if self.total > self.peak:
+            self.peak = self.total
+        elif self.peak - self.total > self.max_drawdown:
+            self.max_drawdown = self.peak - self.total
+        if self.total < self.trough:
+            self.trough = self.total
+
+    def add_hands(self, hands: list) -> None:
+        """
+        Add results of all hands of round (hand.SeatHand after engine.Engine.settle) by one call, it's the same as
+        add for each hand
+        :param hands: hands of round
+        :return: Nothing
+        """
+        count, mean, m2, total, wagered = self.count, self.mean, self.m2, self.total, self.wagered
+        peak, trough, max_drawdown = self.peak, self.trough, self.max_drawdown
+        for hand in hands:
+            bet = hand.bet + hand.ins_bet
+            net = hand.payout - bet
+            count += 1
+            delta = net - mean
+            mean += delta / count
+            m2 += delta * (net - mean)
+            wagered += bet
+
+            total += net
+            if total > peak:
+                peak = total
+            elif peak - total > max_drawdown:
+                max_drawdown = peak - total
+            if total < trough:
+                trough = total
+        self.count, self.mean, self.m2, self.total, self.wagered = count, mean, m2, total, wagered
+        self.peak, self.trough, self.max_drawdown = peak, trough, max_drawdown
+
+    def add_array(self, nets, bets) -> None:
+        """
+        Add results of many hands at once (numpy arrays in order of playing hands). Statistics of these hands are
+        counted by numpy and merged, it's the same as add for each hand
+        :param nets: payouts minus bets of hands
+        :param bets: bets of hands (array or one bet of all hands)
+        :return: Nothing
+        """
+        import numpy as np  # numpy is needed only by simulations, which give arrays of results
+        nets = np.asarray(nets, dtype=np.int64)
+        if not len(nets):
+            return
+        chunk = RunningStats()
+        chunk.count = len(nets)
+        chunk.mean = float(nets.mean())
+        chunk.m2 = float(np.square(nets - chunk.mean).sum())
+        chunk.wagered = int(np.broadcast_to(bets, nets.shape).sum(dtype=np.int64))
+        totals = np.cumsum(nets)
+        peaks = np.maximum.accumulate(np.maximum(totals, 0))  # peak of bankroll delta starts from 0
+        chunk.total = int(totals[-1])
+        chunk.peak = int(peaks[-1])
+        chunk.trough = min(int(totals.min()), 0)
+        chunk.max_drawdown = int((peaks - totals).max())
+        self.merge(chunk)
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """
+        Add statistics of hands, which were played after these ones (by other worker)
+        :param other: statistics of other hands
+        :return: self
+        """
+        if not other.count:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.wagered += other.wagered
+
+        self.max_drawdown = max(self.max_drawdown, other.max_drawdown, self.peak - (self.total + other.trough))
+        self.peak = max(self.peak, self.total + other.peak)
+        self.trough = min(self.trough, self.total + other.trough)
+        self.total += other.total
+        return self
+
+    @property
+    def variance(self) -> float:
+        """
+        Sample variance of net result of hand
+        :return: variance
+        """
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.
+
+    @property
+    def std(self) -> float:
+        """
+        Standard deviation of net result of hand
+        :return: standard deviation
+        """
+        return sqrt(self.variance)
+
+    @property
+    def house_edge(self) -> float:
+        """
+        Part of bets, which is won by Dealer
+        :return: house edge (0.01 is 1%)
+        """
+        return -self.total / self.wagered if self.wagered else 0.
+
+    def confidence_interval(self, z: float = Z_95) -> tuple[float, float]:
+        """
+        Confidence interval of house edge
+        :param z: z-score of interval (95% by default)
+        :return: lowest and highest house edge
+        """
+        if not self.wagered:
+            return 0., 0.
+        margin = z * self.std * sqrt(self.count) / self.wagered
+        return self.house_edge - margin, self.house_edge + margin
+
+    def risk_of_ruin(self, bankroll: int) -> float:
+        """
+        Chance to lose whole bankroll, if hands are played with the same mean and variance (diffusion approximation)
+        :param bankroll: bankroll in the same units as net results
+        :return: risk of ruin (from 0 to 1)
+        """
+        if self.mean <= 0:
+            return 1.
+        if not self.variance:
+            return 0.
+        return min(exp(-2 * self.mean * bankroll / self.variance), 1.)
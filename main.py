@@ -1,32 +1,177 @@
-"""
-BlackJack main module, in which you can start your game
-"""
-
-import game
-from colorama import Fore
-
-
-def start(n: int) -> None:
-    """
-    Play BlackJack n times
-    :param n: Number of rounds to play
-    :return: Nothing
-    """
-    if n > 0:
-        while 1:
-            match input(Fore.MAGENTA + 'Want to play?(y/n): '):
-                case 'y':
-                    game.Game().play()
-                    start(n - 1)
-                    break
-                case 'n':
-                    break
-                case _:
-                    print(Fore.RED + 'Try again.' + Fore.WHITE)
-    else:
-        print(Fore.MAGENTA + '\nIf you want to play more, restart me')
-
-
-if __name__ == '__main__':
-    # to set higher number without getting errors, u should add more bot-names (in consts.py module)
-    start(5)
+"""
+BlackJack main module, in which you can start your game
+"""
+
+import argparse
+import game
+from colorama import Fore
+from time import perf_counter
+
+
+def start(n: int) -> None:
+    """
+    Play BlackJack n times at the same table
+    :param n: Number of rounds to play
+    :return: Nothing
+    """
+    session = game.Game()
+    played = 0
+    while played < n:
+        match input(Fore.MAGENTA + 'Want to play?(y/n): '):
+            case 'y':
+                session.play()
+                played += 1
+            case 'n':
+                break
+            case _:
+                print(Fore.RED + 'Try again.' + Fore.WHITE)
+    else:
+        print(Fore.MAGENTA + '\nIf you want to play more, restart me')
+
+
+def simulate(rounds: int, workers: int | None = None, csm: bool = False) -> None:
+    """
+    Simulate rounds on all cores and print results and rounds/sec
+    :param rounds: Number of rounds to simulate
+    :param workers: Number of processes (number of cores if not given)
+    :param csm: Are tables dealt by continuous shuffling machine instead of shoe
+    :return: Nothing
+    """
+    import simulation
+
+    start_time = perf_counter()
+    stats = simulation.simulate(rounds, workers, csm=csm)
+    show_stats(stats, perf_counter() - start_time)
+
+
+def show_stats(stats, elapsed: float) -> None:
+    """
+    Print results of simulated rounds and rounds/sec
+    :param stats: merged counters of rounds (simulation.Stats)
+    :param elapsed: seconds of simulation
+    :return: Nothing
+    """
+    print(Fore.MAGENTA + f'Simulated {stats.rounds} rounds ({stats.hands} hands) in {elapsed:.2f}s - '
+          f'{stats.rounds / elapsed:.0f} rounds/sec' + Fore.WHITE)
+    print(f'Wins: {stats.wins}, blackjacks: {stats.blackjacks}, draws: {stats.draws}, losses: {stats.losses}, '
+          f'busts: {stats.busts}, surrenders: {stats.surrenders}')
+    print(f'Bankroll: {stats.bankroll:+}$ (max drawdown {stats.net.max_drawdown}$)')
+    low, high = stats.net.confidence_interval()
+    print(f'House edge: {stats.net.house_edge:.3%} (95% interval {low:.3%} .. {high:.3%}), '
+          f'std of hand: {stats.net.std:.1f}$')
+
+
+def sweep(rounds: int, workers: int | None = None) -> None:
+    """
+    Compare grid of bot policies on the same shoes and print them ranked by EV
+    :param rounds: Number of rounds for each policy
+    :param workers: Number of processes (number of cores if not given)
+    :return: Nothing
+    """
+    import simulation
+
+    policies = simulation.policy_grid()
+    start_time = perf_counter()
+    ranking = simulation.sweep(rounds, policies, workers)
+    elapsed = perf_counter() - start_time
+
+    print(Fore.MAGENTA + f'Compared {len(policies)} policies on {rounds} rounds each in {elapsed:.2f}s' + Fore.WHITE)
+    print(f'{"#":>3}  {"policy":<56} {"EV":>8} {"95% interval":>19} {"std":>7} {"var/bet":>8}')
+    for rank, (policy, stats) in enumerate(ranking, 1):
+        low, high = stats.net.confidence_interval()
+        bet = stats.net.wagered / stats.hands if stats.hands else 1
+        print(f'{rank:>3}  {policy!r:<56} {-stats.net.house_edge:>8.3%} {-high:>9.3%} {-low:>9.3%} '
+              f'{stats.net.std:>7.1f} {stats.net.variance / bet / bet:>8.3f}')
+
+
+def coordinate(rounds: int, address: str = '127.0.0.1:8766', checkpoint: str | None = None,
+               workers: int = 0) -> None:
+    """
+    Run distributed job of seeded tables with bots and print results
+    :param rounds: Number of rounds of job
+    :param address: host:port, where workers connect to coordinator
+    :param checkpoint: File, from which job is continued and where done ranges are saved
+    :param workers: Number of worker processes, which are started on this host (only remote ones if 0)
+    :return: Nothing
+    """
+    import asyncio
+    import cluster
+
+    async def run():
+        if workers:
+            return await cluster.run_local(rounds, workers, checkpoint=checkpoint)
+        host, port = address.rsplit(':', 1)
+        coordinator = cluster.Coordinator(rounds, checkpoint=checkpoint, host=host, port=int(port))
+        await coordinator.start()
+        try:
+            return await coordinator.wait()
+        finally:
+            await coordinator.stop()
+
+    start_time = perf_counter()
+    stats = asyncio.run(run())
+    show_stats(stats, perf_counter() - start_time)
+
+
+def parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command line
+    :param args: arguments of command line (sys.argv[1:] if not given)
+    :return: command and its arguments (command is None for playing at table)
+    """
+    parser = argparse.ArgumentParser(description='BlackJack: play at table (without command) or simulate rounds')
+    commands = parser.add_subparsers(dest='command')
+
+    command = commands.add_parser('simulate', help='simulate rounds without playing')
+    command.add_argument('rounds', type=int, help='number of rounds')
+    command.add_argument('-w', '--workers', type=int, help='number of processes (number of cores if not given)')
+    command.add_argument('--csm', action='store_true', help='deal by continuous shuffling machine instead of shoe')
+
+    command = commands.add_parser('sweep', help='compare bot policies on the same shoes')
+    command.add_argument('rounds', type=int, help='number of rounds for each policy')
+    command.add_argument('-w', '--workers', type=int, help='number of processes (number of cores if not given)')
+
+    command = commands.add_parser('coordinate', help='hand out rounds to workers on other hosts')
+    command.add_argument('rounds', type=int, help='number of rounds')
+    command.add_argument('-a', '--address', default='127.0.0.1:8766', help='host:port of coordinator')
+    command.add_argument('-c', '--checkpoint', help='file, where done ranges are saved')
+
+    command = commands.add_parser('work', help='play rounds of coordinator')
+    command.add_argument('-a', '--address', default='127.0.0.1:8766', help='host:port of coordinator')
+
+    command = commands.add_parser('cluster', help='coordinator and workers on this host')
+    command.add_argument('rounds', type=int, help='number of rounds')
+    command.add_argument('-w', '--workers', type=int, default=2, help='number of worker processes')
+    command.add_argument('-c', '--checkpoint', help='file, where done ranges are saved')
+
+    command = commands.add_parser('serve', help='host tables for remote players (see server module)')
+    command.add_argument('-p', '--port', type=int, default=8765, help='port of server')
+    return parser.parse_args(args)
+
+
+if __name__ == '__main__':
+    # python main.py simulate 100000 --workers 4 --csm
+    # python main.py sweep 10000
+    # python main.py cluster 100000 --workers 2 --checkpoint job.txt
+    arguments = parse_args()
+    if arguments.command == 'simulate':
+        simulate(arguments.rounds, arguments.workers, arguments.csm)
+    elif arguments.command == 'sweep':
+        sweep(arguments.rounds, arguments.workers)
+    elif arguments.command == 'coordinate':
+        coordinate(arguments.rounds, arguments.address, arguments.checkpoint)
+    elif arguments.command == 'work':
+        import asyncio
+        import cluster
+
+        host, port = arguments.address.rsplit(':', 1)
+        print(f'Played {asyncio.run(cluster.work(host, int(port)))} ranges')
+    elif arguments.command == 'cluster':
+        coordinate(arguments.rounds, checkpoint=arguments.checkpoint, workers=arguments.workers)
+    elif arguments.command == 'serve':
+        import asyncio
+        import server
+
+        asyncio.run(server.serve(port=arguments.port))
+    else:
+        start(5)
@@ -0,0 +1,82 @@
+"""
+BlackJack module with metrics of Game.play: time of each phase and counters of rule paths
+"""
+
+import json
+
+# phases of Game.play
+PHASES = ('_create_players', '_new_round', '_hand_out_cards', '_player_choice', '_left_game_check', '_show_cards',
+          '_results')
+# counters of events in rounds
+COUNTERS = ('rounds', 'cards_drawn', 'splits', 'insurances', 'surrenders', 'busts')
+
+
+class Metrics:
+    """
+    Metrics of Game.play, which can be exported as JSON lines or Prometheus text
+    """
+    def __init__(self) -> None:
+        """
+        Init method of Metrics class
+        """
+        self.phase_seconds = dict.fromkeys(PHASES, 0.)
+        self.phase_calls = dict.fromkeys(PHASES, 0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """
+        Add time of one call of phase
+        :param phase: name of phase (method of Game)
+        :param seconds: time of call
+        :return: Nothing
+        """
+        self.phase_seconds[phase] += seconds
+        self.phase_calls[phase] += 1
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """
+        Add event to counter
+        :param counter: name of counter
+        :param amount: number of events
+        :return: Nothing
+        """
+        self.counters[counter] += amount
+
+    def to_json_line(self) -> str:
+        """
+        Make JSON line with all metrics
+        :return: JSON line (with new line in the end)
+        """
+        return json.dumps({'phase_seconds': self.phase_seconds, 'phase_calls': self.phase_calls,
+                           'counters': self.counters}) + '\n'
+
+    def to_prometheus(self) -> str:
+        """
+        Make text with all metrics in Prometheus format
+        :return: text of metrics
+        """
+        lines = ['# HELP blackjack_phase_seconds_total Time spent in phase of Game.play',
+                 '# TYPE blackjack_phase_seconds_total counter']
+        for phase, seconds in self.phase_seconds.items():
+            lines.append(f'blackjack_phase_seconds_total{{phase="{phase.strip("_")}"}} {seconds}')
+        lines += ['# HELP blackjack_phase_calls_total Calls of phase of Game.play',
+                  '# TYPE blackjack_phase_calls_total counter']
+        for phase, calls in self.phase_calls.items():
+            lines.append(f'blackjack_phase_calls_total{{phase="{phase.strip("_")}"}} {calls}')
+        for counter, value in self.counters.items():
+            lines += [f'# TYPE blackjack_{counter}_total counter', f'blackjack_{counter}_total {value}']
+        return '\n'.join(lines) + '\n'
+
+    def export(self, file_name: str, prometheus: bool = False) -> None:
+        """
+        Append JSON line with metrics to file (or rewrite file with Prometheus text)
+        :param file_name: name of file
+        :param prometheus: should Prometheus text be written instead of JSON line
+        :return: Nothing
+        """
+        if prometheus:
+            with open(file_name, 'w') as file:
+                file.write(self.to_prometheus())
+        else:
+            with open(file_name, 'a') as file:
+                file.write(self.to_json_line())
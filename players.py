@@ -1,386 +1,386 @@
-"""
-BlackJack module with classes of players
-"""
-
-from abc import ABC, abstractmethod
-from deck import current_deck
-from random import randint
-from consts import BOT_NAMES
-from colorama import Fore
-
-
-class MembersOfBlackJack(ABC):
-    """
-    Abstract class for all types of players (Player, Bot, Dealer) in BlackJack
-    """
-    name = ''
-    my_cards = []
-    blackjack = False
-
-    def __repr__(self) -> str:
-        """
-        Represent method of all players in BlackJack
-        :return: string with name of player
-        """
-        return self.name
-
-    def check_points(self) -> int:
-        """
-        Method of all players in BlackJack to count player's card points
-        :return: sum of card points of player
-        """
-        points = 0
-        for card in self.my_cards:
-            points += card.value
-        return points
-
-    def get_card_values(self) -> list[int]:
-        """
-        Method of all players in BlackJack to make list of player's card points
-        :return: list with values of player's cards
-        """
-        card_values = []
-        for card in self.my_cards:
-            card_values.append(card.value)
-        return card_values
-
-    def bust_check(self) -> bool:
-        """
-        Method of all players in BlackJack to check player for bust. If you have more than 21 point and
-        have Ace, method will replace it value with 1
-        :return: True or False (Are you busted or no)
-        """
-        cv = self.get_card_values()
-        if self.check_points() > 21:
-            if 11 not in cv:
-                print(f'{self.name} have too much points ({self.check_points()}p.) - ' +
-                      Fore.RED + 'busted' + Fore.WHITE)
-                return True
-            else:
-                self.my_cards[cv.index(11)].value = 1
-                return self.bust_check()
-        else:
-            return False
-
-    def show_cards(self) -> str:
-        """
-        Method of all players in BlackJack to show player's cards in string
-        :return: str with cards of player
-        """
-        string_with_cards = f'\n{self.name}\'s cards:\n'
-        for card in self.my_cards:
-            string_with_cards += card.__repr__() + '\n'
-        return string_with_cards
-
-    def take_card(self) -> None:
-        """
-        Method of all players in BlackJack to append list of player's cards with top card of deck
-        :return: Nothing
-        """
-        self.my_cards.append(current_deck.take_card_from_deck())
-
-    @abstractmethod
-    def show_first_cards(self):
-        pass
-
-    @abstractmethod
-    def make_choice(self):
-        pass
-
-
-class AbstractPlayer(MembersOfBlackJack):
-    """
-    Abstract class for Player and Bot players in BlackJack
-    """
-    enable_insurance = False
-    left_game = False
-    split = False
-    enough_split = False
-
-    def show_first_cards(self) -> str:
-        """
-        Method of Player and Bot players in BlackJack to show player's first cards
-        :return: Player's cards
-        """
-        return f'\n{self.name} has these cards:\n{self.my_cards[0]}, {self.my_cards[1]}'
-
-    def exit_game(self) -> str:
-        """
-        Method of Player and Bot players in BlackJack to set left_game to True
-        :return: Player {player's name} left the session
-        """
-        self.left_game = True
-        return f'Player {self.name} left the session.'
-
-    @abstractmethod
-    def card_take_cycle(self):
-        pass
-
-
-# ------------------------------------------------------------------------------------------------ #
-
-class Player(AbstractPlayer):
-    """
-    Player class in BlackJack
-    """
-    bet = 0
-    ins_bet = 0
-    ins_work = False
-    got_ins = False
-
-    def __init__(self, name=input('Enter your name: ')) -> None:
-        """
-        Init method of Player class
-        :param name: name of player
-        """
-        self.name = Fore.YELLOW + name + Fore.WHITE
-        self.make_bet('bet')
-        self.my_cards = []
-
-    def make_bet(self, mode: str) -> None:
-        """
-        Method of Player in BlackJack to set player's bet
-        :return: Nothing
-        """
-        while 1:
-            try:
-                bet = int(input('Enter your bet (50, 100, 200): '))
-                if bet in (50, 100, 200):
-                    break
-                else:
-                    print('Incorrect bet. Try again.\n')
-            except ValueError:
-                print('Try again.\n')
-
-        print(Fore.LIGHTMAGENTA_EX + f'-{bet}$' + Fore.WHITE)
-        if mode == 'bet':
-            self.bet = bet
-        elif mode == 'ins':
-            self.ins_bet = bet
-
-    def insurance(self) -> None:
-        """
-        Method of Player in BlackJack to make insurance
-        :return: Nothing
-        """
-        if self.ins_work:
-            self.got_ins = True
-
-    def double(self) -> None:
-        """
-        Method of Player in BlackJack to double player's bet and take 1 card
-        :return: Nothing
-        """
-        print(Fore.LIGHTMAGENTA_EX + f'-{self.bet}$ (double)' + Fore.WHITE)
-        self.bet *= 2
-        self.take_card()
-
-    def surrender(self) -> None:
-        """
-        Method of Player in BlackJack to surrender and got pay-back (half of player's bet)
-        :return: Nothing
-        """
-        print(self.name + Fore.RED + ' surrendered' + Fore.WHITE)
-        print(Fore.LIGHTMAGENTA_EX + f'+{self.bet / 2}$ (surrender)' + Fore.WHITE)
-        print(self.exit_game())
-
-    def get_reward_instantly(self) -> None:
-        """
-        Method of Player in BlackJack to instantly win if player has blackjack
-        :return: Nothing
-        """
-        print(Fore.LIGHTMAGENTA_EX + f'+{2 * self.bet}$' + Fore.WHITE)
-        print(self.exit_game())
-
-    def card_take_cycle(self) -> None:
-        """
-        Method of Player in BlackJack to take cards or stop doing it
-        :return: Nothing
-        """
-        while 1:
-            match input(Fore.MAGENTA + '\nWhat should I do now?' + Fore.WHITE +
-                        '\n\t1.Hit (take card)\n\t2.Stand (stop)\n(Enter number of action)> '):
-                case '1':
-                    if self.check_points() < 21:
-                        self.take_card()
-                        print(Fore.LIGHTBLUE_EX + 'Your card -  ' + self.my_cards[-1].__repr__()
-                              + Fore.WHITE)
-                        print(self.show_cards())
-                        if self.bust_check():
-                            print(self.exit_game())
-                            break
-                    else:
-                        print(Fore.RED + 'You have too much points to take more cards.' + Fore.WHITE)
-                        break
-                case '2':
-                    break
-                case _:
-                    print(Fore.RED + '\nYou entered wrong value. Try again.' + Fore.WHITE)
-
-    def make_choice(self) -> None:
-        """
-        Method of Player in BlackJack to make choice what player will do
-        :return: Nothing
-        """
-        while 1:
-            match input(Fore.MAGENTA + '\nWhat should I do? ' + Fore.WHITE + f'(Make choice as {self.name})' +
-                        Fore.WHITE + '\n\t1.Take card (Hit)\n\t2.Stand\n\t3.Surrender\n\t4.Double' +
-                        '\n\t5.Split hand\n\t6.Make insurance\n\t' +
-                        '7.Get reward instantly (If BlackJack)\n\t8.Check my cards\n(Enter number of action)> '):
-
-                case '1':
-                    if not self.blackjack:
-                        self.card_take_cycle()
-                        break
-                    else:
-                        print(Fore.RED + '\nYou can\'t do this action.' + Fore.WHITE)
-                    break
-                case '2':
-                    break
-                case '3':
-                    self.surrender()
-                    break
-                case '4':
-                    self.double()
-                    print(Fore.LIGHTBLUE_EX + 'Your card -  ' + self.my_cards[-1].__repr__()
-                          + Fore.WHITE)
-                    if self.bust_check():
-                        print(self.exit_game())
-                    break
-                case '5':
-                    if self.my_cards[0].value == self.my_cards[1].value and not self.enough_split:
-                        self.split = True
-                        print(self.name + Fore.MAGENTA + ' split his hand' + Fore.WHITE)
-                        break
-                    else:
-                        print(Fore.RED + '\nYou can\'t do this action.' + Fore.WHITE)
-                case '6':
-                    if self.enable_insurance:
-                        self.make_bet('ins')
-                        self.insurance()
-                        self.enable_insurance = False
-                        print(self.name + Fore.MAGENTA + ' insured' + Fore.WHITE)
-                        self.make_choice()
-                        break
-
-                    else:
-                        print(Fore.RED + '\nYou can\'t do this action.' + Fore.WHITE)
-                case '7':
-                    if self.blackjack:
-                        self.get_reward_instantly()
-                        break
-                    else:
-                        print(Fore.RED + '\nYou can\'t do this action.' + Fore.WHITE)
-                case '8':
-                    print(self.show_cards())
-                case _:
-                    print(Fore.RED + '\nYou entered wrong value. Try again.' + Fore.WHITE)
-
-    def win(self) -> str:
-        """
-        Method of Player in BlackJack to print player's gain if player won
-        :return: String with gain in $
-        """
-        return Fore.LIGHTMAGENTA_EX + f'+{2 * self.bet}$' + Fore.WHITE
-
-    def draw(self) -> str:
-        """
-        Method of Player in BlackJack to print player's gain if player drew with Dealer
-        :return: String with gain in $
-        """
-        return Fore.LIGHTMAGENTA_EX + f'+{self.bet}$' + Fore.WHITE
-
-
-# ------------------------------------------------------------------------------------------------ #
-
-class Bot(AbstractPlayer):
-    """
-    Bot class in BlackJack
-    """
-    def __init__(self, name: str = '') -> None:
-        """
-        Init method of Bot class
-        :param name: Name of Bot
-        """
-        self.max_value = randint(18, 20)
-        self.surrender_value = (range(14, 18))
-        self.my_cards = []
-        if not name == '':
-            self.name = name
-        else:
-            self.name = Fore.GREEN + BOT_NAMES.pop(BOT_NAMES.index(BOT_NAMES[randint(0, len(BOT_NAMES) - 1)])) \
-                        + Fore.WHITE
-
-    def card_take_cycle(self) -> None:
-        """
-        Method of Bot in BlackJack to take cards
-        :return: Nothing
-        """
-        while self.check_points() < self.max_value:
-            self.take_card()
-            print(self.name + Fore.LIGHTGREEN_EX + ' took card -  ' + self.my_cards[-1].__repr__() + Fore.WHITE)
-            if self.bust_check():
-                print(self.exit_game())
-
-    def make_choice(self) -> None:
-        """
-        Method of Bot in BlackJack to make random choice what bot will do
-        :return: Nothing
-        """
-        while 1:
-            match randint(1, 5):
-                case 1:
-                    self.card_take_cycle()
-                    break
-                case 2:
-                    if self.check_points() >= self.max_value:
-                        break
-                case 3:
-                    if self.check_points() in self.surrender_value:
-                        print(self.name + Fore.RED + ' surrendered' + Fore.WHITE)
-                        print(self.exit_game())
-                        break
-                case 4:
-                    if self.my_cards[0].value == self.my_cards[1].value and not self.enough_split:
-                        self.split = True
-                        print(self.name + Fore.MAGENTA + ' split his hand' + Fore.WHITE)
-                        break
-                case 5:
-                    if self.enable_insurance:
-                        self.enable_insurance = False
-                        print(self.name + Fore.MAGENTA + ' insured' + Fore.WHITE)
-                        self.make_choice()
-                        break
-
-
-# ------------------------------------------------------------------------------------------------ #
-
-class Dealer(MembersOfBlackJack):
-    """
-    Dealer class in BlackJack
-    """
-    def __init__(self) -> None:
-        """
-        Init method of Dealer class
-        """
-        self.name = Fore.RED + 'Dealer' + Fore.WHITE
-        self.busted = False
-
-    def show_first_cards(self) -> str:
-        """
-        Method of Dealer in BlackJack to show Dealer's first cards
-        :return: Dealer's card and some secret card
-        """
-        return f'\n{self.name} has these cards:\n{self.my_cards[0]}, ##### (second card will be revealed later)\n'
-
-    def make_choice(self) -> None:
-        """
-        Method of Dealer in BlackJack to make Dealer take cards while he won't get more than 16 points
-        :return: Nothing
-        """
-        while self.check_points() < 17:
-            self.take_card()
-            print(self.name + Fore.LIGHTRED_EX + ' took card -  ' + self.my_cards[-1].__repr__() + Fore.WHITE)
-            self.busted = self.bust_check()
-
-# ------------------------------------------------------------------------------------------------ #
+"""
+BlackJack module with classes of players. Players make bets and choices and show what happened with their hands,
+and rules of round are played by engine.Engine (Game asks players between its phases)
+"""
+
+from abc import ABC, abstractmethod
+from deck import decode_card
+from engine import ACTION_NAMES, HIT, STAND, SURRENDER, DOUBLE, SPLIT, INSURANCE, REWARD, CAN_HIT, CAN_SURRENDER, \
+    CAN_DOUBLE, CAN_SPLIT, CAN_INSURANCE, CAN_REWARD, HIT_OR_STAND, BUST, BotStrategy, Strategy
+from hand import Hand, SeatHand
+from random import Random, randint
+from render import Render
+from consts import BOT_NAMES, BOT_BET
+from colorama import Fore
+
+
+class MembersOfBlackJack(ABC):
+    """
+    Abstract class for all types of players (Player, Bot, Dealer) in BlackJack
+    """
+    name = ''
+    seat = 0  # number of seat at table (set by Game)
+    render = None  # buffer of output of table, where player writes its lines
+
+    def __repr__(self) -> str:
+        """
+        Represent method of all players in BlackJack
+        :return: string with name of player
+        """
+        return self.name
+
+    def hand_name(self, hand: Hand) -> str:
+        """
+        Method of all players in BlackJack to name hand of player
+        :param hand: hand of player
+        :return: name of player (with number of hand after split)
+        """
+        number = getattr(hand, 'number', 0)
+        return f'{self.name}\'s hand {number}' if number else self.name
+
+    def show_cards(self, hand: Hand) -> str:
+        """
+        Method of all players in BlackJack to show player's cards in string
+        :param hand: hand of player
+        :return: str with cards of player
+        """
+        return f'\n{self.hand_name(hand)}\'s cards:\n' + ''.join(f'{decode_card(card)}\n' for card in hand)
+
+    def show_bust(self, hand: Hand) -> None:
+        """
+        Method of all players in BlackJack to show, that hand is busted (if output is verbose)
+        :param hand: hand of player
+        :return: Nothing
+        """
+        if self.render.verbose:
+            self.render.line(f'{self.hand_name(hand)} have too much points ({hand.points}p.) - ' +
+                             Fore.RED + 'busted' + Fore.WHITE)
+
+    @abstractmethod
+    def show_first_cards(self, hand: Hand):
+        pass
+
+
+class AbstractPlayer(MembersOfBlackJack):
+    """
+    Abstract class for Player and Bot players in BlackJack
+    """
+    def show_first_cards(self, hand: SeatHand) -> str:
+        """
+        Method of Player and Bot players in BlackJack to show player's first cards
+        :param hand: hand of player
+        :return: Player's cards
+        """
+        return f'\n{self.name} has these cards:\n{decode_card(hand[0])}, {decode_card(hand[1])}'
+
+    def show_action(self, hand: SeatHand, action: int, cards: int) -> None:
+        """
+        Method of Player and Bot players in BlackJack to show action, which was made with hand (if output is verbose)
+        :param hand: hand of player after action
+        :param action: action (HIT, STAND...)
+        :param cards: number of cards in hand before action
+        :return: Nothing
+        """
+        render = self.render
+        if not render.verbose:
+            return
+        name = self.hand_name(hand)
+        if action == HIT:
+            for card in hand.cards[cards:]:
+                render.line(name + Fore.LIGHTGREEN_EX + ' took card -  ' + repr(decode_card(card)) + Fore.WHITE)
+        elif action == DOUBLE:
+            render.line(name + Fore.MAGENTA + ' doubled - ' + repr(decode_card(hand[-1])) + Fore.WHITE)
+        elif action == SURRENDER:
+            render.line(name + Fore.RED + ' surrendered' + Fore.WHITE)
+        elif action == SPLIT:
+            render.line(name + Fore.MAGENTA + ' split his hand' + Fore.WHITE)
+        elif action == INSURANCE:
+            render.line(name + Fore.MAGENTA + ' insured' + Fore.WHITE)
+        if hand.outcome == BUST:
+            self.show_bust(hand)
+        if hand.left_game:
+            self.exit_game(hand)
+
+    def exit_game(self, hand: SeatHand) -> None:
+        """
+        Method of Player and Bot players in BlackJack to show, that hand left game
+        :param hand: hand of player
+        :return: Nothing
+        """
+        if self.render.verbose:
+            self.render.line(f'Player {self.hand_name(hand)} left the session.')
+
+    @abstractmethod
+    def make_bet(self) -> int:
+        pass
+
+    @abstractmethod
+    def make_choice(self, hand: SeatHand, upcard: int, options: int) -> int:
+        pass
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+class Player(AbstractPlayer):
+    """
+    Player class in BlackJack
+    """
+    default_name = None
+
+    def __init__(self, name: str | None = None, render: Render | None = None,
+                 advisor: Strategy | None = None) -> None:
+        """
+        Init method of Player class
+        :param name: name of player (name, which is asked once on first use, if not given)
+        :param render: output of table (new one if not given)
+        :param advisor: advisor.AdvisorStrategy, which gives hints (hints are disabled if not given)
+        """
+        self.render = Render() if render is None else render
+        self.advisor = advisor
+        if name is None:
+            if Player.default_name is None:
+                Player.default_name = self.render.ask('Enter your name: ')
+            name = Player.default_name
+        self.name = Fore.YELLOW + name + Fore.WHITE
+
+    def make_bet(self) -> int:
+        """
+        Method of Player in BlackJack to set player's bet
+        :return: bet
+        """
+        while 1:
+            try:
+                bet = int(self.render.ask('Enter your bet (50, 100, 200): '))
+                if bet in (50, 100, 200):
+                    break
+                else:
+                    self.render.line('Incorrect bet. Try again.\n')
+            except ValueError:
+                self.render.line('Try again.\n')
+
+        self.render.line(Fore.LIGHTMAGENTA_EX + f'-{bet}$' + Fore.WHITE)
+        return bet
+
+    def hint(self, hand: SeatHand, upcard: int, options: int) -> str:
+        """
+        Method of Player in BlackJack to show expected value of each legal action for cards, which player doesn't see
+        :param hand: hand of player
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param options: bit mask of legal actions
+        :return: String with expected values (in bets) from the best action to the worst
+        """
+        if self.advisor is None:
+            return Fore.RED + 'Hints are disabled at this table.' + Fore.WHITE
+        evs = self.advisor.evaluate(hand.points, hand.soft, hand.pair, upcard, options)
+        insurance = evs.pop(INSURANCE, None)
+        text = Fore.CYAN + 'Expected value: ' + ', '.join(
+            f'{ACTION_NAMES[action]} {ev:+.3f}' for action, ev in sorted(evs.items(), key=lambda item: -item[1]))
+        if insurance is not None:
+            text += f' (insurance {insurance:+.3f} - {"take" if insurance > 0 else "skip"} it)'
+        return text + Fore.WHITE
+
+    def card_take_cycle(self, hand: SeatHand, upcard: int) -> int:
+        """
+        Method of Player in BlackJack to take one more card or stop doing it
+        :param hand: hand of player
+        :param upcard: value of Dealer's open card
+        :return: HIT or STAND
+        """
+        while 1:
+            match self.render.ask(Fore.MAGENTA + '\nWhat should I do now?' + Fore.WHITE +
+                                  '\n\t1.Hit (take card)\n\t2.Stand (stop)\n\t3.Hint\n(Enter number of action)> '):
+                case '1':
+                    return HIT
+                case '2':
+                    return STAND
+                case '3':
+                    self.render.line(self.hint(hand, upcard, HIT_OR_STAND))
+                case _:
+                    self.render.line(Fore.RED + '\nYou entered wrong value. Try again.' + Fore.WHITE)
+
+    def make_choice(self, hand: SeatHand, upcard: int, options: int) -> int:
+        """
+        Method of Player in BlackJack to make choice what player will do
+        :param hand: hand of player
+        :param upcard: value of Dealer's open card
+        :param options: bit mask of legal actions
+        :return: action
+        """
+        if options == HIT_OR_STAND:
+            return self.card_take_cycle(hand, upcard)
+
+        while 1:
+            match self.render.ask(Fore.MAGENTA + '\nWhat should I do? ' + Fore.WHITE +
+                                  f'(Make choice as {self.hand_name(hand)})' +
+                                  Fore.WHITE + '\n\t1.Take card (Hit)\n\t2.Stand\n\t3.Surrender\n\t4.Double' +
+                                  '\n\t5.Split hand\n\t6.Make insurance\n\t' +
+                                  '7.Get reward instantly (If BlackJack)\n\t8.Check my cards\n\t9.Hint' +
+                                  '\n(Enter number of action)> '):
+                case '1' if options & CAN_HIT:
+                    return HIT
+                case '2':
+                    return STAND
+                case '3' if options & CAN_SURRENDER:
+                    return SURRENDER
+                case '4' if options & CAN_DOUBLE:
+                    return DOUBLE
+                case '5' if options & CAN_SPLIT:
+                    return SPLIT
+                case '6' if options & CAN_INSURANCE:
+                    return INSURANCE
+                case '7' if options & CAN_REWARD:
+                    return REWARD
+                case '1' | '3' | '4' | '5' | '6' | '7':
+                    self.render.line(Fore.RED + '\nYou can\'t do this action.' + Fore.WHITE)
+                case '8':
+                    self.render.line(self.show_cards(hand))
+                case '9':
+                    self.render.line(self.hint(hand, upcard, options))
+                case _:
+                    self.render.line(Fore.RED + '\nYou entered wrong value. Try again.' + Fore.WHITE)
+
+    def show_action(self, hand: SeatHand, action: int, cards: int) -> None:
+        """
+        Method of Player in BlackJack to show action, which was made with hand, and money of it (always)
+        :param hand: hand of player after action
+        :param action: action (HIT, STAND...)
+        :param cards: number of cards in hand before action
+        :return: Nothing
+        """
+        line = self.render.line
+        name = self.hand_name(hand)
+        if action == HIT:
+            for card in hand.cards[cards:]:
+                line(Fore.LIGHTBLUE_EX + 'Your card -  ' + repr(decode_card(card)) + Fore.WHITE)
+            line(self.show_cards(hand))
+        elif action == DOUBLE:
+            line(Fore.LIGHTMAGENTA_EX + f'-{hand.bet // 2}$ (double)' + Fore.WHITE)
+            line(Fore.LIGHTBLUE_EX + 'Your card -  ' + repr(decode_card(hand[-1])) + Fore.WHITE)
+        elif action == SURRENDER:
+            line(name + Fore.RED + ' surrendered' + Fore.WHITE)
+            line(Fore.LIGHTMAGENTA_EX + f'+{hand.bet / 2}$ (surrender)' + Fore.WHITE)
+        elif action == SPLIT:
+            line(name + Fore.MAGENTA + ' split his hand' + Fore.WHITE)
+            line(Fore.LIGHTMAGENTA_EX + f'-{hand.bet}$ (split)' + Fore.WHITE)
+            line(self.show_cards(hand))
+        elif action == INSURANCE:
+            line(Fore.LIGHTMAGENTA_EX + f'-{hand.ins_bet}$' + Fore.WHITE)
+            line(name + Fore.MAGENTA + ' insured' + Fore.WHITE)
+        elif action == REWARD:
+            line(Fore.LIGHTMAGENTA_EX + f'+{2 * hand.bet}$' + Fore.WHITE)
+        if hand.outcome == BUST:
+            self.show_bust(hand)
+        if hand.left_game:
+            self.exit_game(hand)
+
+    def win(self, hand: SeatHand) -> str:
+        """
+        Method of Player in BlackJack to print player's gain if player won (bet is paid twice for BlackJack)
+        :param hand: hand of player
+        :return: String with gain in $
+        """
+        return Fore.LIGHTMAGENTA_EX + f'+{(3 if hand.blackjack else 2) * hand.bet}$' + Fore.WHITE
+
+    def draw(self, hand: SeatHand) -> str:
+        """
+        Method of Player in BlackJack to print player's gain if player drew with Dealer
+        :param hand: hand of player
+        :return: String with gain in $
+        """
+        return Fore.LIGHTMAGENTA_EX + f'+{hand.bet}$' + Fore.WHITE
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+class Bot(AbstractPlayer):
+    """
+    Bot class in BlackJack
+    """
+    def __init__(self, name: str = '', strategy: Strategy | None = None, rng: Random | None = None,
+                 render: Render | None = None) -> None:
+        """
+        Init method of Bot class
+        :param name: Name of Bot
+        :param strategy: strategy, which makes choices of Bot (basic strategy table, advisor...), or random
+                         choices of BotStrategy if not given
+        :param rng: random generator for random choices and name (global one if not given)
+        :param render: output of table (new one if not given)
+        """
+        self.render = Render() if render is None else render
+        self.strategy = BotStrategy(rng) if strategy is None else strategy
+        if not name == '':
+            self.name = name
+        else:
+            bot_randint = randint if rng is None else rng.randint
+            self.name = Fore.GREEN + BOT_NAMES[bot_randint(0, len(BOT_NAMES) - 1)] + Fore.WHITE
+
+    def make_bet(self) -> int:
+        """
+        Method of Bot in BlackJack to make the same bet in each round
+        :return: bet
+        """
+        return BOT_BET
+
+    def make_choice(self, hand: SeatHand, upcard: int, options: int) -> int:
+        """
+        Method of Bot in BlackJack to make choice by strategy of Bot
+        :param hand: hand of Bot
+        :param upcard: value of Dealer's open card
+        :param options: bit mask of legal actions
+        :return: action
+        """
+        return self.strategy.decide(hand.points, hand.soft, hand.pair, upcard, options)
+
+
+# ------------------------------------------------------------------------------------------------ #
+
+class Dealer(MembersOfBlackJack):
+    """
+    Dealer class in BlackJack
+    """
+    def __init__(self, render: Render | None = None) -> None:
+        """
+        Init method of Dealer class
+        :param render: output of table (new one if not given)
+        """
+        self.render = Render() if render is None else render
+        self.name = Fore.RED + 'Dealer' + Fore.WHITE
+
+    def show_first_cards(self, hand: Hand) -> str:
+        """
+        Method of Dealer in BlackJack to show Dealer's first cards
+        :param hand: hand of Dealer
+        :return: Dealer's card and some secret card
+        """
+        return f'\n{self.name} has these cards:\n{decode_card(hand[0])}, ##### (second card will be revealed later)\n'
+
+    def show_draws(self, hand: Hand) -> None:
+        """
+        Method of Dealer in BlackJack to show cards, which Dealer took after first two cards (if output is verbose)
+        :param hand: hand of Dealer
+        :return: Nothing
+        """
+        if not self.render.verbose:
+            return
+        for card in hand.cards[2:]:
+            self.render.line(self.name + Fore.LIGHTRED_EX + ' took card -  ' + repr(decode_card(card)) + Fore.WHITE)
+        if hand.busted:
+            self.show_bust(hand)
+
+# ------------------------------------------------------------------------------------------------ #
+
+def bot_names(amount: int, rng: Random) -> list[str]:
+    """
+    Make different names for bots: names from BOT_NAMES in random order, and if there are more bots than names,
+    the same names with numbers of their round ('John 2', 'John 3'...)
+    :param amount: amount of bots
+    :param rng: random generator
+    :return: list of names
+    """
+    if amount <= len(BOT_NAMES):
+        return rng.sample(BOT_NAMES, amount)
+
+    names = rng.sample(BOT_NAMES, len(BOT_NAMES))
+    for number in range(len(BOT_NAMES), amount):
+        names.append(f'{names[number % len(BOT_NAMES)]} {number // len(BOT_NAMES) + 1}')
+    return names
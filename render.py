@@ -0,0 +1,58 @@
+"""
+BlackJack module with buffered output of game: lines of each phase are collected and written by one call
+"""
+
+import sys
+
+# levels of output: nothing, only results of hands or everything, what happens at table
+QUIET, SUMMARY, VERBOSE = range(3)
+# buffer is written when it has so many lines (so big tables don't keep output of whole phase in memory)
+BUFFER_LINES = 1000
+
+
+class Render:
+    """
+    Buffer of output lines. Lines should be made only if level allows it (check verbose or summary before
+    formatting them), so quiet output costs nothing
+    """
+    def __init__(self, level: int = VERBOSE, stream=None) -> None:
+        """
+        Init method of Render class
+        :param level: level of output (QUIET, SUMMARY or VERBOSE)
+        :param stream: file, where lines are written (sys.stdout of moment of writing if not given)
+        """
+        self.stream = stream
+        self.lines = []
+        self.level = level
+        self.summary = level >= SUMMARY
+        self.verbose = level >= VERBOSE
+
+    def line(self, text: str) -> None:
+        """
+        Add line to buffer
+        :param text: text of line
+        :return: Nothing
+        """
+        self.lines.append(text)
+        if len(self.lines) >= BUFFER_LINES:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all lines of buffer by one call
+        :return: Nothing
+        """
+        if self.lines:
+            lines = self.lines
+            lines.append('')
+            (sys.stdout if self.stream is None else self.stream).write('\n'.join(lines))
+            lines.clear()
+
+    def ask(self, prompt: str) -> str:
+        """
+        Write buffer and ask user (so question is shown after everything, what happened before it)
+        :param prompt: text of question
+        :return: answer of user
+        """
+        self.flush()
+        return input(prompt)
@@ -0,0 +1,198 @@
+"""
+BlackJack module with asyncio server, which hosts many tables in one process.
+
+Protocol is text lines over local TCP socket. Client opens table with (1..MAX_SEATS seats)
+    PLAY <rounds> <seats>
+and then server asks for each decision of seats and waits for answer line:
+    BET <seat>                                            -> <bet>           (like Player.make_bet)
+    DECIDE <seat> <points> <soft> <pair> <upcard> <options> -> <action>       (like Player.make_choice and
+                                                                              Player.card_take_cycle)
+where soft and pair are 0 or 1, options is bit mask of legal actions and action is engine action (HIT, STAND...).
+After each round server sends
+    ROUND <dealer points> <dealer busted> <hands>
+    RESULT <seat> <outcome> <points> <bet> <payout>       (one line for each hand)
+and after all rounds - END. Wrong line is answered with ERROR <reason> and the same request is sent again.
+"""
+
+import asyncio
+from deck import CompactDeck
+from engine import Engine, Strategy, RoundResult, SeatResult, DECIDE
+
+# the most seats of one table
+MAX_SEATS = 16
+
+
+class TableServer:
+    """
+    Server, where each connection plays on own table, and decisions of seats are awaited from client
+    """
+    def __init__(self, host: str = '127.0.0.1', port: int = 0) -> None:
+        """
+        Init method of TableServer class
+        :param host: host of server (only local one by default)
+        :param port: port of server (free port is chosen if 0)
+        """
+        self.host = host
+        self.port = port
+        self.server = None
+        self.tables = 0  # number of tables, which are played now
+
+    async def start(self) -> None:
+        """
+        Start listening (port is set to real port of server)
+        :return: Nothing
+        """
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """
+        Stop listening and wait until server is closed
+        :return: Nothing
+        """
+        self.server.close()
+        await self.server.wait_closed()
+
+    @staticmethod
+    async def _ask(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, request: str,
+                   legal: int | None) -> int:
+        """
+        Send request to client and wait for its answer
+        :param reader: reader of connection
+        :param writer: writer of connection
+        :param request: line of request
+        :param legal: bit mask of legal actions (None for bet)
+        :return: answer of client
+        """
+        while 1:
+            writer.write(request.encode())
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError('client left table')
+            try:
+                answer = int(line)
+            except ValueError:
+                writer.write(b'ERROR not a number\n')
+                continue
+            if legal is None and answer <= 0:
+                writer.write(b'ERROR bet must be positive\n')
+            elif legal is not None and not (0 <= answer < 8 and legal >> answer & 1):
+                writer.write(b'ERROR illegal action\n')
+            else:
+                return answer
+
+    async def _play(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, rounds: int,
+                    seats: int) -> None:
+        """
+        Play rounds on new table and send results to client
+        :param reader: reader of connection
+        :param writer: writer of connection
+        :param rounds: number of rounds
+        :param seats: number of seats
+        :return: Nothing
+        """
+        table = Engine([], CompactDeck())
+        for _ in range(rounds):
+            steps = table.round_steps(seats)
+            try:
+                request = next(steps)
+                while 1:
+                    kind, seat, points, soft, pair, upcard, options = request
+                    if kind == DECIDE:
+                        answer = await self._ask(reader, writer, f'DECIDE {seat} {points} {soft:d} {pair:d} '
+                                                                 f'{upcard} {options}\n', options)
+                    else:
+                        answer = await self._ask(reader, writer, f'BET {seat}\n', None)
+                    request = steps.send(answer)
+            except StopIteration as stop:
+                result = stop.value
+
+            lines = [f'ROUND {result.dealer_points} {result.dealer_busted:d} {len(result.seats)}\n']
+            for hand in result.seats:
+                lines.append(f'RESULT {hand.seat} {hand.outcome} {hand.points} {hand.bet} {hand.payout}\n')
+            writer.write(''.join(lines).encode())
+            await writer.drain()
+        writer.write(b'END\n')
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one connection
+        :param reader: reader of connection
+        :param writer: writer of connection
+        :return: Nothing
+        """
+        self.tables += 1
+        try:
+            words = (await reader.readline()).split()
+            if len(words) == 3 and words[0] == b'PLAY' and words[1].isdigit() and words[2].isdigit() and \
+                    1 <= int(words[2]) <= MAX_SEATS:
+                await self._play(reader, writer, int(words[1]), int(words[2]))
+            else:
+                writer.write(b'ERROR expected PLAY <rounds> <seats>\n')
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.tables -= 1
+            writer.close()
+
+
+class FakeClient:
+    """
+    Local client of TableServer, which answers with strategy (for testing server)
+    """
+    def __init__(self, strategy: Strategy, host: str = '127.0.0.1', port: int = 0) -> None:
+        """
+        Init method of FakeClient class
+        :param strategy: strategy, which makes decisions of all seats
+        :param host: host of server
+        :param port: port of server
+        """
+        self.strategy = strategy
+        self.host = host
+        self.port = port
+
+    async def play(self, rounds: int, seats: int = 1) -> list[RoundResult]:
+        """
+        Open table on server and play rounds
+        :param rounds: number of rounds
+        :param seats: number of seats
+        :return: list of results of each round
+        """
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(f'PLAY {rounds} {seats}\n'.encode())
+        results = []
+        try:
+            while 1:
+                words = (await reader.readline()).split()
+                if not words or words[0] == b'END':
+                    return results
+                match words[0]:
+                    case b'BET':
+                        writer.write(f'{self.strategy.make_bet()}\n'.encode())
+                    case b'DECIDE':
+                        points, soft, pair, upcard, options = map(int, words[2:])
+                        action = self.strategy.decide(points, soft == 1, pair == 1, upcard, options)
+                        writer.write(f'{action}\n'.encode())
+                    case b'ROUND':
+                        hands = []
+                        for _ in range(int(words[3])):
+                            hands.append(SeatResult(*map(int, (await reader.readline()).split()[1:])))
+                        results.append(RoundResult(int(words[1]), words[2] == b'1', hands))
+                    case _:
+                        raise ConnectionError(b' '.join(words).decode())
+        finally:
+            writer.close()
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765) -> None:
+    """
+    Run server until it's stopped
+    :param host: host of server
+    :param port: port of server
+    :return: Nothing
+    """
+    server = TableServer(host, port)
+    await server.start()
+    async with server.server:
+        await server.server.serve_forever()
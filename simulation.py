@@ -0,0 +1,210 @@
+"""
+BlackJack module with multi-core Monte Carlo simulation of rounds
+"""
+
+from deck import CompactDeck, ShufflerDeck
+from engine import Engine, BotStrategy, PolicyStrategy, RoundResult, WIN, BLACKJACK, DRAW, LOSS, BUST, SURRENDERED
+from itertools import product
+from ledger import RunningStats
+from os import cpu_count
+from random import Random
+
+
+class Stats:
+    """
+    Counters of outcomes and bankroll delta of simulated rounds
+    """
+    def __init__(self) -> None:
+        """
+        Init method of Stats class
+        """
+        self.rounds = 0
+        self.hands = 0
+        # counters of outcomes, indexed by engine outcomes (WIN, BLACKJACK, DRAW, LOSS, BUST, SURRENDERED)
+        self.outcomes = [0] * 6
+        self.bet = 0
+        self.payout = 0
+        self.net = RunningStats()  # statistics of net results of hands (mean, variance, house edge, drawdown)
+
+    def __repr__(self) -> str:
+        """
+        Repr method of Stats class
+        :return: rounds, outcomes and bankroll delta in one string
+        """
+        return f'Stats(rounds={self.rounds}, hands={self.hands}, wins={self.wins}, draws={self.draws}, ' \
+               f'losses={self.losses}, busts={self.busts}, blackjacks={self.blackjacks}, ' \
+               f'surrenders={self.surrenders}, bankroll={self.bankroll})'
+
+    @property
+    def wins(self) -> int:
+        return self.outcomes[WIN]
+
+    @property
+    def blackjacks(self) -> int:
+        return self.outcomes[BLACKJACK]
+
+    @property
+    def draws(self) -> int:
+        return self.outcomes[DRAW]
+
+    @property
+    def losses(self) -> int:
+        return self.outcomes[LOSS]
+
+    @property
+    def busts(self) -> int:
+        return self.outcomes[BUST]
+
+    @property
+    def surrenders(self) -> int:
+        return self.outcomes[SURRENDERED]
+
+    @property
+    def bankroll(self) -> int:
+        """
+        Bankroll delta of all seats (payouts minus bets)
+        :return: bankroll delta
+        """
+        return self.payout - self.bet
+
+    def add(self, result: RoundResult) -> None:
+        """
+        Add result of one round to counters
+        :param result: result of round from Engine.play_round
+        :return: Nothing
+        """
+        self.rounds += 1
+        outcomes = self.outcomes
+        add = self.net.add
+        for seat in result.seats:
+            outcomes[seat.outcome] += 1
+            self.bet += seat.bet
+            self.payout += seat.payout
+            add(seat.payout - seat.bet, seat.bet)
+        self.hands += len(result.seats)
+
+    def merge(self, other: 'Stats') -> 'Stats':
+        """
+        Add counters of other Stats to these (rounds of other worker are counted as played after these ones)
+        :param other: counters of other worker
+        :return: self
+        """
+        self.rounds += other.rounds
+        self.hands += other.hands
+        for i, count in enumerate(other.outcomes):
+            self.outcomes[i] += count
+        self.bet += other.bet
+        self.payout += other.payout
+        self.net.merge(other.net)
+        return self
+
+
+def run_worker(seed: int, rounds: int, bots: int, csm: bool = False) -> Stats:
+    """
+    Play rounds on own table with own seeded deck and bots
+    :param seed: seed of worker's random generator
+    :param rounds: number of rounds
+    :param bots: number of bots on table
+    :param csm: is table dealt by continuous shuffling machine instead of shoe
+    :return: counters of played rounds
+    """
+    rng = Random(seed)
+    table = Engine([BotStrategy(rng) for _ in range(bots)], ShufflerDeck(rng) if csm else CompactDeck(rng))
+    stats = Stats()
+    for _ in range(rounds):
+        stats.add(table.play_round())
+    return stats
+
+
+def simulate(rounds: int, workers: int | None = None, bots: int = 4, seed: int | None = None,
+             csm: bool = False) -> Stats:
+    """
+    Split rounds across process pool and merge counters of all workers
+    :param rounds: number of rounds
+    :param workers: number of processes (number of cores if not given)
+    :param bots: number of bots on each table
+    :param seed: seed, from which seeds of workers are made (random if not given)
+    :param csm: are tables dealt by continuous shuffling machine instead of shoe
+    :return: merged counters
+    """
+    workers = workers or cpu_count() or 1
+    seeds = Random(seed)
+    chunks = [rounds // workers + (1 if i < rounds % workers else 0) for i in range(workers)]
+
+    stats = Stats()
+    if workers == 1:
+        return stats.merge(run_worker(seeds.getrandbits(64), rounds, bots, csm))
+
+    from concurrent.futures import ProcessPoolExecutor  # workers don't need it, so it's imported only here
+
+    with ProcessPoolExecutor(workers) as pool:
+        futures = [pool.submit(run_worker, seeds.getrandbits(64), chunk, bots, csm) for chunk in chunks if chunk]
+        for future in futures:
+            stats.merge(future.result())
+    return stats
+
+
+def policy_grid(max_values=range(15, 21), surrender_values=(range(0), range(15, 17), range(14, 18)),
+                split_values=(frozenset(), frozenset((8, 11))), insurances=(False, True)) -> list[PolicyStrategy]:
+    """
+    Make policies for every combination of rules
+    :param max_values: points, on which policy stops taking cards
+    :param surrender_values: ranges of points, with which policy surrenders
+    :param split_values: sets of values of pair cards, which policy splits
+    :param insurances: does policy take insurance
+    :return: list of policies
+    """
+    return [PolicyStrategy(*rules) for rules in product(max_values, surrender_values, split_values, insurances)]
+
+
+def run_policy(policy: PolicyStrategy, seed: int, rounds: int, seats: int) -> Stats:
+    """
+    Play rounds with the same policy on every seat. Deck is shuffled only by seed, so every policy, which is played
+    with the same seed, gets the same shoes
+    :param policy: policy of all seats
+    :param seed: seed of deck
+    :param rounds: number of rounds
+    :param seats: number of seats on table
+    :return: counters of played rounds
+    """
+    table = Engine([policy] * seats, CompactDeck(Random(seed)))
+    stats = Stats()
+    for _ in range(rounds):
+        stats.add(table.play_round())
+    return stats
+
+
+def sweep(rounds: int, policies: list[PolicyStrategy], workers: int | None = None, seats: int = 1,
+          seed: int | None = None, chunks: int = 8) -> list[tuple[PolicyStrategy, Stats]]:
+    """
+    Play rounds with every policy on process pool and rank policies by EV. Rounds are split into chunks with own
+    seeds, and all policies play the same chunks (common random numbers), so differences between policies are
+    found with far fewer rounds than with independent decks
+    :param rounds: number of rounds for each policy
+    :param policies: policies to compare (see policy_grid)
+    :param workers: number of processes (number of cores if not given)
+    :param seats: number of seats on each table
+    :param seed: seed, from which seeds of chunks are made (random if not given)
+    :param chunks: number of chunks, into which rounds of each policy are split
+    :return: pairs of policy and its merged counters, from best EV to worst
+    """
+    workers = workers or cpu_count() or 1
+    seeds = Random(seed)
+    chunks = max(1, min(chunks, rounds))
+    tasks = [(seeds.getrandbits(64), rounds // chunks + (1 if i < rounds % chunks else 0)) for i in range(chunks)]
+
+    results = [Stats() for _ in policies]
+    if workers == 1:
+        for stats, policy in zip(results, policies):
+            for chunk_seed, chunk in tasks:
+                stats.merge(run_policy(policy, chunk_seed, chunk, seats))
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # workers don't need it, so it's imported only here
+
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [[pool.submit(run_policy, policy, chunk_seed, chunk, seats) for chunk_seed, chunk in tasks]
+                       for policy in policies]
+            for stats, policy_futures in zip(results, futures):
+                for future in policy_futures:
+                    stats.merge(future.result())
+    return sorted(zip(policies, results), key=lambda pair: pair[1].net.house_edge)
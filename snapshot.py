@@ -0,0 +1,298 @@
+"""
+BlackJack module with compact binary snapshot of table (Game), so table can be removed from memory and restored
+later (between rounds or between phases of round).
+
+Snapshot is little-endian and has these parts:
+    TABLE      settings, round, shoe, ledger totals, statistics and outcomes of table
+    RNG        state of random generator of table (it's used by bots too)
+    DECK       deck settings, position, counts and card codes of whole deck (and RNG of deck if it isn't seeded)
+    PLAYER     each player (Bot, Player, Dealer): kind, max value of Bot with random choices and name
+    HAND       each hand of round in engine: seat, number, bets, flags, actions, outcome, payout and card codes
+    lists      card codes of Dealer, bets of round, bankroll of seats, shoe_starts, hands of round and hands,
+               which left game, amounts of Player's answers in each round and these answers
+Strings are utf-8 with uint16 length.
+"""
+
+import deck
+import game
+import players
+import struct
+from array import array
+from consts import CARD_VALUES
+from engine import Engine, BotStrategy
+from hand import Hand, SeatHand
+from ledger import Ledger, RunningStats
+from random import Random
+from render import Render
+from strategy import BasicStrategy
+
+MAGIC = b'BJS4'
+# magic, flags, verbosity, max splits, players, hands of round, amount of bots, round, shoe, seed, wagered and paid
+# cents, statistics (count, mean, m2, total, wagered, peak, trough, max drawdown), outcomes, numbers of Dealer's cards,
+# bets, bankrolls, shoe starts, hands of round, hands, which left game, and rounds with answers of Player
+TABLE = struct.Struct('<4sBBBHHiIiqqqqddqqqqq6IBHHIHHI')
+# flags, decks, penetration, position, cut card, running count, shuffles, seed, counting tags, counts of pictures
+DECK = struct.Struct(f'<BBdHHiIq{len(CARD_VALUES)}b{len(CARD_VALUES)}H')
+# gauss_next (NaN if it's None) and 625 words of Mersenne Twister
+RNG = struct.Struct('<d625I')
+# kind, max value of Bot with random choices (0 for others)
+PLAYER = struct.Struct('<BB')
+# seat, number, bet, insurance bet, flags, actions, outcome, payout, number of cards
+HAND = struct.Struct('<HBIIBBbIB')
+LENGTH = struct.Struct('<H')
+
+# flags of table
+HUMAN, BASIC_STRATEGY, ADVISOR_BOTS, SEEDED, BOTS_ASKED = (1 << i for i in range(5))
+# flags of deck
+DECK_SEEDED, DECK_RNG = 1, 2
+# kinds of players
+BOT, PLAYER_KIND, DEALER = range(3)
+# flags of hand
+HAND_BLACKJACK = 1
+
+
+def _pack_str(parts: list, text: str) -> None:
+    """
+    Add utf-8 string with its length to parts of snapshot
+    :param parts: parts of snapshot
+    :param text: string
+    :return: Nothing
+    """
+    data = text.encode()
+    parts.append(LENGTH.pack(len(data)))
+    parts.append(data)
+
+
+def _unpack_str(data: bytes, offset: int) -> tuple[str, int]:
+    """
+    Read string of _pack_str
+    :param data: bytes of snapshot
+    :param offset: offset of string
+    :return: string and offset after it
+    """
+    length, = LENGTH.unpack_from(data, offset)
+    offset += LENGTH.size
+    return data[offset:offset + length].decode(), offset + length
+
+
+def _pack_rng(rng: Random) -> bytes:
+    """
+    Pack state of random generator
+    :param rng: random generator
+    :return: bytes of RNG part
+    """
+    _, words, gauss = rng.getstate()
+    return RNG.pack(float('nan') if gauss is None else gauss, *words)
+
+
+def _unpack_rng(data: bytes, offset: int) -> Random:
+    """
+    Make random generator with state from _pack_rng
+    :param data: bytes of snapshot
+    :param offset: offset of RNG part
+    :return: random generator
+    """
+    gauss, *words = RNG.unpack_from(data, offset)
+    rng = Random(0)  # state is replaced, so generator isn't seeded from system randomness
+    rng.setstate((3, tuple(words), None if gauss != gauss else gauss))
+    return rng
+
+
+def dump(table: game.Game) -> bytes:
+    """
+    Make snapshot of table
+    :param table: table (Game class object)
+    :return: bytes of snapshot
+    """
+    engine = table.engine
+    flags = HUMAN if table.human else 0
+    if table.advisor is not None and table.bot_strategy is table.advisor:
+        flags |= ADVISOR_BOTS
+    elif table.bot_strategy is not None:
+        flags |= BASIC_STRATEGY
+    if table.seed is not None:
+        flags |= SEEDED
+    if table.amount_of_bots is not None:
+        flags |= BOTS_ASKED
+    stats = table.stats
+    parts = [TABLE.pack(MAGIC, flags, table.render.level, table.max_splits, len(table.seats), len(engine.hands),
+                        -1 if table.amount_of_bots is None else table.amount_of_bots, table.round, table.shoe,
+                        table.seed or 0, table.ledger.wagered, table.ledger.paid,
+                        stats.count, stats.mean, stats.m2, stats.total, stats.wagered, stats.peak, stats.trough,
+                        stats.max_drawdown, *table.outcomes, len(engine.dealer), len(table.bets),
+                        len(table.ledger.balances), len(table.shoe_starts), len(table.round_hands),
+                        len(table.left_hands), len(table.answers)),
+             _pack_rng(table.rng)]
+
+    shoe = table.deck
+    deck_flags = (DECK_SEEDED if shoe.seed is not None else 0) | \
+        (DECK_RNG if shoe.rng is not None and shoe.seed is None else 0)
+    parts.append(DECK.pack(deck_flags, shoe.decks, shoe.penetration, shoe.position, shoe.cut_card,
+                           shoe.running_count, shoe.shoes, shoe.seed or 0, *shoe.counting, *shoe.counts))
+    parts.append(LENGTH.pack(len(shoe.deck_cards)))
+    parts.append(shoe.deck_cards.tobytes())
+    if deck_flags & DECK_RNG:
+        parts.append(_pack_rng(shoe.rng))
+
+    for player in table.seats:
+        if isinstance(player, players.Dealer):
+            parts.append(PLAYER.pack(DEALER, 0))
+        elif isinstance(player, players.Player):
+            parts.append(PLAYER.pack(PLAYER_KIND, 0))
+        else:
+            random_choices = isinstance(player.strategy, BotStrategy)
+            parts.append(PLAYER.pack(BOT, player.strategy.max_value if random_choices else 0))
+        _pack_str(parts, player.name)
+
+    hand_indexes = {id(hand): i for i, hand in enumerate(engine.hands)}
+    for hand in engine.hands:
+        parts.append(HAND.pack(hand.seat, hand.number, hand.bet, hand.ins_bet, HAND_BLACKJACK if hand.blackjack else 0,
+                               hand.actions, hand.outcome, hand.payout, len(hand)))
+        parts.append(bytes(hand.cards))
+
+    parts.append(bytes(engine.dealer.cards))
+    parts.append(array('I', table.bets).tobytes())
+    parts.append(array('q', table.ledger.balances).tobytes())
+    parts.append(table.shoe_starts.tobytes())
+    parts.append(array('H', [hand_indexes[id(hand)] for hand in table.round_hands]).tobytes())
+    parts.append(array('H', [hand_indexes[id(hand)] for hand in table.left_hands]).tobytes())
+    parts.append(array('I', map(len, table.answers)).tobytes())
+    parts.extend(answers.tobytes() for answers in table.answers)
+    return b''.join(parts)
+
+
+def load(data: bytes) -> game.Game:
+    """
+    Make table from snapshot, so table continues from the same moment
+    :param data: bytes of snapshot from dump
+    :return: restored table (Game class object)
+    """
+    (magic, flags, verbosity, max_splits, seats, hands, amount_of_bots, round_number, shoe_number, seed, wagered, paid,
+     count, mean, m2, total, stats_wagered, peak, trough, max_drawdown, *rest) = \
+        TABLE.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError('not a snapshot of table')
+    outcomes, (dealer_cards, bets, balances, shoe_starts, round_hands, left_hands, answer_rounds) = \
+        list(rest[:6]), rest[6:]
+    offset = TABLE.size
+
+    # table is made without __init__, so it doesn't make deck, players and strategies, which are restored here
+    table = game.Game.__new__(game.Game)
+    table.max_splits = max_splits
+    table.amount_of_bots = amount_of_bots if flags & BOTS_ASKED else None
+    table.human = bool(flags & HUMAN)
+    table.metrics = None
+    table.history = None
+    table.render = Render(verbosity)
+    table.ledger = Ledger()
+    table.ledger.wagered, table.ledger.paid = wagered, paid
+    table.stats = stats = RunningStats()
+    stats.count, stats.mean, stats.m2, stats.total = count, mean, m2, total
+    stats.wagered, stats.peak, stats.trough, stats.max_drawdown = stats_wagered, peak, trough, max_drawdown
+    table.outcomes = outcomes
+    table.seed = seed if flags & SEEDED else None
+    table.round = round_number
+    table.shoe = shoe_number
+    table.rng = _unpack_rng(data, offset)
+    offset += RNG.size
+
+    deck_flags, decks, penetration, position, cut_card, running_count, shuffles, deck_seed, *rest = \
+        DECK.unpack_from(data, offset)
+    offset += DECK.size
+    shoe = deck.CompactDeck.__new__(deck.CompactDeck)
+    shoe.seed = deck_seed if deck_flags & DECK_SEEDED else None
+    shoe.decks = decks
+    shoe.penetration = penetration
+    shoe.position = position
+    shoe.cut_card = cut_card
+    shoe.running_count = running_count
+    shoe.shoes = shuffles
+    shoe.counting = tuple(rest[:len(CARD_VALUES)])
+    shoe.counts = rest[len(CARD_VALUES):]
+    length, = LENGTH.unpack_from(data, offset)
+    offset += LENGTH.size
+    shoe.deck_cards = array('B', data[offset:offset + length])
+    offset += length
+    shoe.ordered = array('B', range(len(deck.CARD_CODES))) * decks  # each seeded shoe is shuffled from it
+    if shoe.seed is not None:
+        shoe.rng = Random(0)  # it's seeded again before each shuffle
+    elif deck_flags & DECK_RNG:
+        shoe.rng = _unpack_rng(data, offset)
+        offset += RNG.size
+    else:
+        shoe.rng = None
+    table.deck = shoe
+    table.engine = engine = Engine([], shoe, max_splits)
+    table.advisor = None
+    if flags & (HUMAN | ADVISOR_BOTS):
+        from advisor import AdvisorStrategy  # advisor is imported only for tables, which use it (as in Game)
+        table.advisor = AdvisorStrategy(engine)
+    if flags & ADVISOR_BOTS:
+        table.bot_strategy = table.advisor
+    elif flags & BASIC_STRATEGY:
+        table.bot_strategy = BasicStrategy()  # own strategy of table, as in Game
+    else:
+        table.bot_strategy = None
+
+    table.seats = []
+    for seat in range(seats):
+        kind, max_value = PLAYER.unpack_from(data, offset)
+        offset += PLAYER.size
+        name, offset = _unpack_str(data, offset)
+        if kind == DEALER:
+            player = players.Dealer.__new__(players.Dealer)
+        elif kind == PLAYER_KIND:
+            player = players.Player.__new__(players.Player)
+        else:
+            player = players.Bot.__new__(players.Bot)
+            if max_value:
+                player.strategy = BotStrategy.__new__(BotStrategy)
+                player.strategy.randint = table.rng.randint
+                player.strategy.max_value = max_value
+                player.strategy.surrender_value = range(14, 18)
+            else:
+                player.strategy = table.bot_strategy
+        player.name = name
+        player.seat = seat
+        player.render = table.render
+        if kind == PLAYER_KIND:
+            player.advisor = table.advisor
+        table.seats.append(player)
+    table.list_of_players = table.seats.copy()
+
+    engine_hands = []
+    for _ in range(hands):
+        seat, number, bet, ins_bet, hand_flags, actions, outcome, payout, cards = HAND.unpack_from(data, offset)
+        offset += HAND.size
+        hand = SeatHand(seat, bet)
+        for card in data[offset:offset + cards]:
+            hand.add(card)
+        offset += cards
+        hand.number, hand.ins_bet, hand.actions, hand.outcome, hand.payout = number, ins_bet, actions, outcome, payout
+        hand.blackjack = bool(hand_flags & HAND_BLACKJACK)
+        engine_hands.append(hand)
+    engine.dealer = Hand(data[offset:offset + dealer_cards])
+    offset += dealer_cards
+    engine.upcard = deck.CARD_CODE_VALUES[engine.dealer[0]] if dealer_cards else 0
+
+    table.bets = array('I', data[offset:offset + 4 * bets]).tolist()
+    offset += 4 * bets
+    engine.load_hands(engine_hands, len(table.bets))
+    table.ledger.balances = array('q', data[offset:offset + 8 * balances]).tolist()
+    offset += 8 * balances
+    table.shoe_starts = array('I', data[offset:offset + 4 * shoe_starts])
+    offset += 4 * shoe_starts
+    indexes = array('H', data[offset:offset + 2 * (round_hands + left_hands)])
+    table.round_hands = [engine.hands[i] for i in indexes[:round_hands]]
+    table.left_hands = [engine.hands[i] for i in indexes[round_hands:]]
+    offset += 2 * (round_hands + left_hands)
+
+    lengths = array('I', data[offset:offset + 4 * answer_rounds])
+    offset += 4 * answer_rounds
+    table.answers = []
+    for length in lengths:
+        table.answers.append(array('H', data[offset:offset + 2 * length]))
+        offset += 2 * length
+    table.replaying = False
+    table._recorded = None
+    return table
@@ -0,0 +1,232 @@
+"""
+BlackJack module with basic strategy table, which is generated from rules and cached on disk
+"""
+
+from consts import CACHE_DIR, DEALER_HITS_SOFT_17
+from deck import Deck
+from engine import Strategy, HIT, STAND, SURRENDER, DOUBLE, SPLIT, INSURANCE, CAN_SURRENDER, CAN_DOUBLE, \
+    CAN_SPLIT, CAN_INSURANCE, CAN_REWARD, HIT_OR_STAND
+from functools import lru_cache
+from os import makedirs, path
+
+# probability of each card value in shoe (Jack, Queen, King and 10 have value 10)
+CARD_PROBABILITIES = {value: (4 if value == 10 else 1) / 13 for value in range(2, 12)}
+
+# kinds of rows in table
+HARD, SOFT, PAIR = range(3)
+# table has row for each kind and points (or value of pair card) 0..21 and column for each upcard 0..11
+ROWS = 22
+COLUMNS = 12
+
+
+class Rules:
+    """
+    Rules of table, from which basic strategy is generated
+    """
+    def __init__(self, h17: bool = DEALER_HITS_SOFT_17, surrender: bool = True, double: bool = True) -> None:
+        """
+        Init method of Rules class
+        :param h17: does Dealer take card on soft 17 or no
+        :param surrender: can player surrender or no
+        :param double: can player double or no
+        """
+        self.h17 = h17
+        self.surrender = surrender
+        self.double = double
+
+    def __repr__(self) -> str:
+        """
+        Repr method of Rules class
+        :return: short name of rules (it's used in name of cache file)
+        """
+        return f'{"h17" if self.h17 else "s17"}{"_sur" if self.surrender else ""}{"_das" if self.double else ""}'
+
+
+def add_card(points: int, soft: bool, value: int) -> tuple[int, bool]:
+    """
+    Add card to hand, which is described by its points
+    :param points: points of hand
+    :param soft: is one of Aces in hand counted as 11 or no
+    :param value: value of card (Ace is 11)
+    :return: new points and softness of hand
+    """
+    if value == 11:
+        if points + 11 <= 21:
+            return points + 11, True
+        points += 1
+    else:
+        points += value
+    if points > 21 and soft:
+        return points - 10, False
+    return points, soft
+
+
+def stand_ev(points: int, finals: tuple[float, ...]) -> float:
+    """
+    Expected value of standing with points against Dealer
+    :param points: points of player
+    :param finals: probabilities of Dealer's final points
+    :return: expected value in bets
+    """
+    ev = finals[5]
+    for dealer_points, probability in zip(range(17, 22), finals):
+        if points > dealer_points:
+            ev += probability
+        elif points < dealer_points:
+            ev -= probability
+    return ev
+
+
+def generate_table(rules: Rules) -> bytes:
+    """
+    Generate table of best actions for each hand and upcard by calculating expected value of actions
+    :param rules: rules of table
+    :return: bytes with first choices (rows of HARD, SOFT, PAIR) and then hit/stand choices (rows of HARD, SOFT)
+    """
+    from dealer_odds import DealerOdds  # dealer_odds imports this module, so it's imported here
+    odds = DealerOdds(rules.h17)
+    table = bytearray(5 * ROWS * COLUMNS)
+    hit_stand = 3 * ROWS * COLUMNS
+
+    for upcard in range(2, 12):
+        finals = odds.finals(None, *add_card(0, False, upcard))
+
+        @lru_cache(maxsize=None)
+        def best(points: int, soft: bool) -> float:
+            if points > 21:
+                return -1.
+            return max(stand_ev(points, finals), hit(points, soft))
+
+        def hit(points: int, soft: bool) -> float:
+            return sum(probability * best(*add_card(points, soft, value))
+                       for value, probability in CARD_PROBABILITIES.items())
+
+        def double(points: int, soft: bool) -> float:
+            ev = 0.
+            for value, probability in CARD_PROBABILITIES.items():
+                new_points, _ = add_card(points, soft, value)
+                ev += probability * (-1. if new_points > 21 else stand_ev(new_points, finals))
+            return 2 * ev
+
+        def first_choice(points: int, soft: bool) -> tuple[int, float]:
+            evs = {STAND: stand_ev(points, finals), HIT: hit(points, soft)}
+            if rules.double:
+                evs[DOUBLE] = double(points, soft)
+            if rules.surrender:
+                evs[SURRENDER] = -.5
+            action = max(evs, key=evs.get)
+            return action, evs[action]
+
+        for points in range(4, 22):
+            for kind, soft in ((HARD, False), (SOFT, True)):
+                if soft and points < 12:
+                    continue
+                table[(kind * ROWS + points) * COLUMNS + upcard] = first_choice(points, soft)[0]
+                table[hit_stand + (kind * ROWS + points) * COLUMNS + upcard] = \
+                    HIT if hit(points, soft) > stand_ev(points, finals) else STAND
+
+        for value in range(2, 12):
+            points, soft = add_card(*add_card(0, False, value), value)
+            action, ev = first_choice(points, soft)
+            split_hand = add_card(0, False, value)
+            split_ev = 2 * sum(probability * first_choice(*add_card(*split_hand, card))[1]
+                               for card, probability in CARD_PROBABILITIES.items())
+            table[(PAIR * ROWS + value) * COLUMNS + upcard] = SPLIT if split_ev > ev else action
+
+    return bytes(table)
+
+
+def load_table(rules: Rules) -> bytes:
+    """
+    Load table from cache file or generate it and save to cache file
+    :param rules: rules of table
+    :return: table from generate_table
+    """
+    file_name = path.join(CACHE_DIR, f'basic_strategy_{rules!r}.bin')
+    if path.exists(file_name):
+        with open(file_name, 'rb') as file:
+            table = file.read()
+        if len(table) == 5 * ROWS * COLUMNS:
+            return table
+
+    table = generate_table(rules)
+    makedirs(CACHE_DIR, exist_ok=True)
+    with open(file_name, 'wb') as file:
+        file.write(table)
+    return table
+
+
+class BasicStrategy(Strategy):
+    """
+    Strategy, which takes actions from basic strategy table
+    """
+    def __init__(self, rules: Rules | None = None) -> None:
+        """
+        Init method of BasicStrategy class
+        :param rules: rules of table (default Rules if not given)
+        """
+        self.table = load_table(rules or Rules())
+
+    def lookup(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> int:
+        """
+        Find action for hand in table
+        :param points: points of hand
+        :param soft: is one of Aces in hand counted as 11 or no
+        :param pair: does hand have two cards with same value
+        :param upcard: value of Dealer's open card (Ace is 11)
+        :param options: bit mask of legal actions
+        :return: action from table
+        """
+        if options == HIT_OR_STAND:
+            return self.table[((3 + soft) * ROWS + points) * COLUMNS + upcard]
+
+        if pair and options & CAN_SPLIT:
+            action = self.table[(PAIR * ROWS + (11 if soft else points // 2)) * COLUMNS + upcard]
+            if action == SPLIT:
+                return SPLIT
+        action = self.table[(soft * ROWS + points) * COLUMNS + upcard]
+        if action == DOUBLE and not options & CAN_DOUBLE or action == SURRENDER and not options & CAN_SURRENDER:
+            return self.table[((3 + soft) * ROWS + points) * COLUMNS + upcard]
+        return action
+
+    def decide(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> int:
+        if options & CAN_REWARD:
+            return STAND  # BlackJack, which stands, is paid 3 bets (if Dealer has no 21), instant reward only 2
+        return self.lookup(points, soft, pair, upcard, options)
+
+
+class CountingStrategy(BasicStrategy):
+    """
+    Basic strategy, which sizes bets and deviates from table by true count of deck
+    """
+    # deviations from table: (points, upcard): true count, from which hand stands instead of hitting
+    STAND_DEVIATIONS = {(16, 10): 0, (15, 10): 4, (12, 3): 2, (12, 2): 3, (13, 2): -1, (12, 4): 0}
+
+    def __init__(self, deck: Deck, rules: Rules | None = None, base_bet: int = 50, max_units: int = 8) -> None:
+        """
+        Init method of CountingStrategy class
+        :param deck: deck of table, which is counted
+        :param rules: rules of table (default Rules if not given)
+        :param base_bet: bet with true count 1 or less
+        :param max_units: maximum bet in base bets
+        """
+        super().__init__(rules)
+        self.deck = deck
+        self.base_bet = base_bet
+        self.max_units = max_units
+
+    def make_bet(self) -> int:
+        units = int(self.deck.true_count)
+        return self.base_bet * min(max(units, 1), self.max_units)
+
+    def decide(self, points: int, soft: bool, pair: bool, upcard: int, options: int) -> int:
+        if options & CAN_REWARD:
+            return STAND
+        if options & CAN_INSURANCE and self.deck.true_count >= 3:
+            return INSURANCE
+        action = self.lookup(points, soft, pair, upcard, options)
+        if action == HIT and not soft:
+            deviation = self.STAND_DEVIATIONS.get((points, upcard))
+            if deviation is not None and self.deck.true_count >= deviation:
+                return STAND
+        return action
@@ -0,0 +1,29 @@
+"""
+Tests of dealer_odds module: distributions of Dealer's final points and their cache file
+"""
+
+import tempfile
+import unittest
+from dealer_odds import DealerOdds, BUST
+from os import path
+
+
+class DealerOddsTest(unittest.TestCase):
+    def test_results_are_saved_at_exit(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = path.join(directory, 'odds', 'dealer_odds.pickle')
+            with DealerOdds(False, file_name) as odds:
+                rates = [odds.bust_rate(upcard, 1) for upcard in range(2, 12)]
+                self.assertFalse(path.exists(file_name))  # results are in memory until owner saves them
+            self.assertTrue(path.exists(file_name))
+
+            loaded = DealerOdds(False, file_name)
+            self.assertEqual(len(loaded.results), 10)
+            loaded.finals = None  # loaded results don't need calculation
+            self.assertEqual([loaded.for_decks(upcard, 1)[BUST] for upcard in range(2, 12)], rates)
+            for finals in loaded.results.values():
+                self.assertAlmostEqual(sum(finals), 1.)
+
+
+if __name__ == '__main__':
+    unittest.main()
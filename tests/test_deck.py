@@ -0,0 +1,46 @@
+"""
+Tests of deck module: counts of cards left in deck and running count, which are counted lazily when they're read
+"""
+
+import unittest
+from consts import CARD_SUITS, CARD_VALUES, HI_LO
+from deck import Deck, CompactDeck
+from random import Random
+
+
+class DeckTest(unittest.TestCase):
+    def assertCountedLikeTakenCards(self, deck: Deck) -> None:
+        ranks = deck._ranks(deck.deck_cards[:deck.position])
+        self.assertEqual(deck.counts, [len(CARD_SUITS) * deck.decks - ranks.count(rank)
+                                       for rank in range(len(CARD_VALUES))])
+        self.assertEqual(deck.running_count, sum(HI_LO[rank] for rank in ranks))
+
+    def test_lazy_counts_are_eager_counts(self) -> None:
+        rng = Random(7)
+        for deck in (Deck(seed=1, decks=2), CompactDeck(seed=1, decks=2)):
+            for _ in range(300):  # a few shuffles, and counts are read after any number of taken cards
+                for _ in range(rng.randint(0, 12)):
+                    deck.take_card_from_deck()
+                if rng.random() < 0.5:
+                    self.assertCountedLikeTakenCards(deck)
+                deck.shuffle_if_needed()
+            self.assertGreater(deck.shoes, 2)
+
+    def test_counts_are_set_after_taken_cards(self) -> None:
+        deck = CompactDeck(seed=2)
+        for _ in range(20):
+            deck.take_card_from_deck()
+        counts = deck.counts[:]
+        running_count = deck.running_count
+        for _ in range(20):
+            deck.take_card_from_deck()
+        deck.counts = counts[:]  # cards, which were taken before, aren't subtracted again
+        deck.running_count = running_count
+        self.assertEqual(deck.counts, counts)
+        self.assertEqual(deck.running_count, running_count)
+        deck.take_card_from_deck()
+        self.assertEqual(sum(deck.counts), sum(counts) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
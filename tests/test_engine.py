@@ -0,0 +1,33 @@
+"""
+Tests of engine module: hands of splits in pool of Engine
+"""
+
+import unittest
+from deck import CompactDeck
+from engine import Engine, PolicyStrategy
+
+
+class EngineTest(unittest.TestCase):
+    def test_split_hands_follow_their_seat(self) -> None:
+        engine = Engine([PolicyStrategy(17, split_values=frozenset(range(2, 12)))] * 3, CompactDeck(seed=2),
+                        max_splits=2)
+        engine.play_round()
+        pool = list(map(id, engine.pool))
+        splits = 0
+        for _ in range(500):
+            result = engine.play_round()
+            seats = [hand.seat for hand in engine.hands]
+            self.assertEqual(seats, sorted(seats))
+            self.assertEqual(seats, [seat.seat for seat in result.seats])
+            for seat in range(3):
+                hands = [hand for hand in engine.hands if hand.seat == seat]
+                self.assertLessEqual(len(hands), 3)
+                if len(hands) > 1:
+                    splits += 1
+                    self.assertEqual([hand.number for hand in hands], list(range(1, len(hands) + 1)))
+            self.assertEqual(list(map(id, engine.pool)), pool)  # hands are used again, not made
+        self.assertGreater(splits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests of game module: each replayed round of seeded table shows the same as when it was played first
+"""
+
+import io
+import unittest
+from array import array
+from contextlib import redirect_stdout
+from game import Game
+from players import Player
+from random import Random
+from unittest import mock
+
+ROUNDS = 400
+
+
+class Answers:
+    """
+    Scripted user of human table: random bets and choices (wrong ones too), which are kept for each round, so
+    round can be answered again in the same way
+    """
+    def __init__(self, seed: int) -> None:
+        self.rng = Random(seed)
+        self.rounds = []
+        self.given = None  # answers, which are given again instead of new ones
+
+    def __call__(self, prompt: str) -> str:
+        if self.given is not None:
+            return next(self.given)
+        if 'bet' in prompt:
+            answer = self.rng.choice(('50', '100', '200', '100', '25'))
+        elif 'now' in prompt:
+            answer = self.rng.choice('12123')
+        else:
+            answer = self.rng.choice('1122345678999')
+        self.rounds[-1].append(answer)
+        return answer
+
+
+def refuse(prompt: str) -> str:
+    raise AssertionError(f'replayed round asks user: {prompt!r}')
+
+
+class ReplayTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(Player, 'default_name', 'Tester')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    def play(table: Game) -> str:
+        output = io.StringIO()
+        with redirect_stdout(output):
+            table.play()
+        return output.getvalue()
+
+    def assertReplayedRounds(self, table: Game, replayed: Game, outputs: list[str], answers: Answers) -> None:
+        for number, output in enumerate(outputs):
+            with mock.patch('builtins.input', refuse):
+                replayed.replay(number, table.shoe_starts)
+            answers.given = iter(answers.rounds[number])
+            with mock.patch('builtins.input', answers):
+                self.assertEqual(self.play(replayed), output, f'round {number}')
+            if table.human:
+                self.assertEqual(replayed.answers[number], table.answers[number])
+
+    def test_bot_table(self) -> None:
+        table = Game(basic_strategy=True, amount_of_bots=3, human=False, seed=11)
+        answers = Answers(0)
+        outputs = []
+        for _ in range(ROUNDS):
+            answers.rounds.append([])
+            outputs.append(self.play(table))
+        replayed = Game(basic_strategy=True, amount_of_bots=3, human=False, seed=11)
+        self.assertReplayedRounds(table, replayed, outputs, answers)
+
+    def test_human_table(self) -> None:
+        answers = Answers(3)
+        table = Game(amount_of_bots=2, seed=4)
+        outputs = []
+        with mock.patch('builtins.input', answers):
+            for _ in range(ROUNDS):
+                answers.rounds.append([])
+                outputs.append(self.play(table))
+        # replayed table asks user only in round, which is played after replay (previous rounds use answers)
+        replayed = Game(amount_of_bots=2, seed=4)
+        replayed.answers = [array('H', round_answers) for round_answers in table.answers]
+        self.assertReplayedRounds(table, replayed, outputs, answers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Tests of history module: records of hands, which are appended by few writers, are read back in order of rounds
+"""
+
+import tempfile
+import unittest
+from deck import CompactDeck
+from engine import Engine, ThresholdStrategy
+from history import HistoryReader, HistoryWriter, DEALER_SEAT
+from os import path
+
+
+class HistoryTest(unittest.TestCase):
+    def test_appended_rounds_continue(self) -> None:
+        engine = Engine([ThresholdStrategy(17), ThresholdStrategy(15)], CompactDeck(seed=1))
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = path.join(directory, 'hands.bjh')
+            for _ in range(3):  # each session appends rounds to the same file
+                with HistoryWriter(file_name, batch=7) as history:
+                    for _ in range(10):
+                        history.write_result(engine.play_round())
+            with HistoryReader(file_name) as reader:
+                records = list(reader)
+                stats = reader.aggregate()
+        rounds = [record.round for record in records if record.seat == DEALER_SEAT]
+        self.assertEqual(rounds, list(range(30)))
+        self.assertEqual(stats.rounds, 30)
+        self.assertEqual([record.round for record in records], sorted(record.round for record in records))
+
+    def test_other_file_is_not_appended(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = path.join(directory, 'other.txt')
+            with open(file_name, 'w') as file:
+                file.write('text, which is not history of hands')
+            with self.assertRaises(ValueError):
+                HistoryWriter(file_name)
+            with open(file_name) as file:
+                self.assertEqual(file.read(), 'text, which is not history of hands')
+
+
+if __name__ == '__main__':
+    unittest.main()
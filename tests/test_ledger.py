@@ -0,0 +1,47 @@
+"""
+Tests of ledger module: streaming statistics, which are merged or added by arrays, are the same as added by hands
+"""
+
+import unittest
+import numpy as np
+from ledger import RunningStats
+from random import Random
+
+
+class RunningStatsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = Random(5)
+        self.bets = [rng.choice((50, 100, 200)) for _ in range(3000)]
+        self.nets = [bet * rng.choice((-1, -1, 0, 1, 2)) for bet in self.bets]
+        self.expected = RunningStats()
+        for net, bet in zip(self.nets, self.bets):
+            self.expected.add(net, bet)
+
+    def assertSameStats(self, stats: RunningStats) -> None:
+        expected = self.expected
+        self.assertEqual(stats.count, expected.count)
+        self.assertAlmostEqual(stats.mean, expected.mean)
+        self.assertAlmostEqual(stats.m2 / expected.m2, 1.)
+        for name in ('total', 'wagered', 'peak', 'trough', 'max_drawdown'):
+            self.assertEqual(getattr(stats, name), getattr(expected, name), name)
+
+    def test_merge_is_sequential_add(self) -> None:
+        for parts in (2, 7, 30):
+            stats = RunningStats()
+            size = -(-len(self.nets) // parts)
+            for start in range(0, len(self.nets), size):
+                part = RunningStats()
+                for net, bet in zip(self.nets[start:start + size], self.bets[start:start + size]):
+                    part.add(net, bet)
+                stats.merge(part)
+            self.assertSameStats(stats)
+
+    def test_add_array_is_sequential_add(self) -> None:
+        stats = RunningStats()
+        for start in range(0, len(self.nets), 700):
+            stats.add_array(np.array(self.nets[start:start + 700]), np.array(self.bets[start:start + 700]))
+        self.assertSameStats(stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
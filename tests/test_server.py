@@ -0,0 +1,79 @@
+"""
+Tests of server module: rounds are played by FakeClient against TableServer on local port
+"""
+
+import asyncio
+import unittest
+from engine import BotStrategy, ThresholdStrategy, BLACKJACK, BUST, SURRENDERED, WIN, DRAW, LOSS
+from random import Random
+from server import TableServer, FakeClient, MAX_SEATS
+
+
+class TableServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = TableServer()
+        await self.server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.stop()
+
+    async def test_fake_client_plays_rounds(self) -> None:
+        results = await FakeClient(BotStrategy(Random(1)), port=self.server.port).play(20, seats=3)
+
+        self.assertEqual(len(results), 20)
+        for result in results:
+            self.assertEqual({hand.seat for hand in result.seats}, {0, 1, 2})
+            self.assertEqual(result.dealer_busted, result.dealer_points > 21)
+            for hand in result.seats:
+                self.assertIn(hand.outcome, (WIN, BLACKJACK, DRAW, LOSS, BUST, SURRENDERED))
+                # bet is 100 (200 after double), and insurance bet (half of 100) is added to bet and payout
+                insurance = hand.bet % 100
+                stake = hand.bet - insurance
+                if hand.outcome in (BUST, LOSS):
+                    self.assertIn(hand.payout, (0, 3 * insurance))
+                elif hand.outcome == DRAW:
+                    self.assertIn(hand.payout - stake, (0, 3 * insurance))
+                elif hand.outcome == WIN:
+                    self.assertIn(hand.payout - 2 * stake, (0, 3 * insurance))
+
+    async def test_threshold_client_stands_on_17(self) -> None:
+        results = await FakeClient(ThresholdStrategy(17), port=self.server.port).play(10)
+
+        for result in results:
+            for hand in result.seats:
+                if hand.outcome not in (BUST, BLACKJACK):
+                    self.assertGreaterEqual(hand.points, 17)
+
+    async def test_illegal_answer_is_asked_again(self) -> None:
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+        writer.write(b'PLAY 1 1\n')
+        self.assertEqual(await reader.readline(), b'BET 0\n')
+        writer.write(b'-5\n')
+        self.assertEqual(await reader.readline(), b'ERROR bet must be positive\n')
+        self.assertEqual(await reader.readline(), b'BET 0\n')
+        writer.write(b'100\n')
+
+        request = (await reader.readline()).split()
+        self.assertEqual(request[0], b'DECIDE')
+        options = int(request[-1])
+        illegal = next(action for action in range(8) if not options >> action & 1)
+        writer.write(f'{illegal}\n'.encode())
+        self.assertEqual(await reader.readline(), b'ERROR illegal action\n')
+        writer.close()
+
+    async def test_wrong_first_line(self) -> None:
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+        writer.write(b'HELLO\n')
+        self.assertEqual(await reader.readline(), b'ERROR expected PLAY <rounds> <seats>\n')
+        writer.close()
+
+    async def test_wrong_number_of_seats(self) -> None:
+        for line in (b'PLAY 1 0\n', f'PLAY 1 {MAX_SEATS + 1}\n'.encode()):
+            reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+            writer.write(line)
+            self.assertEqual(await reader.readline(), b'ERROR expected PLAY <rounds> <seats>\n')
+            writer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Tests of snapshot module: restored tables continue the same as table, from which snapshot was made
+"""
+
+import unittest
+from game import Game
+from render import QUIET
+from snapshot import dump, load
+
+
+class SnapshotTest(unittest.TestCase):
+    def assertSameTables(self, first: Game, second: Game) -> None:
+        self.assertEqual(first.ledger.balances, second.ledger.balances)
+        self.assertEqual(first.outcomes, second.outcomes)
+        self.assertEqual(first.stats.total, second.stats.total)
+
+    def test_unseeded_table_is_restored_twice(self) -> None:
+        table = Game(amount_of_bots=4, human=False, verbosity=QUIET)
+        for _ in range(30):
+            table.play()
+        data = dump(table)
+        first, second = load(data), load(data)
+        for _ in range(300):  # a few shuffles of deck
+            first.play()
+            second.play()
+        self.assertSameTables(first, second)
+
+    def test_table_continues_between_phases(self) -> None:
+        for kwargs in ({'basic_strategy': True}, {}, {'advisor_bots': True}):
+            table = Game(amount_of_bots=4, human=False, seed=5, verbosity=QUIET, **kwargs)
+            for _ in range(10):
+                table.play()
+            table._new_round()
+            table._hand_out_cards()
+            restored = load(dump(table))
+            for game in (table, restored):
+                game._player_choice()
+                game._left_game_check()
+                game._show_cards()
+                game._results()
+                for _ in range(20):
+                    game.play()
+            self.assertSameTables(table, restored)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Tests of strategy module: choices of basic strategy table and of card counting strategy
+"""
+
+import unittest
+from advisor import AdvisorStrategy
+from deck import CompactDeck
+from engine import Engine, FIRST_CHOICE, CAN_REWARD, STAND, BLACKJACK, DRAW
+from hand import Hand
+from strategy import BasicStrategy, CountingStrategy
+
+
+class StrategyTest(unittest.TestCase):
+    def test_blackjack_stands(self) -> None:
+        strategies = (BasicStrategy(), CountingStrategy(CompactDeck(seed=1)))
+        for strategy in strategies:
+            for upcard in range(2, 12):
+                self.assertEqual(strategy.decide(21, True, False, upcard, FIRST_CHOICE | CAN_REWARD), STAND)
+
+    def test_blackjack_is_paid_after_dealer(self) -> None:
+        engine = Engine([BasicStrategy()], CompactDeck(seed=3))
+        blackjacks = 0
+        for _ in range(2000):
+            result = engine.play_round()
+            for hand, seat in zip(engine.hands, result.seats):
+                if hand.blackjack and len(hand) == 2:
+                    blackjacks += 1
+                    # BlackJack stood: it's paid 3 bets by settle, or draws with Dealer's BlackJack
+                    self.assertIn(seat.outcome, (BLACKJACK, DRAW))
+                    self.assertEqual(seat.payout, (3 if seat.outcome == BLACKJACK else 1) * hand.bet)
+        self.assertGreater(blackjacks, 0)
+
+    def test_advisor_does_not_see_closed_card(self) -> None:
+        engine = Engine([BasicStrategy()], CompactDeck(seed=5))
+        advisor = AdvisorStrategy(engine)
+        self.assertEqual(advisor.counts(), engine.deck.value_counts())
+        engine.deal([10])
+        counts, left = advisor.counts(), engine.deck.value_counts()
+        # Dealer's closed card is counted as one more card left in deck
+        self.assertEqual(sum(counts), sum(left) + 1)
+        self.assertEqual([a - b for a, b in zip(counts, left)].index(1) + 2, Hand.card_value(engine.dealer[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()